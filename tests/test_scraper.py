@@ -1,130 +1,373 @@
-import unittest
+import asyncio
+import json
 import os
+import sqlite3
 import sys
-import json
-from unittest.mock import patch, MagicMock
-from pathlib import Path
+import time
+
+import pytest
+import responses
 
 # Add parent directory to path to import web_scraper
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
 from web_scraper.core.scraper import Scraper
-from web_scraper.core.robots_parser import RobotsParser
+from web_scraper.core.robots_parser import RobotsParser, CompiledRobotFileParser
+from web_scraper.core.rate_limiter import RateLimiter, AdaptiveConcurrencyLimiter
 from web_scraper.parsers.html_parser import HTMLParser
+from web_scraper.parsers.fast_html_parser import FastHTMLParser
+from web_scraper.database.data_processor import DataProcessor
+
+
+# Sample HTML content for testing
+TEST_HTML = """
+<!DOCTYPE html>
+<html>
+<head>
+    <title>Test Page</title>
+    <meta name="description" content="A test page for unit testing">
+</head>
+<body>
+    <h1>Test Page Heading</h1>
+    <p>This is a test paragraph with some <a href="https://example.com">link text</a>.</p>
+    <ul>
+        <li>Item 1</li>
+        <li>Item 2</li>
+    </ul>
+    <table>
+        <tr>
+            <th>Header 1</th>
+            <th>Header 2</th>
+        </tr>
+        <tr>
+            <td>Data 1</td>
+            <td>Data 2</td>
+        </tr>
+    </table>
+</body>
+</html>
+"""
+
+
+# Sample robots.txt content
+ROBOTS_TXT = """
+User-agent: *
+Disallow: /private/
+Allow: /public/
+
+User-agent: BadBot
+Disallow: /
+
+Crawl-delay: 2
+"""
+
+# TEST_HTML parsed once, for tests that only read from the tree
+SOUP = HTMLParser().parse(TEST_HTML)
+
+
+@pytest.fixture(scope="module")
+def scraper():
+    """Scraper shared by the tests in this module"""
+    scraper = Scraper(rate_limit=0.01, respect_robots_txt=False)
+    yield scraper
+    scraper.close()
+
+
+@pytest.fixture(scope="module")
+def html_parser():
+    """HTMLParser shared by the tests in this module"""
+    return HTMLParser()
+
+
+@responses.activate
+def test_get_request(scraper):
+    """Test the get method of the Scraper class"""
+    responses.add(responses.GET, "https://example.com", body=TEST_HTML, status=200)
+
+    response = scraper.get("https://example.com")
+
+    assert response.text == TEST_HTML
+    assert len(responses.calls) == 1
+
+
+@responses.activate
+def test_get_request_too_large():
+    """Test that the Scraper refuses bodies larger than max_bytes"""
+    responses.add(responses.GET, "https://example.com", body=TEST_HTML, status=200)
+    small_scraper = Scraper(rate_limit=0.01, respect_robots_txt=False, max_bytes=100)
+
+    with pytest.raises(ValueError):
+        small_scraper.get("https://example.com")
+
+    small_scraper.close()
+
+
+@responses.activate
+def test_robots_parser(tmp_path):
+    """Test the RobotsParser class"""
+    responses.add(responses.GET, "https://example.com/robots.txt", body=ROBOTS_TXT, status=200)
+
+    robots_parser = RobotsParser(cache_dir=str(tmp_path))
+
+    assert robots_parser.can_fetch("https://example.com/public/page.html")
+    assert not robots_parser.can_fetch("https://example.com/private/page.html")
+
+
+@responses.activate
+def test_robots_parser_revalidates_cache(tmp_path):
+    """Test that a stale on-disk robots.txt is revalidated with its ETag"""
+    responses.add(responses.GET, "https://example.com/robots.txt", body=ROBOTS_TXT,
+                  status=200, headers={'ETag': '"v1"'})
+    RobotsParser(cache_dir=str(tmp_path), ttl=0).can_fetch("https://example.com/public/page.html")
+
+    responses.replace(responses.GET, "https://example.com/robots.txt", status=304)
+    robots_parser = RobotsParser(cache_dir=str(tmp_path), ttl=0)
+
+    assert not robots_parser.can_fetch("https://example.com/private/page.html")
+    assert responses.calls[-1].request.headers['If-None-Match'] == '"v1"'
+
+
+@responses.activate
+def test_robots_parser_keeps_cache_entry_age(tmp_path):
+    """Test that a robots.txt loaded from the disk cache expires with the cached entry"""
+    responses.add(responses.GET, "https://example.com/robots.txt", status=404)
+    RobotsParser(cache_dir=str(tmp_path), ttl=3600).can_fetch("https://example.com/page.html")
+
+    # Age the cached entry to a second before it expires
+    cache_file = next(tmp_path.glob("*.json"))
+    entry = json.loads(cache_file.read_text())
+    entry['fetched_at'] -= 3599
+    cache_file.write_text(json.dumps(entry))
+
+    robots_parser = RobotsParser(cache_dir=str(tmp_path), ttl=3600)
+    robots_parser.can_fetch("https://example.com/page.html")
+
+    assert len(responses.calls) == 1
+    assert time.monotonic() - robots_parser.fetched_at["https://example.com"] >= 3599
+    assert robots_parser.allow_all_until["https://example.com"] - time.monotonic() <= 1
+
+
+def test_compiled_robot_file_parser():
+    """Test longest-match and wildcard rules in CompiledRobotFileParser"""
+    parser = CompiledRobotFileParser()
+    parser.parse(ROBOTS_TXT.replace("Allow: /public/", "Allow: /private/ok\nDisallow: /*.pdf$").splitlines())
+
+    assert not parser.can_fetch("Mozilla/5.0", "https://example.com/private/page.html")
+    assert parser.can_fetch("Mozilla/5.0", "https://example.com/private/ok.html")
+    assert not parser.can_fetch("Mozilla/5.0", "https://example.com/docs/file.pdf")
+    assert parser.can_fetch("Mozilla/5.0", "https://example.com/docs/file.pdf.html")
+    assert not parser.can_fetch("BadBot/1.0", "https://example.com/public/page.html")
+
+
+def test_rate_limiter_wait_async():
+    """Test that concurrent wait_async calls for one domain are spaced out"""
+    rate_limiter = RateLimiter(default_delay=0.05, jitter=0)
+
+    async def fire():
+        await rate_limiter.wait_async("example.com")
+        return time.monotonic()
+
+    async def main():
+        return await asyncio.gather(*(fire() for _ in range(4)))
+
+    times = sorted(asyncio.run(main()))
+
+    assert all(later - earlier >= 0.045 for earlier, later in zip(times, times[1:]))
+
+
+def test_async_scraper_retries_overloaded_response():
+    """Test that AsyncScraper retries a 503 response and returns the next one"""
+    web = pytest.importorskip("aiohttp.web")
+    from web_scraper.core.async_scraper import AsyncScraper
+
+    statuses = [503, 200]
+
+    async def handler(request):
+        return web.Response(text=TEST_HTML, status=statuses.pop(0))
+
+    async def main():
+        app = web.Application()
+        app.router.add_get("/", handler)
+        runner = web.AppRunner(app)
+        await runner.setup()
+        site = web.TCPSite(runner, "127.0.0.1", 0)
+        await site.start()
+        port = runner.addresses[0][1]
+        try:
+            async with AsyncScraper(rate_limit=0.01, respect_robots_txt=False,
+                                    use_fake_useragent=False) as async_scraper:
+                response = await async_scraper.get(f"http://127.0.0.1:{port}/")
+                return response.status, await response.text()
+        finally:
+            await runner.cleanup()
+
+    status, text = asyncio.run(main())
+
+    assert status == 200
+    assert text == TEST_HTML
+    assert statuses == []
+
+
+def test_adaptive_concurrency_limiter():
+    """Test that the concurrency limit grows on fast responses and halves on overload"""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=2, max_limit=8)
+
+    async def request(latency, overloaded=False):
+        await limiter.acquire("example.com")
+        await limiter.release("example.com", latency, overloaded)
+
+    async def main():
+        for _ in range(10):
+            await request(0.1)
+        grown = limiter.get_limit("example.com")
+        await request(0.1, overloaded=True)
+        return grown, limiter.get_limit("example.com")
+
+    grown, reduced = asyncio.run(main())
+
+    assert grown == 8
+    assert reduced == 4
+
+
+def test_html_parser_extract_text(html_parser):
+    """Test the extract_text method of HTMLParser"""
+    text = html_parser.extract_text(TEST_HTML)
+
+    assert "Test Page Heading" in text
+    assert "This is a test paragraph" in text
+
+
+def test_html_parser_extract_links(html_parser):
+    """Test the extract_links method of HTMLParser"""
+    links = html_parser.extract_links(TEST_HTML, "https://example.com")
+
+    assert len(links) == 1
+    assert links[0]['text'] == "link text"
+    assert links[0]['href'] == "https://example.com"
+
+
+def test_html_parser_extract_links_streaming(html_parser):
+    """Test the extract_links_streaming method of HTMLParser"""
+    links = list(html_parser.extract_links_streaming(TEST_HTML, "https://example.com"))
+
+    assert links == html_parser.extract_links(TEST_HTML, "https://example.com")
+
+
+def test_html_parser_extract_table(html_parser):
+    """Test the extract_table method of HTMLParser"""
+    tables = html_parser.extract_table(TEST_HTML)
+
+    assert len(tables) == 1
+    assert tables[0]['Header 1'] == "Data 1"
+    assert tables[0]['Header 2'] == "Data 2"
+
+
+def test_html_parser_extract_metadata(html_parser):
+    """Test the extract_metadata method of HTMLParser"""
+    metadata = html_parser.extract_metadata(TEST_HTML)
+
+    assert metadata['title'] == "Test Page"
+    assert metadata['description'] == "A test page for unit testing"
+
+
+def test_html_parser_extract_from_soup(html_parser):
+    """Test that the *_from_soup methods match the string-based API"""
+    assert html_parser.extract_text_from_soup(SOUP) == html_parser.extract_text(TEST_HTML)
+    assert (html_parser.extract_links_from_soup(SOUP, "https://example.com") ==
+            html_parser.extract_links(TEST_HTML, "https://example.com"))
+    assert html_parser.extract_metadata_from_soup(SOUP) == html_parser.extract_metadata(TEST_HTML)
+    assert html_parser.extract_title_from_soup(SOUP) == "Test Page"
+
+
+def test_fast_html_parser_matches_html_parser(html_parser):
+    """Test that FastHTMLParser extracts the same data as HTMLParser"""
+    fast_parser = FastHTMLParser()
+
+    assert fast_parser.extract_text(TEST_HTML) == html_parser.extract_text(TEST_HTML)
+    assert (fast_parser.extract_links(TEST_HTML, "https://example.com") ==
+            html_parser.extract_links(TEST_HTML, "https://example.com"))
+    assert fast_parser.extract_metadata(TEST_HTML) == html_parser.extract_metadata(TEST_HTML)
+
+
+def test_fast_html_parser_comment_only_page(html_parser):
+    """Test that FastHTMLParser treats a page holding only a comment as empty"""
+    fast_parser = FastHTMLParser()
+
+    assert fast_parser.extract_text("<!-- x -->") == html_parser.extract_text("<!-- x -->") == ""
+
+
+def test_data_processor_clean_data(tmp_path):
+    """Test that clean_data drops duplicates and fills missing fields"""
+    data_processor = DataProcessor(output_dir=str(tmp_path))
+    records = [
+        {'url': "https://example.com/1", 'links': ["a"]},
+        {'url': "https://example.com/1", 'links': ["b"]},
+        {'url': "https://example.com/2", 'title': "Two"},
+    ]
+
+    cleaned = data_processor.clean_data(records)
+
+    assert cleaned == [
+        {'url': "https://example.com/1", 'links': ["a"], 'title': ""},
+        {'url': "https://example.com/2", 'links': "", 'title': "Two"},
+    ]
+
+
+def test_data_processor_save_to_sqlite(tmp_path):
+    """Test that save_to_sqlite inserts all records, storing lists as JSON"""
+    data_processor = DataProcessor(output_dir=str(tmp_path))
+    records = [{'url': "https://example.com/1", 'links': ["a", "b"]}, {'url': "https://example.com/2"}]
+
+    db_path = data_processor.save_to_sqlite(records, "results", "pages")
+
+    with sqlite3.connect(db_path) as conn:
+        rows = conn.execute("SELECT url, links FROM pages").fetchall()
+    assert rows == [("https://example.com/1", '["a", "b"]'), ("https://example.com/2", None)]
+
+
+def test_data_processor_open_writer(tmp_path):
+    """Test that open_writer streams records to a JSON Lines file"""
+    data_processor = DataProcessor(output_dir=str(tmp_path))
+    records = [{'url': "https://example.com/1", 'text': "one"},
+               {'url': "https://example.com/2", 'text': "two"}]
+
+    with data_processor.open_writer("results", "json", batch_size=1) as writer:
+        for record in records + records[:1]:
+            writer.write(record)
+
+    assert writer.count == 2
+    lines = (tmp_path / "results.jsonl").read_text(encoding="utf-8").splitlines()
+    assert [json.loads(line) for line in lines] == records
+
+
+def test_data_processor_open_writer_csv_new_fields(tmp_path):
+    """Test that the CSV writer keeps fields that first appear after the first batch"""
+    data_processor = DataProcessor(output_dir=str(tmp_path))
+    records = [{'url': "https://example.com/1", 'text': "one"},
+               {'url': "https://example.com/2", 'title': "Two"}]
+
+    with data_processor.open_writer("results", "csv", batch_size=1) as writer:
+        for record in records:
+            writer.write(record)
+
+    streamed = (tmp_path / "results.csv").read_text(encoding="utf-8")
+    saved = open(data_processor.save_to_csv(records, "saved"), encoding="utf-8").read()
+    assert streamed.splitlines()[0] == "text,title,url"
+    assert streamed == saved
+
+
+def test_iom_dtm_parser_date_from_metadata(tmp_path, monkeypatch):
+    """Test that displacement pages without a date in their text take it from the meta tags"""
+    iom_dtm_parser = pytest.importorskip("web_scraper.parsers.custom_parsers.iom_dtm_parser")
+    monkeypatch.chdir(tmp_path)
+    html = """
+    <html><head>
+        <meta name="publication-date" content="2023-03-01">
+        <meta property="og:title" content="Sudan displacement">
+    </head><body><p>No date here.</p></body></html>
+    """
 
+    result = iom_dtm_parser.IOMDTMParser().parse(html, "https://dtm.iom.int/displacement/sudan")
 
-class MockResponse:
-    """Mock response class for testing"""
-    def __init__(self, text, status_code=200):
-        self.text = text
-        self.status_code = status_code
-        self.ok = status_code < 400
-    
-    def raise_for_status(self):
-        if not self.ok:
-            raise Exception(f"HTTP Error: {self.status_code}")
-
-
-class TestScraper(unittest.TestCase):
-
-    def setUp(self):
-        """Set up test fixtures"""
-        self.scraper = Scraper(rate_limit=0.01, respect_robots_txt=False)
-        self.html_parser = HTMLParser()
-        
-        # Sample HTML content for testing
-        self.test_html = """
-        <!DOCTYPE html>
-        <html>
-        <head>
-            <title>Test Page</title>
-            <meta name="description" content="A test page for unit testing">
-        </head>
-        <body>
-            <h1>Test Page Heading</h1>
-            <p>This is a test paragraph with some <a href="https://example.com">link text</a>.</p>
-            <ul>
-                <li>Item 1</li>
-                <li>Item 2</li>
-            </ul>
-            <table>
-                <tr>
-                    <th>Header 1</th>
-                    <th>Header 2</th>
-                </tr>
-                <tr>
-                    <td>Data 1</td>
-                    <td>Data 2</td>
-                </tr>
-            </table>
-        </body>
-        </html>
-        """
-        
-        # Sample robots.txt content
-        self.robots_txt = """
-        User-agent: *
-        Disallow: /private/
-        Allow: /public/
-        
-        User-agent: BadBot
-        Disallow: /
-        
-        Crawl-delay: 2
-        """
-
-    @patch('requests.Session.get')
-    def test_get_request(self, mock_get):
-        """Test the get method of the Scraper class"""
-        mock_get.return_value = MockResponse(self.test_html)
-        
-        response = self.scraper.get("https://example.com")
-        
-        self.assertEqual(response.text, self.test_html)
-        mock_get.assert_called_once()
-        
-    @patch('urllib.robotparser.RobotFileParser.can_fetch')
-    @patch('requests.get')
-    def test_robots_parser(self, mock_get, mock_can_fetch):
-        """Test the RobotsParser class"""
-        mock_get.return_value = MockResponse(self.robots_txt)
-        mock_can_fetch.return_value = True
-        
-        robots_parser = RobotsParser()
-        result = robots_parser.can_fetch("https://example.com/public/page.html")
-        
-        self.assertTrue(result)
-        
-    def test_html_parser_extract_text(self):
-        """Test the extract_text method of HTMLParser"""
-        text = self.html_parser.extract_text(self.test_html)
-        
-        self.assertIn("Test Page Heading", text)
-        self.assertIn("This is a test paragraph", text)
-        
-    def test_html_parser_extract_links(self):
-        """Test the extract_links method of HTMLParser"""
-        links = self.html_parser.extract_links(self.test_html, "https://example.com")
-        
-        self.assertEqual(len(links), 1)
-        self.assertEqual(links[0]['text'], "link text")
-        self.assertEqual(links[0]['href'], "https://example.com")
-        
-    def test_html_parser_extract_table(self):
-        """Test the extract_table method of HTMLParser"""
-        tables = self.html_parser.extract_table(self.test_html)
-        
-        self.assertEqual(len(tables), 1)
-        self.assertEqual(tables[0]['Header 1'], "Data 1")
-        self.assertEqual(tables[0]['Header 2'], "Data 2")
-        
-    def test_html_parser_extract_metadata(self):
-        """Test the extract_metadata method of HTMLParser"""
-        metadata = self.html_parser.extract_metadata(self.test_html)
-        
-        self.assertEqual(metadata['title'], "Test Page")
-        self.assertEqual(metadata['description'], "A test page for unit testing")
-
-
-if __name__ == "__main__":
-    unittest.main() 
\ No newline at end of file
+    assert result['metadata'] == {'publication-date': "2023-03-01", 'og:title': "Sudan displacement"}
+    assert result['displacement_data']['date'] == "2023-03-01"
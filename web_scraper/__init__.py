@@ -0,0 +1,4 @@
+import logging
+
+# Library users who don't configure logging get no output (and no formatting cost)
+logging.getLogger(__name__).addHandler(logging.NullHandler())
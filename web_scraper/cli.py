@@ -1,19 +1,59 @@
 #!/usr/bin/env python3
 import argparse
+import asyncio
+import atexit
+import contextlib
+import functools
+import itertools
 import logging
+import logging.handlers
+import queue
 import sys
 import os
 import json
-from typing import Dict, List, Any, Optional
+from typing import Dict, List, Any, Optional, Iterator, Callable
 import importlib.util
+import inspect
+from pathlib import Path
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
 
 from web_scraper.core.scraper import Scraper
+from web_scraper.core.async_scraper import AsyncScraper
 from web_scraper.parsers.html_parser import HTMLParser
+from web_scraper.parsers.fast_html_parser import FastHTMLParser
 from web_scraper.parsers.js_parser import JSParser
 from web_scraper.database.data_processor import DataProcessor
 from web_scraper.scheduler.cron_scheduler import CronScheduler
 from web_scraper.utils.parallel_processor import ParallelProcessor
 
+logger = logging.getLogger(__name__)
+
+# Per-URL messages are logged at DEBUG; INFO gets a progress line every N URLs
+PROGRESS_LOG_INTERVAL = 100
+
+# Output format -> (DataProcessor save method, default output file name)
+SAVERS = {
+    'json': (DataProcessor.save_to_json, 'scraped_data.json'),
+    'csv': (DataProcessor.save_to_csv, 'scraped_data.csv'),
+    'sqlite': (DataProcessor.save_to_sqlite, 'scraped_data.db'),
+}
+
+# Bits of the extraction flag mask computed by extraction_flags()
+EXTRACT_TEXT = 1
+EXTRACT_LINKS = 1 << 1
+EXTRACT_TABLES = 1 << 2
+EXTRACT_METADATA = 1 << 3
+EXTRACT_ALL = 1 << 4
+
 
 def setup_logging(verbose: bool = False):
     """Set up logging configuration."""
@@ -33,11 +73,51 @@ def setup_logging(verbose: bool = False):
     file_handler = logging.FileHandler('scraper.log')
     file_handler.setFormatter(formatter)
     
+    # Write records from a background thread so workers never block on log I/O
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, console_handler, file_handler)
+    listener.start()
+    atexit.register(listener.stop)
+    
     # Configure root logger
     root_logger = logging.getLogger()
     root_logger.setLevel(level)
-    root_logger.addHandler(console_handler)
-    root_logger.addHandler(file_handler)
+    root_logger.addHandler(logging.handlers.QueueHandler(log_queue))
+
+
+def log_url_progress(progress: Iterator[int], url: str) -> None:
+    """
+    Log that a URL is being processed without flooding the INFO log.
+    
+    Args:
+        progress: Counter shared by the scraping loop (e.g. itertools.count(1))
+        url: The URL being processed
+    """
+    count = next(progress)
+    logger.debug("Processing URL: %s", url)
+    if count % PROGRESS_LOG_INTERVAL == 0:
+        logger.info("Processing URL #%d: %s", count, url)
+
+
+@functools.lru_cache(maxsize=32)
+def _read_config(config_file: str, mtime: float) -> Dict[str, Any]:
+    """
+    Read and parse a JSON configuration file.
+    
+    Cached on (path, modification time), so an edited file is parsed again.
+    
+    Args:
+        config_file: Absolute path to the configuration file
+        mtime: Modification time of the file, used as part of the cache key
+        
+    Returns:
+        The configuration as a dictionary
+    """
+    if orjson is not None:
+        return orjson.loads(Path(config_file).read_bytes())
+        
+    with open(config_file, 'r') as f:
+        return json.load(f)
 
 
 def load_config(config_file: str) -> Dict[str, Any]:
@@ -51,15 +131,35 @@ def load_config(config_file: str) -> Dict[str, Any]:
         The configuration as a dictionary
     """
     try:
-        with open(config_file, 'r') as f:
-            config = json.load(f)
-        logging.info(f"Loaded configuration from {config_file}")
+        config = _read_config(os.path.abspath(config_file), os.path.getmtime(config_file))
+        logger.info(f"Loaded configuration from {config_file}")
         return config
     except Exception as e:
-        logging.error(f"Error loading configuration: {str(e)}")
+        logger.error(f"Error loading configuration: {str(e)}")
         sys.exit(1)
 
 
+@functools.lru_cache(maxsize=32)
+def _load_module(parser_file: str, mtime: float) -> Any:
+    """
+    Import a Python file as a module.
+    
+    Cached on (path, modification time), so an edited file is imported again.
+    
+    Args:
+        parser_file: Absolute path to the Python file
+        mtime: Modification time of the file, used as part of the cache key
+        
+    Returns:
+        The loaded module
+    """
+    module_name = os.path.basename(parser_file).replace('.py', '')
+    spec = importlib.util.spec_from_file_location(module_name, parser_file)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
 def load_custom_parser(parser_file: str) -> Any:
     """
     Load a custom parser module.
@@ -71,21 +171,16 @@ def load_custom_parser(parser_file: str) -> Any:
         The parser class or function
     """
     try:
-        module_name = os.path.basename(parser_file).replace('.py', '')
-        spec = importlib.util.spec_from_file_location(module_name, parser_file)
-        module = importlib.util.module_from_spec(spec)
-        spec.loader.exec_module(module)
+        module = _load_module(os.path.abspath(parser_file), os.path.getmtime(parser_file))
         
         # Look for a class named "Parser" or a function named "parse"
-        if hasattr(module, 'Parser'):
-            return module.Parser
-        elif hasattr(module, 'parse'):
-            return module.parse
-        else:
-            logging.error(f"No Parser class or parse function found in {parser_file}")
+        parser = getattr(module, 'Parser', None) or getattr(module, 'parse', None)
+        if parser is None:
+            logger.error(f"No Parser class or parse function found in {parser_file}")
             sys.exit(1)
+        return parser
     except Exception as e:
-        logging.error(f"Error loading custom parser: {str(e)}")
+        logger.error(f"Error loading custom parser: {str(e)}")
         sys.exit(1)
 
 
@@ -110,30 +205,70 @@ def run_scraper(args):
             max_workers=args.max_workers,
             timeout=args.timeout
         )
-        url_list = parallel_processor.read_urls_from_file(args.url_file)
+        # Stream the URLs so scraping starts before the whole file is read
+        url_list = parallel_processor.iter_urls_from_file(args.url_file)
     # Otherwise use URLs from command line or config
     else:
         url_list = args.url or config.get('urls', [])
         if isinstance(url_list, str):
             url_list = [url_list]
+            
+    # Skip repeated URLs (keeping the first occurrence) and count URLs as they
+    # are consumed, since a stream has no length
+    url_count = 0
+    duplicate_count = 0
+    
+    def unique_urls(urls):
+        nonlocal url_count, duplicate_count
+        seen = set()
+        for url in urls:
+            if url in seen:
+                duplicate_count += 1
+                continue
+            seen.add(url)
+            url_count += 1
+            yield url
+            
+    url_list = unique_urls(url_list)
         
     output_dir = args.output_dir or config.get('output_dir', './data')
-    output_format = args.output_format or config.get('output_format', 'json')
+    output_format = (args.output_format or config.get('output_format', 'json')).lower()
     rate_limit = args.rate_limit or config.get('rate_limit', 1.0)
     respect_robots = not args.ignore_robots and config.get('respect_robots_txt', True)
     use_selenium = args.selenium or config.get('use_selenium', False)
     max_retries = args.max_retries or config.get('max_retries', 3)
     verify_ssl = not args.no_verify_ssl
     
+    # The format can come from the config file, so check it before any scraping
+    # starts; the streamed and the collected outputs support the same formats
+    if output_format not in SAVERS:
+        logger.error(f"Unsupported output format: {output_format}")
+        sys.exit(1)
+        
+    # Fetch with asyncio unless pages have to be rendered with Selenium
+    use_async = args.use_async and not use_selenium
+    
     # Initialize scraper and parsers
-    scraper = Scraper(
-        rate_limit=rate_limit,
-        respect_robots_txt=respect_robots,
-        max_retries=max_retries,
-        verify_ssl=verify_ssl
-    )
+    scraper_options = {
+        'rate_limit': rate_limit,
+        'respect_robots_txt': respect_robots,
+        'max_retries': max_retries,
+        'verify_ssl': verify_ssl
+    }
+    if use_async:
+        try:
+            scraper = AsyncScraper(
+                concurrency=args.max_workers * 20,
+                timeout=args.timeout,
+                **scraper_options
+            )
+        except ImportError as e:
+            logger.error(f"The --async mode requires aiohttp: {str(e)}")
+            sys.exit(1)
+    else:
+        scraper = Scraper(pool_size=args.max_workers, **scraper_options)
     
-    html_parser = HTMLParser()
+    html_parser = FastHTMLParser() if args.fast else HTMLParser()
     
     # Initialize Selenium parser if needed
     js_parser = None
@@ -148,55 +283,76 @@ def run_scraper(args):
     if args.custom_parser:
         custom_parser = load_custom_parser(args.custom_parser)
     
-    # If using parallel processing
-    if args.parallel:
-        results = run_parallel_scraper(
-            url_list, 
-            scraper, 
-            html_parser, 
-            js_parser, 
-            custom_parser, 
-            args,
-            max_workers=args.max_workers,
-            batch_delay=args.batch_delay
-        )
-    else:
-        results = run_sequential_scraper(
-            url_list, 
-            scraper, 
-            html_parser, 
-            js_parser, 
-            custom_parser, 
-            args
+    # With --stream-output, results are written as they are scraped instead of
+    # being collected in memory and saved at the end
+    writer_context = contextlib.nullcontext()
+    if args.stream_output:
+        writer_context = data_processor.open_writer(
+            args.output_file or 'scraped_data',
+            output_format,
+            table_name=args.table_name or 'scraped_data'
         )
     
-    # Clean and process the data
-    cleaned_results = data_processor.clean_data(
-        results,
-        remove_duplicates=True,
-        fill_missing=True
-    )
-    
-    # Save the results
-    if output_format.lower() == 'json':
-        output_file = args.output_file or 'scraped_data.json'
-        data_processor.save_to_json(cleaned_results, output_file)
-    elif output_format.lower() == 'csv':
-        output_file = args.output_file or 'scraped_data.csv'
-        data_processor.save_to_csv(cleaned_results, output_file)
-    elif output_format.lower() == 'sqlite':
-        output_file = args.output_file or 'scraped_data.db'
-        table_name = args.table_name or 'scraped_data'
-        data_processor.save_to_sqlite(cleaned_results, output_file, table_name)
+    with writer_context as writer:
+        # If using asyncio-based fetching (Selenium rendering is not supported here)
+        if use_async:
+            results = run_async_scraper(
+                url_list,
+                scraper,
+                html_parser,
+                custom_parser,
+                args,
+                writer=writer
+            )
+        # If using parallel processing
+        elif args.parallel:
+            results = run_parallel_scraper(
+                url_list, 
+                scraper, 
+                html_parser, 
+                js_parser, 
+                custom_parser, 
+                args,
+                max_workers=args.max_workers,
+                batch_delay=args.batch_delay,
+                writer=writer
+            )
+        else:
+            results = run_sequential_scraper(
+                url_list, 
+                scraper, 
+                html_parser, 
+                js_parser, 
+                custom_parser, 
+                args,
+                writer=writer
+            )
+    
+    if writer is not None:
+        result_count = writer.count
     else:
-        logging.error(f"Unsupported output format: {output_format}")
+        # Clean and process the data
+        cleaned_results = data_processor.clean_data(
+            results,
+            remove_duplicates=True,
+            fill_missing=True
+        )
+        result_count = len(cleaned_results)
+        
+        # Save the results
+        save, default_file = SAVERS[output_format]
+        extra_args = (args.table_name or 'scraped_data',) if output_format == 'sqlite' else ()
+        save(data_processor, cleaned_results, args.output_file or default_file, *extra_args)
         
-    # Clean up resources
-    scraper.close()
+    # Clean up resources (the async scraper closes its session when the crawl ends)
+    if not use_async:
+        scraper.close()
     if js_parser:
         js_parser.close()
         
-    logging.info(f"Scraping completed. Processed {len(url_list)} URLs, extracted {len(cleaned_results)} results.")
+    if duplicate_count:
+        logger.info(f"Skipped {duplicate_count} duplicate URLs")
+    logger.info(f"Scraping completed. Processed {url_count} URLs, extracted {result_count} results.")
 
 
 def schedule_scraper(args):
@@ -208,26 +364,26 @@ def schedule_scraper(args):
     """
     scheduler = CronScheduler()
     
-    # Build the command to run the scraper
-    command_args = []
-    command_args.append(sys.executable)
-    command_args.append(os.path.abspath(__file__))
-    command_args.append("run")
+    # Build the command to run the scraper as an argument list, so values with
+    # spaces or shell metacharacters survive; the scheduler quotes it for cron
+    command_args = [sys.executable, os.path.abspath(__file__), "run"]
     
     # Add all the original arguments except 'schedule' and 'command'
     if args.config:
-        command_args.append(f"--config={args.config}")
+        command_args.extend(["--config", args.config])
     if args.url:
         for url in args.url:
-            command_args.append(f"--url={url}")
+            command_args.extend(["--url", url])
     if args.output_dir:
-        command_args.append(f"--output-dir={args.output_dir}")
+        command_args.extend(["--output-dir", args.output_dir])
     if args.output_file:
-        command_args.append(f"--output-file={args.output_file}")
+        command_args.extend(["--output-file", args.output_file])
     if args.output_format:
-        command_args.append(f"--output-format={args.output_format}")
+        command_args.extend(["--output-format", args.output_format])
+    if args.stream_output:
+        command_args.append("--stream-output")
     if args.rate_limit:
-        command_args.append(f"--rate-limit={args.rate_limit}")
+        command_args.extend(["--rate-limit", str(args.rate_limit)])
     if args.ignore_robots:
         command_args.append("--ignore-robots")
     if args.selenium:
@@ -235,9 +391,9 @@ def schedule_scraper(args):
     if args.no_headless:
         command_args.append("--no-headless")
     if args.max_retries:
-        command_args.append(f"--max-retries={args.max_retries}")
+        command_args.extend(["--max-retries", str(args.max_retries)])
     if args.custom_parser:
-        command_args.append(f"--custom-parser={args.custom_parser}")
+        command_args.extend(["--custom-parser", args.custom_parser])
     if args.extract_text:
         command_args.append("--extract-text")
     if args.extract_links:
@@ -247,201 +403,315 @@ def schedule_scraper(args):
     if args.extract_metadata:
         command_args.append("--extract-metadata")
     if args.selector:
-        command_args.append(f"--selector={args.selector}")
+        command_args.extend(["--selector", args.selector])
+    if args.fast:
+        command_args.append("--fast")
+    if args.use_async:
+        command_args.append("--async")
     if args.fail_fast:
         command_args.append("--fail-fast")
     if args.verbose:
         command_args.append("--verbose")
     
-    # Join the command
-    command = " ".join(command_args)
-    
     # Schedule the job
-    if scheduler.create_scraper_job(args.schedule, command, job_name=args.job_name):
-        logging.info(f"Scraper scheduled with cron expression: {args.schedule}")
+    if scheduler.create_scraper_job(args.schedule, command_args, job_name=args.job_name):
+        logger.info(f"Scraper scheduled with cron expression: {args.schedule}")
     else:
-        logging.error("Failed to schedule scraper")
+        logger.error("Failed to schedule scraper")
         sys.exit(1)
 
 
+def extraction_flags(args) -> int:
+    """
+    Pack the content extraction options into a bitmask.
+    
+    Args:
+        args: Command-line arguments
+        
+    Returns:
+        An int combining the EXTRACT_* bits of the requested extractors
+    """
+    return (bool(args.extract_text) * EXTRACT_TEXT
+            | bool(args.extract_links) * EXTRACT_LINKS
+            | bool(args.extract_tables) * EXTRACT_TABLES
+            | bool(args.extract_metadata) * EXTRACT_METADATA
+            | bool(args.extract_all) * EXTRACT_ALL)
+
+
+def build_extraction_plan(html_parser, custom_parser, args) -> Callable[[str, str], Dict[str, Any]]:
+    """
+    Decide once, before the scraping loop, which extractors to run on each page.
+    
+    The command-line flags are constant for the whole run, so the branching on
+    them is resolved here and the returned function only does the extraction.
+    
+    Args:
+        html_parser: HTMLParser or FastHTMLParser instance
+        custom_parser: Custom parser (class or function) or None
+        args: Command-line arguments
+        
+    Returns:
+        A function taking (html_content, url) and returning the extracted data
+    """
+    selector = args.selector
+    flags = extraction_flags(args)
+    
+    # Apply custom parser if provided
+    if custom_parser:
+        # A Parser class is instantiated once and its parse method reused
+        parse_page = custom_parser().parse if inspect.isclass(custom_parser) else custom_parser
+        
+        def extract_custom(html_content, url):
+            parsed_data = parse_page(html_content, url)
+            if 'url' not in parsed_data:
+                parsed_data['url'] = url
+            return parsed_data
+            
+        return extract_custom
+    
+    # Use comprehensive extraction if requested
+    if flags & EXTRACT_ALL:
+        def extract_all(html_content, url):
+            # FastHTMLParser hands the raw HTML to HTMLParser for this, so don't
+            # parse it here first
+            parsed_data = html_parser.extract_all_data(html_content)
+            # Always add URL
+            parsed_data['url'] = url
+            return parsed_data
+            
+        return extract_all
+    
+    # If no specific extraction was requested, extract everything
+    if not flags:
+        def extract_default(html_content, url):
+            soup = html_parser.parse(html_content)
+            return {
+                'url': url,
+                'title': html_parser.extract_title_from_soup(soup),
+                'text': html_parser.extract_text_from_soup(soup),
+                'links': html_parser.extract_links_from_soup(soup, url),
+                'metadata': html_parser.extract_metadata_from_soup(soup)
+            }
+            
+        return extract_default
+    
+    # Links are the only thing requested, so stream them instead of building the tree
+    if flags == EXTRACT_LINKS:
+        def extract_links(html_content, url):
+            return {
+                'links': list(html_parser.extract_links_streaming(html_content, url)),
+                'url': url
+            }
+            
+        return extract_links
+    
+    # Otherwise run the requested extractors on a single parse of the page
+    extractors = []
+    if flags & EXTRACT_TEXT:
+        extractors.append(('text', lambda soup, url: html_parser.extract_text_from_soup(soup, selector)))
+    if flags & EXTRACT_LINKS:
+        extractors.append(('links', lambda soup, url: html_parser.extract_links_from_soup(soup, url)))
+    if flags & EXTRACT_TABLES:
+        extractors.append(('tables', lambda soup, url: html_parser.extract_table_from_soup(soup, selector)))
+    if flags & EXTRACT_METADATA:
+        extractors.append(('metadata', lambda soup, url: html_parser.extract_metadata_from_soup(soup)))
+    
+    def extract_selected(html_content, url):
+        # Parse the HTML once and share the tree between extractors
+        soup = html_parser.parse(html_content)
+        parsed_data = {key: extractor(soup, url) for key, extractor in extractors}
+        parsed_data['url'] = url
+        return parsed_data
+        
+    return extract_selected
+
+
+def _process_url(url, *, scraper, js_parser, extract, progress):
+    """
+    Fetch and extract a single URL for the parallel scraper.
+    
+    Args:
+        url: The URL to process
+        scraper: Scraper instance
+        js_parser: JSParser instance to render the page with, or None to use HTTP
+        extract: Extraction function returned by build_extraction_plan
+        progress: Counter shared by the workers for progress logging
+        
+    Returns:
+        Dictionary of extracted data, or the URL and error message on failure
+    """
+    log_url_progress(progress, url)
+    
+    try:
+        # Check if we need Selenium
+        if js_parser:
+            logger.debug("Using Selenium to load: %s", url)
+            html_content = js_parser.load_page(url)
+        else:
+            # Use regular HTTP request
+            response = scraper.get(url)
+            html_content = response.text
+        
+        return extract(html_content, url)
+        
+    except Exception as e:
+        logger.error("Error processing URL %s: %s", url, e)
+        return {'url': url, 'error': str(e)}
+
+
 def run_parallel_scraper(url_list, scraper, html_parser, js_parser, custom_parser, args, 
-                         max_workers=5, batch_delay=1.0):
+                         max_workers=5, batch_delay=1.0, writer=None):
     """
     Run the scraper in parallel mode.
     
     Args:
-        url_list: List of URLs to scrape
+        url_list: Iterable of URLs to scrape
         scraper: Scraper instance
-        html_parser: HTMLParser instance
+        html_parser: HTMLParser or FastHTMLParser instance
         js_parser: JSParser instance or None
         custom_parser: Custom parser or None
         args: Command-line arguments
         max_workers: Maximum number of worker threads
         batch_delay: Delay between batches in seconds
+        writer: Optional ResultWriter that receives each result as it completes
+        
+    Returns:
+        List of scraped data (empty if a writer is given)
+    """
+    # Bind the per-run state once; the worker itself is a plain module-level function
+    process_url = functools.partial(
+        _process_url,
+        scraper=scraper,
+        js_parser=js_parser if args.selenium else None,
+        extract=build_extraction_plan(html_parser, custom_parser, args),
+        progress=itertools.count(1)
+    )
+    
+    # Use the ParallelProcessor to process URLs in parallel
+    parallel_processor = ParallelProcessor(max_workers=max_workers)
+    return parallel_processor.process_urls(
+        url_list,
+        process_url,
+        delay_between_batches=batch_delay,
+        on_result=writer.write if writer is not None else None
+    )
+
+
+def run_async_scraper(url_list, scraper, html_parser, custom_parser, args, writer=None):
+    """
+    Run the scraper in asyncio mode, fetching pages concurrently with aiohttp.
+    
+    HTML parsing is CPU-bound, so it is dispatched to the default executor to
+    keep the event loop responsive. The event loop is uvloop's when it is installed.
+    
+    Args:
+        url_list: Iterable of URLs to scrape
+        scraper: AsyncScraper instance; up to scraper.concurrency requests are in flight
+        html_parser: HTMLParser or FastHTMLParser instance
+        custom_parser: Custom parser or None
+        args: Command-line arguments
+        writer: Optional ResultWriter that receives each result as it completes
         
     Returns:
-        List of scraped data
+        List of scraped data (empty if a writer is given)
     """
-    def process_url(url):
-        logging.info(f"Processing URL: {url}")
+    progress = itertools.count(1)
+    extract = build_extraction_plan(html_parser, custom_parser, args)
+    
+    async def fetch_and_parse(url):
+        log_url_progress(progress, url)
         
         try:
-            # Check if we need Selenium
-            if js_parser and args.selenium:
-                logging.info(f"Using Selenium to load: {url}")
-                html_content = js_parser.load_page(url)
-            else:
-                # Use regular HTTP request
-                response = scraper.get(url)
-                html_content = response.text
-            
-            # Parse the content
-            parsed_data = {}
+            response = await scraper.get(url)
+            html_content = await response.text()
             
-            # Apply custom parser if provided
-            if custom_parser:
-                if callable(custom_parser):
-                    parsed_data = custom_parser(html_content, url)
-                else:
-                    parser_instance = custom_parser()
-                    parsed_data = parser_instance.parse(html_content, url)
-            else:
-                # Use comprehensive extraction if requested
-                if args.extract_all:
-                    parsed_data = html_parser.extract_all_data(html_content)
-                    # Always add URL
-                    parsed_data['url'] = url
-                else:
-                    # Use default parsing based on command-line arguments
-                    soup = html_parser.parse(html_content)
-                    
-                    # Extract text if requested
-                    if args.extract_text:
-                        parsed_data['text'] = html_parser.extract_text(html_content, args.selector)
-                    
-                    # Extract links if requested
-                    if args.extract_links:
-                        parsed_data['links'] = html_parser.extract_links(html_content, url)
-                    
-                    # Extract tables if requested
-                    if args.extract_tables:
-                        parsed_data['tables'] = html_parser.extract_table(html_content, args.selector)
-                    
-                    # Extract metadata if requested
-                    if args.extract_metadata:
-                        parsed_data['metadata'] = html_parser.extract_metadata(html_content)
-                    
-                    # If no specific extraction was requested, extract everything
-                    if not any([args.extract_text, args.extract_links, args.extract_tables, args.extract_metadata, args.extract_all]):
-                        parsed_data = {
-                            'url': url,
-                            'title': soup.title.get_text() if soup.title else '',
-                            'text': html_parser.extract_text(html_content),
-                            'links': html_parser.extract_links(html_content, url),
-                            'metadata': html_parser.extract_metadata(html_content)
-                        }
-            
-            # Add the URL to the parsed data
-            if 'url' not in parsed_data:
-                parsed_data['url'] = url
-                
-            return parsed_data
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, extract, html_content, url)
             
         except Exception as e:
-            logging.error(f"Error processing URL {url}: {str(e)}")
+            logger.error("Error processing URL %s: %s", url, e)
             return {'url': url, 'error': str(e)}
     
-    # Use the ParallelProcessor to process URLs in parallel
-    parallel_processor = ParallelProcessor(max_workers=max_workers)
-    return parallel_processor.process_urls(url_list, process_url, delay_between_batches=batch_delay)
+    async def worker(url_iter, results):
+        # Workers share one iterator, so URLs are pulled from the source on demand
+        for url in url_iter:
+            result = await fetch_and_parse(url)
+            if writer is not None:
+                writer.write(result)
+            else:
+                results.append(result)
+    
+    async def crawl():
+        results = []
+        url_iter = iter(url_list)
+        async with scraper:
+            workers = [asyncio.create_task(worker(url_iter, results)) for _ in range(scraper.concurrency)]
+            try:
+                await asyncio.gather(*workers)
+            except BaseException:
+                # Errors of single URLs are caught in fetch_and_parse(), so this is
+                # a real failure (e.g. the writer raised): stop the other workers
+                # before the session closes and fail the run instead of finishing
+                # with partial output
+                for task in workers:
+                    task.cancel()
+                await asyncio.gather(*workers, return_exceptions=True)
+                raise
+        return results
+    
+    # uvloop's libuv-based event loop has much less per-I/O overhead than the
+    # default one, which dominates when thousands of requests are in flight
+    if uvloop is not None:
+        return uvloop.run(crawl())
+    return asyncio.run(crawl())
 
 
-def run_sequential_scraper(url_list, scraper, html_parser, js_parser, custom_parser, args):
+def run_sequential_scraper(url_list, scraper, html_parser, js_parser, custom_parser, args, writer=None):
     """
     Run the scraper in sequential mode.
     
     Args:
-        url_list: List of URLs to scrape
+        url_list: Iterable of URLs to scrape
         scraper: Scraper instance
-        html_parser: HTMLParser instance
+        html_parser: HTMLParser or FastHTMLParser instance
         js_parser: JSParser instance or None
         custom_parser: Custom parser or None
         args: Command-line arguments
+        writer: Optional ResultWriter that receives each result as it is scraped
         
     Returns:
-        List of scraped data
+        List of scraped data (empty if a writer is given)
     """
     results = []
+    progress = itertools.count(1)
+    extract = build_extraction_plan(html_parser, custom_parser, args)
+    
+    # Read the remaining per-run options once rather than on every URL
+    use_selenium = bool(js_parser and args.selenium)
+    fail_fast = args.fail_fast
     
     for url in url_list:
-        logging.info(f"Processing URL: {url}")
+        log_url_progress(progress, url)
         
         try:
             # Check if we need Selenium
-            if js_parser and args.selenium:
-                logging.info(f"Using Selenium to load: {url}")
+            if use_selenium:
+                logger.debug("Using Selenium to load: %s", url)
                 html_content = js_parser.load_page(url)
             else:
                 # Use regular HTTP request
                 response = scraper.get(url)
                 html_content = response.text
             
-            # Parse the content
-            parsed_data = {}
-            
-            # Apply custom parser if provided
-            if custom_parser:
-                if callable(custom_parser):
-                    parsed_data = custom_parser(html_content, url)
-                else:
-                    parser_instance = custom_parser()
-                    parsed_data = parser_instance.parse(html_content, url)
-            else:
-                # Use comprehensive extraction if requested
-                if args.extract_all:
-                    parsed_data = html_parser.extract_all_data(html_content)
-                    # Always add URL
-                    parsed_data['url'] = url
-                else:
-                    # Use default parsing based on command-line arguments
-                    soup = html_parser.parse(html_content)
-                    
-                    # Extract text if requested
-                    if args.extract_text:
-                        parsed_data['text'] = html_parser.extract_text(html_content, args.selector)
-                    
-                    # Extract links if requested
-                    if args.extract_links:
-                        parsed_data['links'] = html_parser.extract_links(html_content, url)
-                    
-                    # Extract tables if requested
-                    if args.extract_tables:
-                        parsed_data['tables'] = html_parser.extract_table(html_content, args.selector)
-                    
-                    # Extract metadata if requested
-                    if args.extract_metadata:
-                        parsed_data['metadata'] = html_parser.extract_metadata(html_content)
-                    
-                    # If no specific extraction was requested, extract everything
-                    if not any([args.extract_text, args.extract_links, args.extract_tables, args.extract_metadata, args.extract_all]):
-                        parsed_data = {
-                            'url': url,
-                            'title': soup.title.get_text() if soup.title else '',
-                            'text': html_parser.extract_text(html_content),
-                            'links': html_parser.extract_links(html_content, url),
-                            'metadata': html_parser.extract_metadata(html_content)
-                        }
-            
-            # Add the URL to the parsed data
-            if 'url' not in parsed_data:
-                parsed_data['url'] = url
-                
             # Add the result
-            results.append(parsed_data)
+            if writer is not None:
+                writer.write(extract(html_content, url))
+            else:
+                results.append(extract(html_content, url))
             
         except Exception as e:
-            logging.error(f"Error processing URL {url}: {str(e)}")
-            if args.fail_fast:
+            logger.error("Error processing URL %s: %s", url, e)
+            if fail_fast:
                 break
     
     return results
@@ -463,11 +733,15 @@ def main():
     run_parser.add_argument("--url-file", help="Path to a file containing URLs to scrape (one URL per line)")
     run_parser.add_argument("--output-dir", help="Directory to save output files")
     run_parser.add_argument("--output-file", help="Output file name (without extension)")
-    run_parser.add_argument("--output-format", choices=["json", "csv", "sqlite"], help="Output format")
+    run_parser.add_argument("--output-format", choices=list(SAVERS), help="Output format")
     run_parser.add_argument("--table-name", help="Table name for SQLite output")
+    run_parser.add_argument("--stream-output", action="store_true",
+                            help="Write results to disk as they are scraped (JSON output becomes JSON Lines)")
     
     # Parallel processing options
     run_parser.add_argument("--parallel", action="store_true", help="Process URLs in parallel")
+    run_parser.add_argument("--async", dest="use_async", action="store_true",
+                            help="Fetch URLs concurrently with asyncio and aiohttp")
     run_parser.add_argument("--max-workers", type=int, default=5, help="Maximum number of parallel workers (default: 5)")
     run_parser.add_argument("--batch-delay", type=float, default=1.0, help="Delay between batches in seconds (default: 1.0)")
     run_parser.add_argument("--timeout", type=int, default=120, help="Timeout for each URL in seconds (default: 120)")
@@ -488,6 +762,7 @@ def main():
     run_parser.add_argument("--extract-metadata", action="store_true", help="Extract metadata")
     run_parser.add_argument("--extract-all", action="store_true", help="Extract all content types comprehensively")
     run_parser.add_argument("--selector", help="CSS selector for targeting specific elements")
+    run_parser.add_argument("--fast", action="store_true", help="Use the lxml/XPath extractor instead of BeautifulSoup")
     
     # Other settings
     run_parser.add_argument("--fail-fast", action="store_true", help="Stop on first error")
@@ -0,0 +1,359 @@
+import asyncio
+import logging
+import time
+from typing import Optional, Dict, Any
+
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
+from web_scraper.core.robots_parser import RobotsParser
+from web_scraper.core.scraper import BODY_CHUNK_SIZE, RETRY_STATUS_CODES
+from web_scraper.utils.url_utils import split_origin, get_domain
+from web_scraper.core.rate_limiter import RateLimiter, AdaptiveConcurrencyLimiter
+from web_scraper.utils.user_agent import UserAgentRotator
+
+logger = logging.getLogger(__name__)
+
+# Seconds resolved host addresses are reused before resolving them again
+DNS_CACHE_TTL = 300
+
+
+class AsyncScraper:
+    """
+    Asynchronous counterpart of Scraper, backed by an aiohttp.ClientSession.
+
+    Requests are awaited instead of blocking a thread, so many URLs can be in
+    flight on a single event loop. Use it as an async context manager (or call
+    open() and close()) from inside the running loop.
+    """
+    def __init__(self,
+                 rate_limit: float = 1.0,
+                 respect_robots_txt: bool = True,
+                 use_fake_useragent: bool = True,
+                 max_retries: int = 3,
+                 verify_ssl: bool = True,
+                 concurrency: int = 1024,
+                 limit_per_host: int = 64,
+                 timeout: float = 30,
+                 max_bytes: int = 10_000_000,
+                 adaptive_concurrency: bool = True):
+        """
+        Initialize the AsyncScraper.
+
+        Args:
+            rate_limit: Default rate limit in seconds between requests (default: 1.0)
+            respect_robots_txt: Whether to respect robots.txt files (default: True)
+            use_fake_useragent: Whether to use the fake-useragent library (default: True)
+            max_retries: Maximum number of retries for failed requests (default: 3)
+            verify_ssl: Whether to verify SSL certificates (default: True)
+            concurrency: Maximum number of requests in flight at once (default: 1024)
+            limit_per_host: Maximum number of connections per host (default: 64)
+            timeout: Total timeout for each request in seconds (default: 30)
+            max_bytes: Largest response body to accept, in bytes (default: 10,000,000)
+            adaptive_concurrency: Whether to adapt the number of concurrent requests
+                                  per host (up to limit_per_host) to the server's
+                                  latency and overload responses (default: True)
+
+        Raises:
+            ImportError: If aiohttp is not installed
+        """
+        if aiohttp is None:
+            raise ImportError("AsyncScraper requires aiohttp. Install it with: pip install aiohttp")
+
+        self.rate_limiter = RateLimiter(default_delay=rate_limit, max_retries=max_retries)
+        self.robots_parser = RobotsParser() if respect_robots_txt else None
+        self.user_agent_rotator = UserAgentRotator(use_fake_useragent=use_fake_useragent)
+        self.verify_ssl = verify_ssl
+        self.concurrency = concurrency
+        self.limit_per_host = limit_per_host
+        self.timeout = timeout
+        self.max_bytes = max_bytes
+        self.concurrency_limiter = (
+            AdaptiveConcurrencyLimiter(max_limit=limit_per_host) if adaptive_concurrency else None
+        )
+
+        # The session and semaphore are bound to the event loop, so they are
+        # created by open() once the loop is running
+        self.session = None
+        self._semaphore = None
+
+    async def __aenter__(self) -> 'AsyncScraper':
+        await self.open()
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.close()
+
+    async def open(self) -> None:
+        """
+        Create the HTTP session if it is not open yet.
+        """
+        if self.session is None:
+            # Resolve hosts on the event loop with aiodns when it is installed
+            # (aiohttp's default resolver uses a thread pool) and cache the results
+            resolver = aiohttp.AsyncResolver() if aiodns is not None else None
+            connector = aiohttp.TCPConnector(
+                limit=self.concurrency,
+                limit_per_host=self.limit_per_host,
+                ssl=None if self.verify_ssl else False,
+                resolver=resolver,
+                use_dns_cache=True,
+                ttl_dns_cache=DNS_CACHE_TTL
+            )
+            self.session = aiohttp.ClientSession(
+                connector=connector,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            )
+            self._semaphore = asyncio.Semaphore(self.concurrency)
+
+    def _get_domain(self, url: str) -> str:
+        """
+        Extract the domain from a URL.
+
+        Args:
+            url: The URL to extract the domain from
+
+        Returns:
+            The domain part of the URL
+        """
+        return get_domain(url)
+
+    def _can_fetch(self, url: str, base_url: str) -> bool:
+        """
+        Blocking robots.txt check, run in the default executor by can_fetch().
+
+        Args:
+            url: The URL to check
+            base_url: The URL's scheme and domain, e.g. https://example.com
+
+        Returns:
+            True if the URL can be fetched, False otherwise
+        """
+        # Pass the user agent with the check instead of setting it on the parser,
+        # which is shared with the other executor threads
+        user_agent = self.user_agent_rotator.get_random_user_agent()
+        allowed, _ = self.robots_parser.check(url, user_agent, base_url)
+        return allowed
+
+    async def can_fetch(self, url: str) -> bool:
+        """
+        Check if the URL can be fetched according to robots.txt rules.
+
+        Args:
+            url: The URL to check
+
+        Returns:
+            True if the URL can be fetched, False otherwise
+        """
+        if self.robots_parser is None:
+            return True
+
+        # Domains without robots.txt rules need no further checking
+        scheme, domain = split_origin(url)
+        base_url = f"{scheme}://{domain}"
+        if self.robots_parser.allows_all(base_url):
+            return True
+
+        # Fetching robots.txt blocks, so keep it off the event loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, self._can_fetch, url, base_url)
+
+    async def _before_request(self, url: str) -> str:
+        """
+        Apply the robots.txt check and rate limiting for a request.
+
+        Args:
+            url: The URL about to be requested
+
+        Returns:
+            The user agent to send with the request
+
+        Raises:
+            PermissionError: If the URL is disallowed by robots.txt
+        """
+        await self.open()
+        # Split the URL once; the origin is reused for robots.txt and rate limiting
+        scheme, domain = split_origin(url)
+        base_url = f"{scheme}://{domain}"
+
+        # Pick the user agent once; it is used for robots.txt and the request
+        user_agent = self.user_agent_rotator.get_random_user_agent()
+
+        # Check robots.txt if needed (one parser lookup for permission and delay),
+        # skipping domains whose robots.txt allows everything; fetching
+        # robots.txt blocks, so keep it off the event loop
+        crawl_delay = None
+        if self.robots_parser and not self.robots_parser.allows_all(base_url):
+            loop = asyncio.get_running_loop()
+            allowed, crawl_delay = await loop.run_in_executor(
+                None, self.robots_parser.check, url, user_agent, base_url
+            )
+            if not allowed:
+                logger.warning(f"URL {url} is disallowed by robots.txt")
+                raise PermissionError(f"URL {url} is disallowed by robots.txt")
+
+        # Respect rate limiting
+        await self.rate_limiter.wait_async(domain)
+
+        # Set custom delay from robots.txt if available
+        if crawl_delay:
+            self.rate_limiter.set_domain_delay(domain, crawl_delay)
+
+        return user_agent
+
+    async def _read_body(self, response: 'aiohttp.ClientResponse') -> Optional[bytes]:
+        """
+        Read a response body, stopping as soon as it exceeds max_bytes.
+
+        Args:
+            response: The response to read
+
+        Returns:
+            The body, or None if it is larger than max_bytes
+        """
+        # Refuse declared oversized bodies without downloading them
+        if response.content_length is not None and response.content_length > self.max_bytes:
+            return None
+
+        chunks = []
+        size = 0
+        async for chunk in response.content.iter_chunked(BODY_CHUNK_SIZE):
+            size += len(chunk)
+            if size > self.max_bytes:
+                return None
+            chunks.append(chunk)
+
+        return b"".join(chunks)
+
+    async def _request(self, method: str, url: str, headers: Optional[Dict[str, str]] = None,
+                       cookies: Optional[Dict[str, str]] = None,
+                       user_agent: Optional[str] = None, **kwargs) -> 'aiohttp.ClientResponse':
+        """
+        Send a request with retries and backoff, and read its body.
+
+        Args:
+            method: The HTTP method
+            url: The URL to request
+            headers: Optional additional headers (default: None)
+            cookies: Optional cookies to send with the request (default: None)
+            user_agent: User agent to send; a random one is picked if None (default: None)
+            **kwargs: Additional keyword arguments to pass to aiohttp
+
+        Returns:
+            An aiohttp.ClientResponse whose body has already been read
+        """
+        # Accept the requests-style options used with Scraper
+        if 'timeout' in kwargs:
+            kwargs['timeout'] = aiohttp.ClientTimeout(total=kwargs['timeout'])
+        if 'verify' in kwargs:
+            kwargs['ssl'] = None if kwargs.pop('verify') else False
+
+        req_headers = self.user_agent_rotator.get_headers(headers, user_agent)
+        domain = get_domain(url)
+        limiter = self.concurrency_limiter
+
+        async def _make_request():
+            # Wait for a slot on the host before taking a global one, so a
+            # throttled host does not hold up requests to other hosts
+            if limiter is not None:
+                await limiter.acquire(domain)
+            start = time.monotonic()
+            overloaded = False
+            try:
+                async with self._semaphore:
+                    async with self.session.request(method, url, headers=req_headers,
+                                                    cookies=cookies, **kwargs) as response:
+                        overloaded = response.status in RETRY_STATUS_CODES
+                        body = await self._read_body(response)
+                        if overloaded:
+                            # Raise so retry_with_backoff_async() retries the request
+                            response.raise_for_status()
+                        return response, body
+            except asyncio.TimeoutError:
+                overloaded = True
+                raise
+            finally:
+                if limiter is not None:
+                    await limiter.release(domain, time.monotonic() - start, overloaded)
+
+        response, body = await self.rate_limiter.retry_with_backoff_async(_make_request)
+
+        if body is None:
+            raise ValueError(f"Response from {url} exceeds the {self.max_bytes} byte limit")
+
+        # Keep the body on the response, so response.text()/json() work after
+        # the connection has been released
+        response._body = body
+
+        # Check the response status code
+        response.raise_for_status()
+
+        return response
+
+    async def get(self, url: str, headers: Optional[Dict[str, str]] = None,
+                  cookies: Optional[Dict[str, str]] = None, **kwargs) -> 'aiohttp.ClientResponse':
+        """
+        Fetch a URL with GET method.
+
+        Args:
+            url: The URL to fetch
+            headers: Optional additional headers (default: None)
+            cookies: Optional cookies to send with the request (default: None)
+            **kwargs: Additional keyword arguments to pass to aiohttp
+
+        Returns:
+            An aiohttp.ClientResponse whose body has already been read
+
+        Raises:
+            aiohttp.ClientError: If the request fails
+            ValueError: If the response body is larger than max_bytes
+        """
+        user_agent = await self._before_request(url)
+        return await self._request('GET', url, headers, cookies, user_agent, **kwargs)
+
+    async def post(self, url: str, data: Optional[Dict[str, Any]] = None,
+                   json: Optional[Dict[str, Any]] = None,
+                   headers: Optional[Dict[str, str]] = None,
+                   cookies: Optional[Dict[str, str]] = None, **kwargs) -> 'aiohttp.ClientResponse':
+        """
+        Fetch a URL with POST method.
+
+        Args:
+            url: The URL to fetch
+            data: Optional form data to send (default: None)
+            json: Optional JSON data to send (default: None)
+            headers: Optional additional headers (default: None)
+            cookies: Optional cookies to send with the request (default: None)
+            **kwargs: Additional keyword arguments to pass to aiohttp
+
+        Returns:
+            An aiohttp.ClientResponse whose body has already been read
+
+        Raises:
+            aiohttp.ClientError: If the request fails
+            ValueError: If the response body is larger than max_bytes
+        """
+        user_agent = await self._before_request(url)
+
+        # Add data or JSON parameters
+        if data:
+            kwargs['data'] = data
+        if json:
+            kwargs['json'] = json
+
+        return await self._request('POST', url, headers, cookies, user_agent, **kwargs)
+
+    async def close(self) -> None:
+        """
+        Close the session and clean up resources.
+        """
+        if self.session is not None:
+            await self.session.close()
+            self.session = None
@@ -1,9 +1,17 @@
+import asyncio
+import itertools
 import time
 import random
+from collections import OrderedDict
 from typing import Dict, Optional
 import logging
 import requests
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
 logger = logging.getLogger(__name__)
 
 
@@ -11,6 +19,17 @@ class RateLimiter:
     """
     Handles rate limiting and exponential backoff for web requests.
     """
+    __slots__ = ('default_delay', 'max_retries', 'backoff_factor', 'jitter',
+                 'domain_delays', 'last_request_time', 'domain_locks',
+                 '_delays', '_jitter_scale')
+    
+    # Whether to retry an HTTP error, by status code: client errors (4xx) are not
+    # retried except for 429 (Too Many Requests); anything else (5xx) is
+    _RETRY_BY_STATUS = {status_code: status_code == 429 for status_code in range(400, 500)}
+    
+    # Maximum number of domains tracked per dictionary; the least recently used are dropped
+    MAX_DOMAINS = 100_000
+    
     def __init__(self, default_delay: float = 1.0, 
                  max_retries: int = 5, 
                  backoff_factor: float = 2.0,
@@ -28,8 +47,13 @@ class RateLimiter:
         self.max_retries = max_retries
         self.backoff_factor = backoff_factor
         self.jitter = jitter
-        self.domain_delays: Dict[str, float] = {}
-        self.last_request_time: Dict[str, float] = {}
+        self.domain_delays: "OrderedDict[str, float]" = OrderedDict()
+        self.last_request_time: "OrderedDict[str, float]" = OrderedDict()
+        self.domain_locks: "OrderedDict[str, asyncio.Lock]" = OrderedDict()
+        
+        # Backoff delays and their jitter ranges for every retry, computed once
+        self._delays = tuple(default_delay * backoff_factor ** i for i in range(max_retries + 2))
+        self._jitter_scale = tuple(jitter * delay for delay in self._delays)
         
     def set_domain_delay(self, domain: str, delay: float) -> None:
         """
@@ -40,7 +64,43 @@ class RateLimiter:
             delay: The delay in seconds
         """
         self.domain_delays[domain] = delay
+        self._touch(self.domain_delays, domain)
+        
+    def _touch(self, domains: OrderedDict, domain: str) -> None:
+        """
+        Mark a domain as recently used and drop the least recently used ones over MAX_DOMAINS.
         
+        Args:
+            domains: One of the per-domain dictionaries
+            domain: The domain that was just used
+        """
+        domains.move_to_end(domain)
+        while len(domains) > self.MAX_DOMAINS:
+            domains.popitem(last=False)
+            
+    def _touch_lock(self, domain: str) -> None:
+        """
+        Mark a domain's lock as recently used and drop least recently used locks over MAX_DOMAINS.
+        
+        Held locks are never dropped: a task arriving for that domain would get
+        a new lock and be scheduled alongside the holder.
+        
+        Args:
+            domain: The domain whose lock was just used
+        """
+        self.domain_locks.move_to_end(domain)
+        excess = len(self.domain_locks) - self.MAX_DOMAINS
+        if excess > 0:
+            # Walk from the least recently used end only until enough idle locks are found
+            idle = list(itertools.islice(
+                (old_domain for old_domain, lock in self.domain_locks.items()
+                 if old_domain != domain and not lock.locked()),
+                excess
+            ))
+            for old_domain in idle:
+                del self.domain_locks[old_domain]
+                    
+
     def wait(self, domain: str) -> None:
         """
         Wait the appropriate amount of time before making another request to the given domain.
@@ -49,8 +109,8 @@ class RateLimiter:
             domain: The domain to wait for
         """
         delay = self.domain_delays.get(domain, self.default_delay)
-        last_time = self.last_request_time.get(domain, 0)
-        current_time = time.time()
+        last_time = self.last_request_time.get(domain, float('-inf'))
+        current_time = time.monotonic()
         
         # Calculate how long we need to wait
         wait_time = max(0, last_time + delay - current_time)
@@ -61,8 +121,43 @@ class RateLimiter:
             time.sleep(wait_time + jitter_amount)
             
         # Update the last request time
-        self.last_request_time[domain] = time.time()
+        self.last_request_time[domain] = time.monotonic()
+        self._touch(self.last_request_time, domain)
+        
+    async def wait_async(self, domain: str) -> None:
+        """
+        Asynchronous version of wait() for use inside an asyncio event loop.
+        
+        The request slot is reserved before sleeping, so concurrent tasks for
+        the same domain are spaced out instead of all waking up at once.
         
+        Args:
+            domain: The domain to wait for
+        """
+        delay = self.domain_delays.get(domain, self.default_delay)
+        
+        # Serialize scheduling per domain: the slot is computed and reserved under
+        # the lock, and the sleep happens after it is released
+        lock = self.domain_locks.get(domain)
+        if lock is None:
+            lock = self.domain_locks[domain] = asyncio.Lock()
+        self._touch_lock(domain)
+        
+        async with lock:
+            last_time = self.last_request_time.get(domain, float('-inf'))
+            current_time = time.monotonic()
+            
+            # Reserve the next free slot for this domain
+            scheduled_time = max(current_time, last_time + delay)
+            self.last_request_time[domain] = scheduled_time
+            self._touch(self.last_request_time, domain)
+            
+        wait_time = scheduled_time - current_time
+        if wait_time > 0:
+            # Add a small random jitter to avoid patterns
+            jitter_amount = random.uniform(0, self.jitter * delay)
+            await asyncio.sleep(wait_time + jitter_amount)
+            
     def exponential_backoff(self, retry_count: int) -> float:
         """
         Calculate the exponential backoff wait time based on the retry count.
@@ -73,12 +168,12 @@ class RateLimiter:
         Returns:
             The wait time in seconds
         """
-        # Base delay with exponential backoff
+        # Base delay with exponential backoff, plus jitter to avoid thundering herd problem
+        if retry_count < len(self._delays):
+            return self._delays[retry_count] + random.random() * self._jitter_scale[retry_count]
+            
         delay = self.default_delay * (self.backoff_factor ** retry_count)
-        
-        # Add jitter to avoid thundering herd problem
-        jitter_amount = random.uniform(0, self.jitter * delay)
-        return delay + jitter_amount
+        return delay + random.random() * self.jitter * delay
         
     def should_retry(self, exception: Exception) -> bool:
         """
@@ -90,23 +185,14 @@ class RateLimiter:
         Returns:
             True if the request should be retried, False otherwise
         """
-        # Don't retry client errors (4xx) except for 429 (Too Many Requests)
         if isinstance(exception, requests.HTTPError):
-            status_code = exception.response.status_code if hasattr(exception, 'response') else 0
+            status_code = getattr(exception.response, 'status_code', 0)
+            return self._RETRY_BY_STATUS.get(status_code, True)
             
-            # Always retry rate limiting (429) and server errors (5xx)
-            if status_code == 429 or (500 <= status_code < 600):
-                return True
-                
-            # Don't retry client errors (404 Not Found, 403 Forbidden, etc.)
-            if 400 <= status_code < 500 and status_code != 429:
-                return False
-                
-        # Retry network errors, timeouts, etc.
-        if isinstance(exception, (requests.ConnectionError, requests.Timeout)):
-            return True
+        if aiohttp is not None and isinstance(exception, aiohttp.ClientResponseError):
+            return self._RETRY_BY_STATUS.get(exception.status, True)
             
-        # Default to retry
+        # Retry network errors, timeouts, etc.
         return True
         
     def retry_with_backoff(self, func, *args, **kwargs):
@@ -129,19 +215,192 @@ class RateLimiter:
             try:
                 if retry > 0:
                     backoff_time = self.exponential_backoff(retry - 1)
-                    logger.info(f"Retry {retry}/{self.max_retries}: Waiting {backoff_time:.2f} seconds")
+                    logger.info("Retry %d/%d: Waiting %.2f seconds", retry, self.max_retries, backoff_time)
                     time.sleep(backoff_time)
                     
                 return func(*args, **kwargs)
                 
             except Exception as e:
                 last_exception = e
-                logger.warning(f"Request failed (attempt {retry+1}/{self.max_retries+1}): {str(e)}")
+                logger.warning("Request failed (attempt %d/%d): %s", retry + 1, self.max_retries + 1, e)
+                
+                # Check if we should retry
+                if retry < self.max_retries and not self.should_retry(e):
+                    logger.info("Not retrying: %s", e)
+                    break
+                
+        # If we get here, all retries failed
+        raise last_exception or Exception("All retry attempts failed")
+        
+    async def retry_with_backoff_async(self, func, *args, **kwargs):
+        """
+        Asynchronous version of retry_with_backoff() for coroutine functions.
+        
+        Args:
+            func: The coroutine function to execute
+            *args, **kwargs: Arguments to pass to the function
+            
+        Returns:
+            The result of the awaited function
+            
+        Raises:
+            Exception: If all retries fail
+        """
+        last_exception = None
+        
+        for retry in range(self.max_retries + 1):
+            try:
+                if retry > 0:
+                    backoff_time = self.exponential_backoff(retry - 1)
+                    logger.info("Retry %d/%d: Waiting %.2f seconds", retry, self.max_retries, backoff_time)
+                    await asyncio.sleep(backoff_time)
+                    
+                return await func(*args, **kwargs)
+                
+            except Exception as e:
+                last_exception = e
+                logger.warning("Request failed (attempt %d/%d): %s", retry + 1, self.max_retries + 1, e)
                 
                 # Check if we should retry
                 if retry < self.max_retries and not self.should_retry(e):
-                    logger.info(f"Not retrying: {str(e)}")
+                    logger.info("Not retrying: %s", e)
                     break
                 
         # If we get here, all retries failed
-        raise last_exception or Exception("All retry attempts failed") 
\ No newline at end of file
+        raise last_exception or Exception("All retry attempts failed") 
+
+
+class _DomainConcurrency:
+    """
+    Concurrency state of one domain for AdaptiveConcurrencyLimiter.
+    """
+    __slots__ = ('limit', 'in_flight', 'ewma_latency', 'condition')
+    
+    def __init__(self, limit: int):
+        self.limit = limit
+        self.in_flight = 0
+        self.ewma_latency: Optional[float] = None
+        self.condition = asyncio.Condition()
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Adapts the number of concurrent requests per domain to how the server responds.
+    
+    Each domain starts with a small limit on requests in flight. The limit grows
+    by one after every response that is not slower than the domain's average
+    latency (an exponentially weighted moving average), and is halved when the
+    server signals overload (429, 5xx or a timeout), so throughput converges on
+    what the server can take without triggering storms of 429 responses.
+    """
+    __slots__ = ('initial_limit', 'max_limit', 'smoothing', 'tolerance', 'domains')
+    
+    # Maximum number of domains tracked; the least recently used idle ones are dropped
+    MAX_DOMAINS = 100_000
+    
+    def __init__(self, initial_limit: int = 2,
+                 max_limit: int = 64,
+                 smoothing: float = 0.2,
+                 tolerance: float = 1.1):
+        """
+        Initialize the AdaptiveConcurrencyLimiter.
+        
+        Args:
+            initial_limit: Concurrent requests allowed for a new domain (default: 2)
+            max_limit: Largest concurrency limit for any domain (default: 64)
+            smoothing: Weight of the newest latency in the moving average (default: 0.2)
+            tolerance: Latency, relative to the average, up to which the limit
+                       is still increased (default: 1.1)
+        """
+        self.initial_limit = max(1, min(initial_limit, max_limit))
+        self.max_limit = max_limit
+        self.smoothing = smoothing
+        self.tolerance = tolerance
+        self.domains: "OrderedDict[str, _DomainConcurrency]" = OrderedDict()
+        
+    def _get_state(self, domain: str) -> _DomainConcurrency:
+        """
+        Get (or create) the concurrency state of a domain.
+        
+        Args:
+            domain: The domain to look up
+            
+        Returns:
+            The domain's concurrency state
+        """
+        state = self.domains.get(domain)
+        if state is None:
+            state = self.domains[domain] = _DomainConcurrency(self.initial_limit)
+            
+            # Drop the least recently used domains that have nothing in flight,
+            # walking from that end only until enough of them are found
+            excess = len(self.domains) - self.MAX_DOMAINS
+            if excess > 0:
+                idle = list(itertools.islice(
+                    (old_domain for old_domain, old_state in self.domains.items()
+                     if old_state.in_flight == 0 and old_domain != domain),
+                    excess
+                ))
+                for old_domain in idle:
+                    del self.domains[old_domain]
+        else:
+            self.domains.move_to_end(domain)
+            
+        return state
+        
+    def get_limit(self, domain: str) -> int:
+        """
+        Get the current concurrency limit of a domain.
+        
+        Args:
+            domain: The domain to look up
+            
+        Returns:
+            The number of requests allowed in flight for the domain
+        """
+        state = self.domains.get(domain)
+        return state.limit if state is not None else self.initial_limit
+        
+    async def acquire(self, domain: str) -> None:
+        """
+        Wait until another request to the domain may be sent, and claim the slot.
+        
+        Every call must be followed by a call to release().
+        
+        Args:
+            domain: The domain about to be requested
+        """
+        state = self._get_state(domain)
+        async with state.condition:
+            await state.condition.wait_for(lambda: state.in_flight < state.limit)
+            state.in_flight += 1
+            
+    async def release(self, domain: str, latency: float, overloaded: bool = False) -> None:
+        """
+        Release a slot claimed by acquire() and adjust the domain's limit.
+        
+        Args:
+            domain: The domain that was requested
+            latency: How long the request took, in seconds
+            overloaded: Whether the server signalled overload, i.e. answered
+                        429 or 5xx or timed out (default: False)
+        """
+        state = self._get_state(domain)
+        async with state.condition:
+            state.in_flight -= 1
+            
+            if overloaded:
+                # Multiplicative decrease
+                state.limit = max(1, state.limit // 2)
+                logger.debug("Reduced concurrency for %s to %d", domain, state.limit)
+            elif state.ewma_latency is None or latency <= state.ewma_latency * self.tolerance:
+                # Additive increase while latency is not rising
+                state.limit = min(state.limit + 1, self.max_limit)
+                
+            if not overloaded:
+                if state.ewma_latency is None:
+                    state.ewma_latency = latency
+                else:
+                    state.ewma_latency += self.smoothing * (latency - state.ewma_latency)
+                    
+            state.condition.notify(max(0, state.limit - state.in_flight))
\ No newline at end of file
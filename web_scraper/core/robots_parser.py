@@ -1,15 +1,267 @@
+import contextlib
+import hashlib
+import json
+import logging
+import os
+import re
+import threading
+import time
 import urllib.robotparser
 import urllib.parse
+from collections import OrderedDict
+from concurrent.futures import Future
 import requests
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Any, Tuple, Pattern
+
+from web_scraper.utils.url_utils import split_origin
+
+try:
+    import fcntl
+except ImportError:
+    fcntl = None
+
+logger = logging.getLogger(__name__)
+
+# Where fetched robots.txt files are persisted between runs
+DEFAULT_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "web_scraper", "robots")
+
+# Only the first 500 KB of a robots.txt file are parsed, as Google does
+MAX_ROBOTS_SIZE = 500 * 1024
+
+# Number of lock files the domains of the disk cache are spread over; a fixed
+# set keeps the cache directory from growing a lock file per domain
+CACHE_LOCK_STRIPES = 64
+
+
+def _make_rule_line(path: str, allowance: bool) -> urllib.robotparser.RuleLine:
+    """
+    Create a RuleLine, skipping its urlparse()/urlunparse() round trip where it is a no-op.
+    
+    Args:
+        path: The unquoted rule path
+        allowance: True for Allow, False for Disallow
+        
+    Returns:
+        A RuleLine equal to RuleLine(path, allowance)
+    """
+    # A plain absolute path (no '//' authority, params, query or fragment)
+    # comes back from the round trip unchanged, so only quoting is needed
+    if path[:1] == '/' and path[:2] != '//' and not any(c in path for c in ';?#'):
+        rule = urllib.robotparser.RuleLine.__new__(urllib.robotparser.RuleLine)
+        rule.path = urllib.parse.quote(path)
+        rule.allowance = allowance
+        return rule
+    return urllib.robotparser.RuleLine(path, allowance)
+
+
+def _robots_path(url: str) -> str:
+    """
+    Normalize a URL to the path that robots.txt rules are matched against.
+    
+    Gives the same result as RobotFileParser.can_fetch()'s normalization, but
+    plain absolute URLs (no params, query or fragment) are split with
+    str.partition instead of urlparse()/urlunparse().
+    
+    Args:
+        url: The URL to normalize
+        
+    Returns:
+        The quoted path, at least "/"
+    """
+    url = urllib.parse.unquote(url)
+    scheme, sep, rest = url.partition('://')
+    if sep and scheme.isascii() and scheme.isalpha():
+        slash = rest.find('/')
+        tail = rest[slash:] if slash != -1 else ''
+        if not any(c in rest for c in ';?#\t\r\n'):
+            return urllib.parse.quote(tail) or "/"
+            
+    parsed_url = urllib.parse.urlparse(url)
+    return urllib.parse.quote(urllib.parse.urlunparse(
+        ('', '', parsed_url.path, parsed_url.params, parsed_url.query, parsed_url.fragment)
+    )) or "/"
+
+
+class CompiledRobotFileParser(urllib.robotparser.RobotFileParser):
+    """
+    RobotFileParser whose can_fetch() matches against precompiled rules.
+    
+    The rules of the group that applies to a user agent are compiled on first
+    use into a tuple sorted longest path first, so a check is a scan with
+    str.startswith (or a regex for rules with '*' or '$') that stops at the
+    longest matching rule, as specified by RFC 9309.
+    """
+    def __init__(self, url: str = ''):
+        super().__init__(url)
+        self._compiled: Dict[str, Tuple[Tuple[str, bool, Optional[Pattern]], ...]] = {}
+
+    def parse(self, lines) -> None:
+        """
+        Parse the lines of a robots.txt file.
+        
+        Follows RobotFileParser.parse() (and builds the same Entry objects, so
+        crawl delays and sitemaps work unchanged), but creates rule lines with
+        _make_rule_line(), which is most of the cost of parsing a large file.
+        
+        Args:
+            lines: The lines of the robots.txt file
+        """
+        # States: 0 = start, 1 = saw a user-agent line, 2 = saw a rule line
+        state = 0
+        entry = urllib.robotparser.Entry()
+        self._compiled = {}
+        
+        self.modified()
+        for line in lines:
+            if not line:
+                # A blank line ends the current group
+                if state == 1:
+                    entry = urllib.robotparser.Entry()
+                    state = 0
+                elif state == 2:
+                    self._add_entry(entry)
+                    entry = urllib.robotparser.Entry()
+                    state = 0
+                    
+            # Remove comments and surrounding whitespace
+            i = line.find('#')
+            if i >= 0:
+                line = line[:i]
+            key, sep, value = line.strip().partition(':')
+            if not sep:
+                continue
+                
+            key = key.strip().lower()
+            value = urllib.parse.unquote(value.strip())
+            
+            if key == "user-agent":
+                if state == 2:
+                    self._add_entry(entry)
+                    entry = urllib.robotparser.Entry()
+                entry.useragents.append(value)
+                state = 1
+            elif key == "disallow" or key == "allow":
+                if state != 0:
+                    entry.rulelines.append(_make_rule_line(value, key == "allow"))
+                    state = 2
+            elif key == "crawl-delay":
+                if state != 0:
+                    if value.strip().isdigit():
+                        entry.delay = int(value)
+                    state = 2
+            elif key == "request-rate":
+                if state != 0:
+                    numbers = value.split('/')
+                    if (len(numbers) == 2 and numbers[0].strip().isdigit()
+                            and numbers[1].strip().isdigit()):
+                        entry.req_rate = urllib.robotparser.RequestRate(int(numbers[0]), int(numbers[1]))
+                    state = 2
+            elif key == "sitemap":
+                # Sitemaps are independent of the user-agent groups
+                self.sitemaps.append(value)
+                
+        if state == 2:
+            self._add_entry(entry)
+
+    def _compile_rules(self, useragent: str) -> Tuple[Tuple[str, bool, Optional[Pattern]], ...]:
+        """
+        Compile the rules that apply to a user agent.
+        
+        Args:
+            useragent: The user agent string
+            
+        Returns:
+            A tuple of (path, allowed, pattern) sorted longest path first, with
+            Allow before Disallow for equally long paths; pattern is None for
+            plain prefix rules
+        """
+        # The first group naming the agent applies, otherwise the '*' group
+        entry = next((e for e in self.entries if e.applies_to(useragent)), self.default_entry)
+        if entry is None:
+            return ()
+            
+        rules = []
+        for line in entry.rulelines:
+            # RuleLine paths are URL-quoted, so the wildcards appear as %2A and %24
+            path = line.path
+            pattern = None
+            if '%2A' in path or path.endswith('%24'):
+                anchored = path.endswith('%24')
+                body = path[:-3] if anchored else path
+                regex = '.*'.join(re.escape(part) for part in body.split('%2A'))
+                pattern = re.compile(regex + (r'\Z' if anchored else ''))
+            rules.append((path, line.allowance, pattern))
+            
+        rules.sort(key=lambda rule: (-len(rule[0]), not rule[1]))
+        return tuple(rules)
+
+    def can_fetch(self, useragent: str, url: str) -> bool:
+        """
+        Check if the user agent is allowed to fetch the given URL.
+        
+        Args:
+            useragent: The user agent string
+            url: The URL to check
+            
+        Returns:
+            True if the URL can be fetched, False otherwise
+        """
+        if self.disallow_all:
+            return False
+        if self.allow_all:
+            return True
+        # Until the file has been read, nothing is allowed (as in RobotFileParser)
+        if not self.last_checked:
+            return False
+            
+        rules = self._compiled.get(useragent)
+        if rules is None:
+            rules = self._compiled[useragent] = self._compile_rules(useragent)
+        if not rules:
+            return True
+            
+        path = _robots_path(url)
+        
+        for rule_path, allowed, pattern in rules:
+            if pattern is not None:
+                if pattern.match(path):
+                    return allowed
+            elif path.startswith(rule_path):
+                return allowed
+                
+        return True
 
 
 class RobotsParser:
     """
     Handles parsing and respecting robots.txt files for websites.
+    
+    Parsed files are kept in a bounded in-memory LRU cache and persisted to
+    disk, so a new process only has to revalidate them (using ETag and
+    Last-Modified) once they are older than the TTL. The parser is thread-safe
+    and concurrent lookups for a new domain share a single fetch.
     """
-    def __init__(self):
-        self.parsers: Dict[str, urllib.robotparser.RobotFileParser] = {}
+    def __init__(self, cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
+                 ttl: float = 3600, max_entries: int = 4096):
+        """
+        Initialize the RobotsParser.
+        
+        Args:
+            cache_dir: Directory for the on-disk cache, or None to disable it
+                       (default: ~/.cache/web_scraper/robots)
+            ttl: Seconds a fetched robots.txt is used before revalidating it (default: 3600)
+            max_entries: Maximum number of domains kept in memory (default: 4096)
+        """
+        self.parsers: "OrderedDict[str, urllib.robotparser.RobotFileParser]" = OrderedDict()
+        self.fetched_at: Dict[str, float] = {}
+        # Domains whose robots.txt allows everything, with the time the verdict expires
+        self.allow_all_until: Dict[str, float] = {}
+        # In-flight fetches, so concurrent callers for a domain share one request
+        self.pending: Dict[str, Future] = {}
+        self._lock = threading.Lock()
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_entries = max_entries
         self.user_agent = "*"  # Default user agent
 
     def set_user_agent(self, user_agent: str) -> None:
@@ -21,37 +273,284 @@ class RobotsParser:
         """
         self.user_agent = user_agent
 
-    def _get_parser(self, url: str) -> urllib.robotparser.RobotFileParser:
+    def _cache_path(self, base_url: str) -> str:
+        """
+        Get the on-disk cache file for a domain.
+        
+        Args:
+            base_url: The scheme and domain, e.g. https://example.com
+            
+        Returns:
+            The path of the cache file
+        """
+        digest = hashlib.sha1(base_url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{digest}.json")
+        
+    def _lock_path(self, base_url: str) -> str:
+        """
+        Get the lock file guarding a domain's cache entry.
+        
+        Each lock file is shared by the domains whose digests fall in its stripe.
+        
+        Args:
+            base_url: The scheme and domain, e.g. https://example.com
+            
+        Returns:
+            The path of the lock file
+        """
+        digest = hashlib.sha1(base_url.encode('utf-8')).hexdigest()
+        return os.path.join(self.cache_dir, f"{int(digest, 16) % CACHE_LOCK_STRIPES:02d}.lock")
+        
+    def _load_cache_entry(self, base_url: str) -> Optional[Dict[str, Any]]:
+        """
+        Load a domain's robots.txt from the on-disk cache.
+        
+        Args:
+            base_url: The scheme and domain, e.g. https://example.com
+            
+        Returns:
+            The cached entry, or None if there is none
+        """
+        if not self.cache_dir:
+            return None
+            
+        try:
+            with open(self._cache_path(base_url), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+            
+    def _save_cache_entry(self, base_url: str, entry: Dict[str, Any]) -> None:
+        """
+        Persist a domain's robots.txt to the on-disk cache.
+        
+        Args:
+            base_url: The scheme and domain, e.g. https://example.com
+            entry: The entry to save
+        """
+        if not self.cache_dir:
+            return
+            
+        path = self._cache_path(base_url)
+        try:
+            os.makedirs(self.cache_dir, exist_ok=True)
+            # Write to a temporary file first so readers never see a partial entry
+            tmp_path = f"{path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(entry, f)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.debug(f"Could not cache robots.txt for {base_url}: {str(e)}")
+            
+    @contextlib.contextmanager
+    def _fetch_lock(self, base_url: str):
+        """
+        Hold an exclusive lock on a domain's cache entry, shared by all processes using the cache.
+        
+        Without a cache directory (or on platforms without fcntl) no lock is taken.
+        
+        Args:
+            base_url: The scheme and domain, e.g. https://example.com
+        """
+        lock_file = None
+        if self.cache_dir and fcntl is not None:
+            try:
+                os.makedirs(self.cache_dir, exist_ok=True)
+                lock_file = open(self._lock_path(base_url), 'a')
+            except OSError as e:
+                logger.debug(f"Could not lock the robots.txt cache for {base_url}: {str(e)}")
+                
+        if lock_file is None:
+            yield
+            return
+            
+        with lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+                
+    def _build_parser(self, entry: Dict[str, Any]) -> CompiledRobotFileParser:
+        """
+        Create a parser from a cache entry.
+        
+        Args:
+            entry: Cache entry holding the robots.txt body
+            
+        Returns:
+            A RobotFileParser for the entry
+        """
+        rp = CompiledRobotFileParser()
+        if entry.get('allow_all'):
+            rp.allow_all = True
+        else:
+            rp.parse(entry.get('body', '').splitlines())
+        return rp
+        
+    def _fetch_parser(self, base_url: str) -> Tuple[urllib.robotparser.RobotFileParser, float]:
+        """
+        Fetch (or revalidate) and parse the robots.txt of a domain.
+        
+        Processes sharing the cache directory take turns, so only one of
+        them downloads a domain's robots.txt and the others read the result.
+        
+        Args:
+            base_url: The scheme and domain, e.g. https://example.com
+            
+        Returns:
+            A tuple of (a RobotFileParser for the domain, seconds since its
+            robots.txt was fetched), the age being non-zero for disk cache hits
+        """
+        entry = self._load_cache_entry(base_url)
+        age = self._entry_age(entry)
+        if age < self.ttl:
+            return self._build_parser(entry), age
+            
+        with self._fetch_lock(base_url):
+            # Another process may have refreshed the entry while we waited for the lock
+            entry = self._load_cache_entry(base_url) or entry
+            age = self._entry_age(entry)
+            if age < self.ttl:
+                return self._build_parser(entry), age
+                
+            return self._download_parser(base_url, entry), 0.0
+            
+    @staticmethod
+    def _entry_age(entry: Optional[Dict[str, Any]]) -> float:
+        """
+        Get the seconds since a cache entry was fetched.
+        
+        Args:
+            entry: A cache entry, or None
+            
+        Returns:
+            The entry's age (never negative), or infinity if there is no entry
+        """
+        if not entry:
+            return float('inf')
+        return max(0.0, time.time() - entry.get('fetched_at', 0))
+            
+    def _download_parser(self, base_url: str, entry: Optional[Dict[str, Any]]) -> CompiledRobotFileParser:
+        """
+        Download (or revalidate a stale cache entry of) a domain's robots.txt and cache it.
+        
+        Args:
+            base_url: The scheme and domain, e.g. https://example.com
+            entry: The stale cache entry, or None if there is none
+            
+        Returns:
+            A RobotFileParser for the domain
+        """
+        # Revalidate a stale cache entry instead of downloading it again
+        headers = {}
+        if entry:
+            if entry.get('etag'):
+                headers['If-None-Match'] = entry['etag']
+            if entry.get('last_modified'):
+                headers['If-Modified-Since'] = entry['last_modified']
+                
+        robots_url = f"{base_url}/robots.txt"
+        
+        try:
+            response = requests.get(robots_url, headers=headers, timeout=10)
+            if response.status_code == 304 and entry:
+                entry['fetched_at'] = time.time()
+            elif response.status_code == 200:
+                entry = {
+                    'body': response.text[:MAX_ROBOTS_SIZE],
+                    'allow_all': False,
+                    'etag': response.headers.get('ETag'),
+                    'last_modified': response.headers.get('Last-Modified'),
+                    'fetched_at': time.time()
+                }
+            else:
+                # If robots.txt doesn't exist or can't be retrieved, assume everything is allowed
+                entry = {'body': '', 'allow_all': True, 'fetched_at': time.time()}
+        except requests.RequestException:
+            # If there's a request error, assume everything is allowed (without caching it on disk)
+            return self._build_parser({'allow_all': True})
+            
+        self._save_cache_entry(base_url, entry)
+        return self._build_parser(entry)
+
+    def _get_parser(self, url: str, base_url: Optional[str] = None) -> urllib.robotparser.RobotFileParser:
         """
         Get or create a parser for the given URL's domain.
         
         Args:
             url: The URL to get a parser for
+            base_url: The URL's scheme and domain, if the caller has already split
+                      them off (default: None)
             
         Returns:
             A RobotFileParser for the URL's domain
         """
-        parsed_url = urllib.parse.urlparse(url)
-        base_url = f"{parsed_url.scheme}://{parsed_url.netloc}"
+        if base_url is None:
+            scheme, domain = split_origin(url)
+            base_url = f"{scheme}://{domain}"
         
-        if base_url not in self.parsers:
-            rp = urllib.robotparser.RobotFileParser()
-            robots_url = f"{base_url}/robots.txt"
+        with self._lock:
+            rp = self.parsers.get(base_url)
+            if rp is not None and time.monotonic() - self.fetched_at[base_url] < self.ttl:
+                self.parsers.move_to_end(base_url)
+                return rp
+                
+            # Join a fetch already in progress for this domain, or start one
+            future = self.pending.get(base_url)
+            if future is None:
+                future = Future()
+                self.pending[base_url] = future
+                is_owner = True
+            else:
+                is_owner = False
+                
+        if not is_owner:
+            return future.result()
             
-            try:
-                response = requests.get(robots_url, timeout=10)
-                if response.status_code == 200:
-                    rp.parse(response.text.splitlines())
+        try:
+            rp, age = self._fetch_parser(base_url)
+            
+            with self._lock:
+                self.parsers[base_url] = rp
+                self.parsers.move_to_end(base_url)
+                # Count the TTL from the fetch, not from loading a disk cache entry,
+                # so an entry is never used for longer than the TTL
+                self.fetched_at[base_url] = time.monotonic() - age
+                if rp.allow_all:
+                    self.allow_all_until[base_url] = self.fetched_at[base_url] + self.ttl
                 else:
-                    # If robots.txt doesn't exist or can't be retrieved, assume everything is allowed
-                    rp.allow_all = True
-            except requests.RequestException:
-                # If there's a request error, assume everything is allowed
-                rp.allow_all = True
+                    self.allow_all_until.pop(base_url, None)
                 
-            self.parsers[base_url] = rp
+                # Evict the least recently used domains
+                while len(self.parsers) > self.max_entries:
+                    evicted, _ = self.parsers.popitem(last=False)
+                    del self.fetched_at[evicted]
+                    self.allow_all_until.pop(evicted, None)
+                    
+            future.set_result(rp)
+            return rp
+        except BaseException as e:
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                del self.pending[base_url]
+
+    def allows_all(self, base_url: str) -> bool:
+        """
+        Check, without parsing or fetching, whether a domain's robots.txt allows everything.
+        
+        This is true when robots.txt was missing or could not be retrieved, so
+        callers can skip the per-URL check for such domains.
+        
+        Args:
+            base_url: The scheme and domain, e.g. https://example.com
             
-        return self.parsers[base_url]
+        Returns:
+            True if every URL of the domain may be fetched, False if unknown or restricted
+        """
+        return time.monotonic() < self.allow_all_until.get(base_url, 0.0)
 
     def can_fetch(self, url: str, user_agent: Optional[str] = None) -> bool:
         """
@@ -68,6 +567,24 @@ class RobotsParser:
         agent = user_agent or self.user_agent
         return parser.can_fetch(agent, url)
 
+    def check(self, url: str, user_agent: Optional[str] = None,
+              base_url: Optional[str] = None) -> Tuple[bool, Optional[float]]:
+        """
+        Check permission and get the crawl delay for a URL with a single parser lookup.
+        
+        Args:
+            url: The URL to check
+            user_agent: Override the default user agent
+            base_url: The URL's scheme and domain, e.g. https://example.com, if the
+                      caller has already split them off (default: None)
+            
+        Returns:
+            A tuple of (whether the URL may be fetched, crawl delay in seconds or None)
+        """
+        parser = self._get_parser(url, base_url)
+        agent = user_agent or self.user_agent
+        return parser.can_fetch(agent, url), parser.crawl_delay(agent)
+
     def crawl_delay(self, url: str, user_agent: Optional[str] = None) -> Optional[float]:
         """
         Get the crawl delay for the given URL and user agent.
@@ -1,15 +1,58 @@
 import logging
 import requests
-from urllib.parse import urlparse
+from requests.adapters import HTTPAdapter
+from urllib3.util.request import ACCEPT_ENCODING
+from urllib3.util.retry import Retry
 from typing import Optional, Dict, Any, List, Callable, Union
 import time
 
 from web_scraper.core.robots_parser import RobotsParser
 from web_scraper.core.rate_limiter import RateLimiter
 from web_scraper.utils.user_agent import UserAgentRotator
+from web_scraper.utils.url_utils import split_origin, get_domain
 
 logger = logging.getLogger(__name__)
 
+# Number of hosts whose keep-alive connection pools the session keeps open
+MAX_POOLED_HOSTS = 64
+
+# Response statuses that are retried (rate limiting and transient server errors)
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+# Size of the chunks response bodies are read in
+BODY_CHUNK_SIZE = 64 * 1024
+
+
+def build_retry(max_retries: int, backoff_factor: float, jitter: float) -> Retry:
+    """
+    Build the urllib3 retry policy used by the session's connection pools.
+    
+    Connection errors, timeouts and 429/5xx responses are retried with
+    exponential backoff, honouring Retry-After headers. When the retries run
+    out the last response is returned, so raise_for_status() reports it.
+    
+    Args:
+        max_retries: Maximum number of retries
+        backoff_factor: Base delay in seconds, doubled on every retry
+        jitter: Maximum random seconds added to each backoff (urllib3 2.x only)
+        
+    Returns:
+        A configured Retry instance
+    """
+    options = {
+        'total': max_retries,
+        'status_forcelist': RETRY_STATUS_CODES,
+        'allowed_methods': ['GET', 'POST', 'HEAD'],
+        'backoff_factor': backoff_factor,
+        'respect_retry_after_header': True,
+        'raise_on_status': False,
+    }
+    try:
+        return Retry(backoff_jitter=jitter, **options)
+    except TypeError:
+        # urllib3 1.x has no backoff_jitter
+        return Retry(**options)
+
 
 class Scraper:
     """
@@ -20,7 +63,9 @@ class Scraper:
                  respect_robots_txt: bool = True,
                  use_fake_useragent: bool = True,
                  max_retries: int = 3,
-                 verify_ssl: bool = True):
+                 verify_ssl: bool = True,
+                 pool_size: int = 10,
+                 max_bytes: int = 10_000_000):
         """
         Initialize the Scraper.
         
@@ -30,15 +75,30 @@ class Scraper:
             use_fake_useragent: Whether to use the fake-useragent library (default: True)
             max_retries: Maximum number of retries for failed requests (default: 3)
             verify_ssl: Whether to verify SSL certificates (default: True)
+            pool_size: Number of concurrent workers sharing the session; sizes the
+                       connection pool so workers don't open throwaway connections (default: 10)
+            max_bytes: Largest response body to accept, in bytes (default: 10,000,000)
         """
         self.rate_limiter = RateLimiter(default_delay=rate_limit, max_retries=max_retries)
         self.robots_parser = RobotsParser() if respect_robots_txt else None
         self.user_agent_rotator = UserAgentRotator(use_fake_useragent=use_fake_useragent)
         self.verify_ssl = verify_ssl
+        self.max_bytes = max_bytes
         
         # Session for connection pooling and cookie persistence
         self.session = requests.Session()
         
+        # Keep pools for many hosts (so interleaved domains don't evict each other)
+        # with enough keep-alive connections per host for every worker, and let
+        # urllib3 retry failed requests inside the pool
+        adapter = HTTPAdapter(
+            pool_connections=max(MAX_POOLED_HOSTS, pool_size),
+            pool_maxsize=pool_size * 2,
+            max_retries=build_retry(max_retries, rate_limit, self.rate_limiter.jitter * rate_limit)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
     def _get_domain(self, url: str) -> str:
         """
         Extract the domain from a URL.
@@ -49,8 +109,7 @@ class Scraper:
         Returns:
             The domain part of the URL
         """
-        parsed_url = urlparse(url)
-        return parsed_url.netloc
+        return get_domain(url)
         
     def can_fetch(self, url: str) -> bool:
         """
@@ -65,6 +124,11 @@ class Scraper:
         if self.robots_parser is None:
             return True
             
+        # Domains without robots.txt rules need no further checking
+        scheme, domain = split_origin(url)
+        if self.robots_parser.allows_all(f"{scheme}://{domain}"):
+            return True
+            
         # Get the current user agent
         user_agent = self.user_agent_rotator.get_random_user_agent()
         self.robots_parser.set_user_agent(user_agent)
@@ -72,7 +136,8 @@ class Scraper:
         return self.robots_parser.can_fetch(url, user_agent)
         
     def _prepare_request(self, url: str, headers: Optional[Dict[str, str]] = None, 
-                         cookies: Optional[Dict[str, str]] = None, **kwargs) -> Dict[str, Any]:
+                         cookies: Optional[Dict[str, str]] = None,
+                         user_agent: Optional[str] = None, **kwargs) -> Dict[str, Any]:
         """
         Prepare the request parameters.
         
@@ -80,32 +145,98 @@ class Scraper:
             url: The URL to request
             headers: Optional additional headers (default: None)
             cookies: Optional cookies to send with the request (default: None)
+            user_agent: User agent to send; a random one is picked if None (default: None)
             **kwargs: Additional keyword arguments to pass to requests
             
         Returns:
             A dictionary of request parameters
         """
-        # Get headers with a random user agent
-        req_headers = self.user_agent_rotator.get_headers(headers)
+        # Get headers with the chosen (or a random) user agent
+        req_headers = self.user_agent_rotator.get_headers(headers, user_agent)
+        
+        # Ask for compressed bodies in every encoding urllib3 can decode here
+        # (includes br/zstd when brotli/zstandard are installed)
+        req_headers.setdefault('Accept-Encoding', ACCEPT_ENCODING)
         
-        # Prepare request parameters
+        # Prepare request parameters; the defaults come first so that any
+        # kwargs (including timeout and verify) override them in one step
         request_params = {
             'url': url,
             'headers': req_headers,
-            'timeout': kwargs.get('timeout', 30),
-            'verify': kwargs.get('verify', self.verify_ssl),
+            'timeout': 30,
+            'verify': self.verify_ssl,
+            **kwargs
         }
         
         if cookies:
             request_params['cookies'] = cookies
             
-        # Add any other kwargs
-        for key, value in kwargs.items():
-            if key not in request_params:
-                request_params[key] = value
-                
         return request_params
         
+    def _read_body(self, response: requests.Response, url: str) -> None:
+        """
+        Read a streamed response body into memory, refusing oversized bodies.
+        
+        Args:
+            response: A response requested with stream=True
+            url: The requested URL (for error messages)
+            
+        Raises:
+            ValueError: If the body is larger than max_bytes
+        """
+        try:
+            content_length = int(response.headers.get('Content-Length', 0))
+        except ValueError:
+            content_length = 0
+            
+        # Refuse declared oversized bodies without downloading them
+        if content_length > self.max_bytes:
+            response.close()
+            raise ValueError(f"Response from {url} is {content_length} bytes, over the {self.max_bytes} byte limit")
+            
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(BODY_CHUNK_SIZE):
+            size += len(chunk)
+            if size > self.max_bytes:
+                response.close()
+                raise ValueError(f"Response from {url} exceeds the {self.max_bytes} byte limit")
+            chunks.append(chunk)
+            
+        response._content = b"".join(chunks)
+        
+        # The body has been consumed, so this returns the connection to the pool
+        response.close()
+        
+    def _send(self, method: Callable[..., requests.Response], request_params: Dict[str, Any]) -> requests.Response:
+        """
+        Send a request and check its status.
+        
+        Unless the caller asked for a streamed response, the body is streamed
+        and read with a size limit, so huge pages can't exhaust memory.
+        
+        Args:
+            method: The session method to call (e.g. self.session.get)
+            request_params: Parameters returned by _prepare_request()
+            
+        Returns:
+            A requests.Response object
+        """
+        read_body = 'stream' not in request_params
+        if read_body:
+            request_params['stream'] = True
+            
+        # Retries and backoff are handled by the adapter's urllib3 Retry policy
+        response = method(**request_params)
+        
+        if read_body:
+            self._read_body(response, request_params['url'])
+            
+        # Check the response status code
+        response.raise_for_status()
+        
+        return response
+        
     def get(self, url: str, headers: Optional[Dict[str, str]] = None, 
             cookies: Optional[Dict[str, str]] = None, **kwargs) -> requests.Response:
         """
@@ -122,36 +253,35 @@ class Scraper:
             
         Raises:
             requests.RequestException: If the request fails
+            ValueError: If the response body is larger than max_bytes
         """
-        domain = self._get_domain(url)
+        # Split the URL once; the origin is reused for robots.txt and rate limiting
+        scheme, domain = split_origin(url)
+        base_url = f"{scheme}://{domain}"
         
-        # Check robots.txt if needed
-        if self.robots_parser and not self.can_fetch(url):
-            logger.warning(f"URL {url} is disallowed by robots.txt")
-            raise PermissionError(f"URL {url} is disallowed by robots.txt")
+        # Pick the user agent once; it is used for robots.txt and the request
+        user_agent = self.user_agent_rotator.get_random_user_agent()
+        
+        # Check robots.txt if needed (one parser lookup for permission and delay),
+        # skipping domains whose robots.txt allows everything
+        crawl_delay = None
+        if self.robots_parser and not self.robots_parser.allows_all(base_url):
+            allowed, crawl_delay = self.robots_parser.check(url, user_agent, base_url)
+            if not allowed:
+                logger.warning(f"URL {url} is disallowed by robots.txt")
+                raise PermissionError(f"URL {url} is disallowed by robots.txt")
             
         # Respect rate limiting
         self.rate_limiter.wait(domain)
         
         # Set custom delay from robots.txt if available
-        if self.robots_parser:
-            crawl_delay = self.robots_parser.crawl_delay(url)
-            if crawl_delay:
-                self.rate_limiter.set_domain_delay(domain, crawl_delay)
+        if crawl_delay:
+            self.rate_limiter.set_domain_delay(domain, crawl_delay)
                 
         # Prepare the request
-        request_params = self._prepare_request(url, headers, cookies, **kwargs)
+        request_params = self._prepare_request(url, headers, cookies, user_agent, **kwargs)
         
-        # Make the request with retries and backoff
-        def _make_request():
-            return self.session.get(**request_params)
-            
-        response = self.rate_limiter.retry_with_backoff(_make_request)
-        
-        # Check the response status code
-        response.raise_for_status()
-        
-        return response
+        return self._send(self.session.get, request_params)
         
     def post(self, url: str, data: Optional[Dict[str, Any]] = None, 
              json: Optional[Dict[str, Any]] = None, 
@@ -173,11 +303,18 @@ class Scraper:
             
         Raises:
             requests.RequestException: If the request fails
+            ValueError: If the response body is larger than max_bytes
         """
-        domain = self._get_domain(url)
+        # Split the URL once; the origin is reused for robots.txt and rate limiting
+        scheme, domain = split_origin(url)
+        base_url = f"{scheme}://{domain}"
+        
+        # Pick the user agent once; it is used for robots.txt and the request
+        user_agent = self.user_agent_rotator.get_random_user_agent()
         
-        # Check robots.txt if needed
-        if self.robots_parser and not self.can_fetch(url):
+        # Check robots.txt if needed, skipping domains whose robots.txt allows everything
+        if (self.robots_parser and not self.robots_parser.allows_all(base_url)
+                and not self.robots_parser.check(url, user_agent, base_url)[0]):
             logger.warning(f"URL {url} is disallowed by robots.txt")
             raise PermissionError(f"URL {url} is disallowed by robots.txt")
             
@@ -185,7 +322,7 @@ class Scraper:
         self.rate_limiter.wait(domain)
         
         # Prepare the request
-        request_params = self._prepare_request(url, headers, cookies, **kwargs)
+        request_params = self._prepare_request(url, headers, cookies, user_agent, **kwargs)
         
         # Add data or JSON parameters
         if data:
@@ -193,16 +330,7 @@ class Scraper:
         if json:
             request_params['json'] = json
             
-        # Make the request with retries and backoff
-        def _make_request():
-            return self.session.post(**request_params)
-            
-        response = self.rate_limiter.retry_with_backoff(_make_request)
-        
-        # Check the response status code
-        response.raise_for_status()
-        
-        return response
+        return self._send(self.session.post, request_params)
         
     def close(self) -> None:
         """
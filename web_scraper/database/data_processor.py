@@ -1,14 +1,442 @@
 import logging
 import json
+from abc import ABC, abstractmethod
+import concurrent.futures
 import csv
+import functools
+import importlib.util
+import itertools
 import os
-import pandas as pd
 import sqlite3
-from typing import List, Dict, Any, Optional, Union, Callable
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Union, Callable, Iterable, Iterator
 from pathlib import Path
 
+if TYPE_CHECKING:
+    import pandas as pd
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
 logger = logging.getLogger(__name__)
 
+# pandas (and pyarrow) take a good part of a second to import and most of
+# DataProcessor doesn't need them, so they are imported on first use
+_pd = None
+_HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
+
+# Number of records encoded at a time when writing a JSON array with orjson
+JSON_WRITE_BATCH = 1000
+
+# Size in bytes above which load_from_json() parses a JSON array incrementally
+JSON_STREAM_THRESHOLD = 64 * 1024 * 1024
+
+# Types of the values that can be missing (None or NaN)
+_MISSING_TYPES = frozenset((type(None), float))
+
+# Value types compared as they are when looking for duplicate records
+_HASHABLE_TYPES = (str, int, float, bool, type(None))
+
+
+def _is_missing(value: Any) -> bool:
+    """
+    Check whether a value is missing (None or NaN), as pandas' isna() would.
+    """
+    return value is None or (isinstance(value, float) and value != value)
+
+
+def _missing_to_none(value: Any) -> Any:
+    """
+    Map missing values (None or NaN) to None, so that they compare equal.
+    """
+    return None if _is_missing(value) else value
+
+
+def _apply_transform(transform_func: Callable[[Dict[str, Any]], Dict[str, Any]],
+                     item: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Apply a transformation to a data item, keeping the original item on error.
+    """
+    try:
+        return transform_func(item)
+    except Exception as e:
+        logger.error(f"Error applying transformation: {str(e)}")
+        return item
+
+
+def _drop_duplicates(data: List[Dict[str, Any]], columns: List[str]):
+    """
+    Drop records that repeat an earlier record on all fields with hashable values.
+    
+    Fields are assumed to be hashable until a value shows otherwise, so finding
+    the hashable fields and removing duplicates take a single pass over the
+    records; the pass starts over without a field when an unhashable value
+    (list, dict, ...) turns up in it.
+    
+    Args:
+        data: The records
+        columns: All fields of the records
+        
+    Returns:
+        A tuple of (the first occurrence of each record, the fields compared);
+        the records are returned unchanged if no field is hashable
+    """
+    hashable_columns = list(columns)
+    while hashable_columns:
+        seen = set()
+        unique = []
+        try:
+            for item in data:
+                key = tuple(map(item.get, hashable_columns))
+                # Floats may be NaN, which must match other NaNs (and None)
+                if float in map(type, key):
+                    key = tuple(map(_missing_to_none, key))
+                if key not in seen:
+                    seen.add(key)
+                    unique.append(item)
+            return unique, hashable_columns
+        except TypeError:
+            remaining = [col for col in hashable_columns if _is_hashable(item.get(col))]
+            if len(remaining) == len(hashable_columns):
+                raise
+            hashable_columns = remaining
+            
+    return data, []
+
+
+def _is_hashable(value: Any) -> bool:
+    """
+    Check whether a value can be hashed.
+    """
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
+
+
+def _hashable_value(value: Any) -> Any:
+    """
+    Make a value hashable for duplicate detection: missing values map to None
+    and other unhashable values (lists, dicts, ...) to their JSON text.
+    """
+    if isinstance(value, _HASHABLE_TYPES):
+        return _missing_to_none(value)
+    return json.dumps(value, sort_keys=True, default=str)
+
+
+def _get_pd():
+    """
+    Import pandas on first use.
+    
+    Returns:
+        The pandas module
+    """
+    global _pd
+    if _pd is None:
+        import pandas
+        _pd = pandas
+    return _pd
+
+
+def _iter_json_array(data: List[Any], options: int):
+    """
+    Encode a list as a JSON array with orjson, in chunks of JSON_WRITE_BATCH records.
+    
+    The chunks join to the same bytes as orjson.dumps(data, option=options).
+    
+    Args:
+        data: The records to encode
+        options: orjson option flags
+        
+    Yields:
+        Consecutive pieces of the encoded array
+    """
+    if not data:
+        yield b"[]"
+        return
+        
+    # Each batch is encoded as an array in a single orjson call, which then
+    # loses its brackets; with indentation the records are already nested
+    # one level, as they are in the whole array
+    pretty = options & orjson.OPT_INDENT_2
+    opening, separator, closing = (b"[\n", b",\n", b"\n]") if pretty else (b"[", b",", b"]")
+    trim = len(opening)
+    
+    yield opening
+    for start in range(0, len(data), JSON_WRITE_BATCH):
+        if start:
+            yield separator
+        yield orjson.dumps(data[start:start + JSON_WRITE_BATCH], option=options)[trim:-trim]
+    yield closing
+
+
+class ResultWriter(ABC):
+    """
+    Base class for writers that save scraped records to disk as they arrive.
+    
+    Records are buffered and written in batches, so memory use is bounded by
+    the batch size and results already written survive a crash.
+    """
+    def __init__(self, filepath: str, batch_size: int = 100, remove_duplicates: bool = True):
+        """
+        Initialize the ResultWriter.
+        
+        Args:
+            filepath: Path of the output file
+            batch_size: Number of records to buffer before writing (default: 100)
+            remove_duplicates: Whether to skip records identical to one already written (default: True)
+        """
+        self.filepath = filepath
+        self.batch_size = batch_size
+        self.remove_duplicates = remove_duplicates
+        self.count = 0
+        self._batch: List[Dict[str, Any]] = []
+        self._seen = set()
+        
+    def __enter__(self) -> 'ResultWriter':
+        self.open()
+        return self
+        
+    def __exit__(self, exc_type, exc_value, traceback) -> bool:
+        self.close()
+        return False
+        
+    def write(self, item: Dict[str, Any]) -> None:
+        """
+        Add a record to the output.
+        
+        Args:
+            item: The record to write
+        """
+        if self.remove_duplicates:
+            # Only a fingerprint of each record is kept, not the record itself
+            key = hash(json.dumps(item, sort_keys=True, default=str))
+            if key in self._seen:
+                return
+            self._seen.add(key)
+            
+        self._batch.append(item)
+        self.count += 1
+        
+        if len(self._batch) >= self.batch_size:
+            self.flush()
+            
+    def flush(self) -> None:
+        """
+        Write the buffered records to disk.
+        """
+        if self._batch:
+            self._write_batch(self._batch)
+            self._batch = []
+            
+    @abstractmethod
+    def open(self) -> None:
+        """
+        Open the output file.
+        """
+        
+    def close(self) -> None:
+        """
+        Write any buffered records and close the output file.
+        """
+        self.flush()
+        logger.info(f"Saved {self.count} records to {self.filepath}")
+        
+    @abstractmethod
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        """
+        Write a batch of records to the output file.
+        
+        Args:
+            batch: The records to write
+        """
+
+
+class JSONLinesWriter(ResultWriter):
+    """
+    Writes records to a JSON Lines file, one JSON object per line.
+    """
+    def open(self) -> None:
+        self._file = open(self.filepath, 'wb')
+        
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        if orjson is not None:
+            options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_APPEND_NEWLINE
+            self._file.write(b"".join(orjson.dumps(item, option=options) for item in batch))
+        else:
+            self._file.write("".join(
+                json.dumps(item, ensure_ascii=False) + "\n" for item in batch
+            ).encode('utf-8'))
+        self._file.flush()
+        
+    def close(self) -> None:
+        super().close()
+        self._file.close()
+
+
+class CSVWriter(ResultWriter):
+    """
+    Writes records to a CSV file.
+    
+    The columns are taken from the first batch. Fields that only appear in
+    later records get columns of their own, and the file is then rewritten
+    with the full header when it is closed, so no data is dropped.
+    """
+    def __init__(self, filepath: str, delimiter: str = ',', **kwargs):
+        """
+        Initialize the CSVWriter.
+        
+        Args:
+            filepath: Path of the output file
+            delimiter: The CSV delimiter character (default: ',')
+            **kwargs: Additional arguments for ResultWriter
+        """
+        super().__init__(filepath, **kwargs)
+        self.delimiter = delimiter
+        self._fieldnames: Optional[List[str]] = None
+        self._columns_added = False
+        
+    def open(self) -> None:
+        self._file = open(self.filepath, 'w', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._file, delimiter=self.delimiter)
+        
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        if self._fieldnames is None:
+            self._fieldnames = sorted(set().union(*batch))
+            self._writer.writerow(self._fieldnames)
+        else:
+            new_fields = set().union(*batch).difference(self._fieldnames)
+            if new_fields:
+                # Rows already written end before these columns; close() fixes the header
+                self._fieldnames.extend(sorted(new_fields))
+                self._columns_added = True
+                
+        fieldnames = self._fieldnames
+        self._writer.writerows([item.get(field, '') for field in fieldnames] for item in batch)
+        self._file.flush()
+        
+    def close(self) -> None:
+        super().close()
+        self._file.close()
+        if self._columns_added:
+            self._rewrite_with_full_header()
+            
+    def _rewrite_with_full_header(self) -> None:
+        """
+        Rewrite the file with every column in the header, sorted by name as
+        save_to_csv() writes them, padding the rows written before a column was added.
+        """
+        fieldnames = sorted(self._fieldnames)
+        position = {field: i for i, field in enumerate(self._fieldnames)}
+        positions = [position[field] for field in fieldnames]
+        width = len(positions)
+        
+        temp_path = f"{self.filepath}.tmp"
+        with open(self.filepath, 'r', newline='', encoding='utf-8') as source, \
+                open(temp_path, 'w', newline='', encoding='utf-8') as target:
+            reader = csv.reader(source, delimiter=self.delimiter)
+            writer = csv.writer(target, delimiter=self.delimiter)
+            next(reader, None)  # The header of the first batch
+            writer.writerow(fieldnames)
+            for row in reader:
+                row.extend([''] * (width - len(row)))
+                writer.writerow([row[i] for i in positions])
+        os.replace(temp_path, self.filepath)
+        
+        logger.info(f"Rewrote {self.filepath} with the columns added after the first batch")
+
+
+class SQLiteWriter(ResultWriter):
+    """
+    Writes records to a SQLite table, one executemany() transaction per batch.
+    
+    Columns are added to the table as new fields appear. Lists and dicts are
+    stored as JSON text.
+    """
+    def __init__(self, filepath: str, table_name: str, if_exists: str = 'replace', **kwargs):
+        """
+        Initialize the SQLiteWriter.
+        
+        Args:
+            filepath: Path of the database file
+            table_name: The name of the table to write to
+            if_exists: What to do if the table exists ('fail', 'replace' or 'append')
+            **kwargs: Additional arguments for ResultWriter
+        """
+        super().__init__(filepath, **kwargs)
+        self.table_name = table_name
+        self.if_exists = if_exists
+        self._columns: List[str] = []
+        
+    @staticmethod
+    def _quote(identifier: str) -> str:
+        return '"' + str(identifier).replace('"', '""') + '"'
+        
+    @staticmethod
+    def _to_sql_value(value: Any) -> Any:
+        if value is None or isinstance(value, (str, int, float)):
+            return value
+        if isinstance(value, (list, dict)):
+            return json.dumps(value, ensure_ascii=False, default=str)
+        return str(value)
+        
+    def open(self) -> None:
+        self._conn = sqlite3.connect(self.filepath)
+        table = self._quote(self.table_name)
+        if self.if_exists == 'replace':
+            self._conn.execute(f"DROP TABLE IF EXISTS {table}")
+        else:
+            self._columns = [row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")]
+            if self._columns and self.if_exists == 'fail':
+                self._conn.close()
+                raise ValueError(f"Table '{self.table_name}' already exists")
+        self._conn.commit()
+        
+    def _write_batch(self, batch: List[Dict[str, Any]]) -> None:
+        table = self._quote(self.table_name)
+        
+        # Create the table or add columns for fields we haven't seen yet
+        known = set(self._columns)
+        new_columns = []
+        for item in batch:
+            for key in item:
+                if key not in known:
+                    known.add(key)
+                    new_columns.append(key)
+                    
+        with self._conn:
+            if new_columns:
+                if not self._columns:
+                    columns_sql = ", ".join(self._quote(column) for column in new_columns)
+                    self._conn.execute(f"CREATE TABLE IF NOT EXISTS {table} ({columns_sql})")
+                else:
+                    for column in new_columns:
+                        self._conn.execute(f"ALTER TABLE {table} ADD COLUMN {self._quote(column)}")
+                self._columns.extend(new_columns)
+                
+            columns_sql = ", ".join(self._quote(column) for column in self._columns)
+            placeholders = ", ".join("?" for _ in self._columns)
+            sql = f"INSERT INTO {table} ({columns_sql}) VALUES ({placeholders})"
+            rows = [tuple(map(item.get, self._columns)) for item in batch]
+            try:
+                self._conn.executemany(sql, rows)
+            except (sqlite3.InterfaceError, sqlite3.ProgrammingError):
+                # Some values (lists, dicts, ...) can't be bound as they are;
+                # undo the partly inserted batch and convert them
+                self._conn.rollback()
+                self._conn.executemany(sql, [tuple(map(self._to_sql_value, row)) for row in rows])
+            
+    def close(self) -> None:
+        super().close()
+        self._conn.close()
+
 
 class DataProcessor:
     """
@@ -30,7 +458,8 @@ class DataProcessor:
                   remove_duplicates: bool = True,
                   fill_missing: bool = True,
                   fill_value: Any = "",
-                  required_fields: Optional[List[str]] = None) -> List[Dict[str, Any]]:
+                  required_fields: Optional[List[str]] = None,
+                  return_df: bool = False) -> Union[List[Dict[str, Any]], 'pd.DataFrame']:
         """
         Clean the scraped data.
         
@@ -40,55 +469,70 @@ class DataProcessor:
             fill_missing: Whether to fill missing values (default: True)
             fill_value: The value to use for filling missing values (default: "")
             required_fields: Optional list of required fields to check (default: None)
+            return_df: Return a DataFrame instead of a list of records, for callers
+                       that go on working with pandas (default: False)
             
         Returns:
             The cleaned data
         """
         if not data:
             logger.warning("Empty data provided for cleaning")
-            return []
+            return _get_pd().DataFrame() if return_df else []
             
-        # Convert to DataFrame for easier manipulation
-        df = pd.DataFrame(data)
+        # All fields in order of first appearance; every cleaned record gets each of them
+        columns = list(dict.fromkeys(key for item in data for key in item))
         
-        # Remove duplicates if requested
-        if remove_duplicates and not df.empty:
-            original_count = len(df)
+        # Remove duplicates if requested (a single record can't have any)
+        if remove_duplicates and len(data) > 1:
+            original_count = len(data)
             
-            # Get columns with hashable types (exclude list, dict, etc.)
-            hashable_columns = []
-            for col in df.columns:
-                # Skip columns with unhashable types like lists or dicts
-                if (df[col].dropna().empty or
-                    all(isinstance(x, (str, int, float, bool, type(None))) for x in df[col].dropna())):
-                    hashable_columns.append(col)
-            
-            # Only drop duplicates based on hashable columns if any exist
+            # Compare records on fields with hashable values only (skip list, dict, etc.)
+            data, hashable_columns = _drop_duplicates(data, columns)
             if hashable_columns:
-                df = df.drop_duplicates(subset=hashable_columns)
-                new_count = len(df)
+                new_count = len(data)
                 if original_count != new_count:
                     logger.info(f"Removed {original_count - new_count} duplicate entries")
             else:
                 logger.warning("No hashable columns found for duplicate removal")
                 
-        # Fill missing values if requested
-        if fill_missing and not df.empty:
-            df = df.fillna(fill_value)
+        # Give every record all fields, filling missing values if requested. Records are
+        # laid over a dict of defaults in C; only those holding None or a float (which
+        # may be NaN) need their values checked one by one
+        defaults = dict.fromkeys(columns, fill_value if fill_missing else float('nan'))
+        if fill_missing:
+            cleaned_data = [
+                {**defaults, **item} if _MISSING_TYPES.isdisjoint(map(type, item.values()))
+                else {col: fill_value if _is_missing(item.get(col)) else item[col] for col in columns}
+                for item in data
+            ]
+        else:
+            cleaned_data = [{**defaults, **item} for item in data]
             
         # Check for required fields
-        if required_fields and not df.empty:
+        if required_fields:
+            known_columns = set(columns)
+            missing_counts = {}
             for field in required_fields:
-                if field not in df.columns:
+                if field not in known_columns:
                     logger.warning(f"Required field '{field}' is missing from the data")
                 else:
-                    # Count rows with missing values for this field
-                    missing_count = df[field].isna().sum()
-                    if missing_count > 0:
-                        logger.warning(f"Field '{field}' has {missing_count} missing values")
-                        
-        # Convert back to list of dictionaries
-        cleaned_data = df.to_dict('records')
+                    missing_counts[field] = 0
+                    
+            # Count rows with missing values for all present fields in one pass
+            # (after filling with a non-missing value there can't be any)
+            if missing_counts and not (fill_missing and not _is_missing(fill_value)):
+                for item in cleaned_data:
+                    for field in missing_counts:
+                        if _is_missing(item[field]):
+                            missing_counts[field] += 1
+                            
+            for field, missing_count in missing_counts.items():
+                if missing_count > 0:
+                    logger.warning(f"Field '{field}' has {missing_count} missing values")
+                    
+        if return_df:
+            # The records are complete and ordered, so the columns can be given up front
+            return _get_pd().DataFrame(cleaned_data, columns=columns)
         return cleaned_data
         
     def normalize_text(self, text: str, 
@@ -112,39 +556,57 @@ class DataProcessor:
         if lowercase:
             text = text.lower()
             
-        # Remove extra whitespace if requested
+        # Remove extra whitespace if requested: str.split() splits on runs of the
+        # same (Unicode) whitespace as the regex \s+ and drops leading/trailing
+        # runs, so this collapses and strips in C without a regex
         if remove_extra_spaces:
-            import re
-            text = re.sub(r'\s+', ' ', text)
-            text = text.strip()
+            text = ' '.join(text.split())
             
         return text
         
     def apply_custom_transform(self, data: List[Dict[str, Any]], 
-                              transform_func: Callable[[Dict[str, Any]], Dict[str, Any]]) -> List[Dict[str, Any]]:
+                              transform_func: Callable[[Dict[str, Any]], Dict[str, Any]],
+                              max_workers: Optional[int] = None,
+                              use_processes: bool = False) -> List[Dict[str, Any]]:
         """
         Apply a custom transformation function to each data item.
         
         Args:
             data: The data to transform
             transform_func: A function that takes a data item and returns a transformed version
+            max_workers: Number of workers to transform items in parallel with; None
+                         transforms them one by one in this thread (default: None)
+            use_processes: Use worker processes instead of threads, for CPU-bound
+                           pure-Python transforms; transform_func and the items
+                           must be picklable (default: False)
             
         Returns:
-            The transformed data
+            The transformed data, in the same order
         """
         if not data:
             return []
             
-        transformed_data = []
-        for item in data:
-            try:
-                transformed_item = transform_func(item)
-                transformed_data.append(transformed_item)
-            except Exception as e:
-                logger.error(f"Error applying transformation: {str(e)}")
-                transformed_data.append(item)  # Keep the original item on error
-                
-        return transformed_data
+        if not max_workers:
+            # Transform everything in one C-level pass; when an item fails, the items
+            # before it are kept, the failed one is kept unchanged, and the pass
+            # resumes after it (so no item is transformed twice)
+            transformed = []
+            while len(transformed) < len(data):
+                try:
+                    transformed.extend(map(transform_func, itertools.islice(data, len(transformed), None)))
+                except Exception as e:
+                    logger.error(f"Error applying transformation: {str(e)}")
+                    transformed.append(data[len(transformed)])  # Keep the original item on error
+            return transformed
+            
+        apply = functools.partial(_apply_transform, transform_func)
+        # Threads suit transforms that release the GIL (I/O, regex, lxml, numpy)
+        executor_class = (concurrent.futures.ProcessPoolExecutor if use_processes
+                          else concurrent.futures.ThreadPoolExecutor)
+        with executor_class(max_workers=max_workers) as executor:
+            # map() keeps the order; chunksize batches items per process round trip
+            chunksize = max(1, len(data) // (max_workers * 4))
+            return list(executor.map(apply, data, chunksize=chunksize))
         
     def save_to_json(self, data: List[Dict[str, Any]], 
                     filename: str, 
@@ -166,11 +628,20 @@ class DataProcessor:
         filepath = os.path.join(self.output_dir, filename)
         
         try:
-            with open(filepath, 'w', encoding='utf-8') as f:
+            if orjson is not None:
+                # orjson always emits UTF-8; records are encoded and written in
+                # batches, so the whole document is never held in memory at once
+                options = orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
                 if pretty:
-                    json.dump(data, f, indent=2, ensure_ascii=False)
-                else:
-                    json.dump(data, f, ensure_ascii=False)
+                    options |= orjson.OPT_INDENT_2
+                with open(filepath, 'wb') as f:
+                    f.writelines(_iter_json_array(data, options))
+            else:
+                with open(filepath, 'w', encoding='utf-8') as f:
+                    if pretty:
+                        json.dump(data, f, indent=2, ensure_ascii=False)
+                    else:
+                        json.dump(data, f, ensure_ascii=False)
                     
             logger.info(f"Saved {len(data)} records to JSON file: {filepath}")
             return filepath
@@ -178,18 +649,25 @@ class DataProcessor:
             logger.error(f"Error saving to JSON: {str(e)}")
             raise
             
-    def save_to_csv(self, data: List[Dict[str, Any]], 
+    def save_to_csv(self, data: Iterable[Dict[str, Any]], 
                    filename: str,
                    delimiter: str = ',',
-                   include_header: bool = True) -> str:
+                   include_header: bool = True,
+                   fieldnames: Optional[List[str]] = None) -> str:
         """
         Save data to a CSV file.
         
+        Rows are written as they are taken from data, so with fieldnames given
+        any iterable (e.g. a generator) is streamed to the file without ever
+        being held in memory.
+        
         Args:
-            data: The data to save
+            data: The data to save; a list, or any iterable of records
             filename: The filename to save to (without extension)
             delimiter: The CSV delimiter character (default: ',')
             include_header: Whether to include a header row (default: True)
+            fieldnames: The columns to write, in order; fields not listed are left
+                        out. If None, all fields are written, sorted by name (default: None)
             
         Returns:
             The path to the saved file
@@ -200,27 +678,33 @@ class DataProcessor:
         filepath = os.path.join(self.output_dir, filename)
         
         try:
-            if not data:
-                logger.warning("No data to save to CSV")
-                with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                    f.write('')
-                return filepath
+            # Get all possible fieldnames unless the caller knows them (set.union()
+            # iterates the keys of every record in C); this needs all the records
+            if fieldnames is None:
+                if not isinstance(data, list):
+                    data = list(data)
+                if not data:
+                    logger.warning("No data to save to CSV")
+                    with open(filepath, 'w', newline='', encoding='utf-8') as f:
+                        f.write('')
+                    return filepath
+                fieldnames = sorted(set().union(*data))
                 
-            # Get all possible fieldnames
-            fieldnames = set()
-            for item in data:
-                fieldnames.update(item.keys())
-            fieldnames = sorted(fieldnames)
-            
             with open(filepath, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.DictWriter(f, fieldnames=fieldnames, delimiter=delimiter)
+                # A plain csv.writer fed with rows extracted here avoids DictWriter's
+                # per-row field validation and lookups
+                writer = csv.writer(f, delimiter=delimiter)
                 
                 if include_header:
-                    writer.writeheader()
+                    writer.writerow(fieldnames)
                     
-                writer.writerows(data)
+                # Rows are generated one at a time; zip() advances the counter
+                # only after taking a record, so it ends at the number written
+                counter = itertools.count()
+                writer.writerows([item.get(field, '') for field in fieldnames]
+                                 for item, _ in zip(data, counter))
                 
-            logger.info(f"Saved {len(data)} records to CSV file: {filepath}")
+            logger.info(f"Saved {next(counter)} records to CSV file: {filepath}")
             return filepath
         except Exception as e:
             logger.error(f"Error saving to CSV: {str(e)}")
@@ -254,23 +738,60 @@ class DataProcessor:
                 conn.close()
                 return filepath
                 
-            # Convert to DataFrame for easier saving
-            df = pd.DataFrame(data)
-            
             # Create database directory if it doesn't exist
             os.makedirs(os.path.dirname(filepath), exist_ok=True)
             
-            # Create connection and save
-            conn = sqlite3.connect(filepath)
-            df.to_sql(table_name, conn, if_exists=if_exists, index=False)
-            conn.close()
-            
-            logger.info(f"Saved {len(data)} records to SQLite database: {filepath}, table: {table_name}")
+            # Insert all records with one executemany() in a single transaction,
+            # without building a DataFrame; the writer logs the saved records
+            with SQLiteWriter(filepath, table_name, if_exists=if_exists,
+                              batch_size=len(data), remove_duplicates=False) as writer:
+                for item in data:
+                    writer.write(item)
+                    
             return filepath
         except Exception as e:
             logger.error(f"Error saving to SQLite: {str(e)}")
             raise
             
+    def open_writer(self, filename: str,
+                    output_format: str = 'json',
+                    table_name: str = 'scraped_data',
+                    batch_size: int = 100,
+                    remove_duplicates: bool = True) -> ResultWriter:
+        """
+        Open a writer that saves records incrementally instead of all at once.
+        
+        Use it as a context manager and call write() for each record. JSON output
+        is written as JSON Lines (.jsonl), one record per line.
+        
+        Args:
+            filename: The filename to save to (without extension)
+            output_format: 'json', 'csv' or 'sqlite' (default: 'json')
+            table_name: The table name for SQLite output (default: 'scraped_data')
+            batch_size: Number of records to buffer before writing (default: 100)
+            remove_duplicates: Whether to skip duplicate records (default: True)
+            
+        Returns:
+            A ResultWriter for the requested format
+        """
+        extensions = {'json': '.jsonl', 'csv': '.csv', 'sqlite': '.db'}
+        if output_format not in extensions:
+            raise ValueError(f"Unsupported output format: {output_format}")
+            
+        # Replace a default/explicit extension with the one used for streaming
+        base, ext = os.path.splitext(filename)
+        if ext in ('.json', '.jsonl', '.csv', '.db'):
+            filename = base
+        filepath = os.path.join(self.output_dir, f"{filename}{extensions[output_format]}")
+        
+        options = {'batch_size': batch_size, 'remove_duplicates': remove_duplicates}
+        if output_format == 'json':
+            return JSONLinesWriter(filepath, **options)
+        elif output_format == 'csv':
+            return CSVWriter(filepath, **options)
+        else:
+            return SQLiteWriter(filepath, table_name, **options)
+            
     def load_from_json(self, filename: str) -> List[Dict[str, Any]]:
         """
         Load data from a JSON file.
@@ -287,6 +808,10 @@ class DataProcessor:
         filepath = os.path.join(self.output_dir, filename)
         
         try:
+            # Parse large files incrementally, so the whole text isn't held in memory
+            if ijson is not None and os.path.getsize(filepath) > JSON_STREAM_THRESHOLD:
+                return list(self.iter_from_json(filename))
+                
             with open(filepath, 'r', encoding='utf-8') as f:
                 data = json.load(f)
                 
@@ -296,6 +821,46 @@ class DataProcessor:
             logger.error(f"Error loading from JSON: {str(e)}")
             return []
             
+    def iter_from_json(self, filename: str) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily load records from a JSON file.
+        
+        When ijson is installed, a top-level array is parsed incrementally and
+        its records are yielded as they are read, so memory use does not grow
+        with the file. Otherwise (or for a single top-level object) the file is
+        loaded at once.
+        
+        Args:
+            filename: The filename to load from (without extension)
+            
+        Yields:
+            The loaded records
+        """
+        if not filename.endswith('.json'):
+            filename = f"{filename}.json"
+            
+        filepath = os.path.join(self.output_dir, filename)
+        count = 0
+        
+        try:
+            with open(filepath, 'rb') as f:
+                first_char = f.read(1024).lstrip()[:1]
+                f.seek(0)
+                
+                if ijson is not None and first_char == b'[':
+                    records = ijson.items(f, 'item', use_float=True)
+                else:
+                    data = json.load(f)
+                    records = data if isinstance(data, list) else [data]
+                    
+                for item in records:
+                    count += 1
+                    yield item
+                    
+            logger.info(f"Loaded {count} records from JSON file: {filepath}")
+        except Exception as e:
+            logger.error(f"Error loading from JSON: {str(e)}")
+            
     def load_from_csv(self, filename: str, delimiter: str = ',') -> List[Dict[str, Any]]:
         """
         Load data from a CSV file.
@@ -313,7 +878,18 @@ class DataProcessor:
         filepath = os.path.join(self.output_dir, filename)
         
         try:
-            df = pd.read_csv(filepath, delimiter=delimiter)
+            pd = _get_pd()
+            df = None
+            if _HAS_PYARROW and len(delimiter) == 1:
+                # Arrow's multithreaded parser is much faster on large files
+                try:
+                    df = pd.read_csv(filepath, delimiter=delimiter, engine='pyarrow')
+                except Exception as e:
+                    # e.g. quoted values spanning lines, which it doesn't support
+                    logger.debug(f"pyarrow could not parse {filepath}, using the default parser: {str(e)}")
+                    
+            if df is None:
+                df = pd.read_csv(filepath, delimiter=delimiter)
             data = df.to_dict('records')
             
             logger.info(f"Loaded {len(data)} records from CSV file: {filepath}")
@@ -341,21 +917,36 @@ class DataProcessor:
             
         # Simple concatenation if no merge field
         if merge_on is None:
-            merged = []
-            for dataset in datasets:
-                merged.extend(dataset)
+            # Remove duplicates if requested, comparing all fields; the records
+            # get every field (missing ones as NaN), as a DataFrame round trip did.
+            # The datasets are read in place rather than concatenated first
+            if remove_duplicates and sum(map(len, datasets)) > 1:
+                columns = list(dict.fromkeys(
+                    key for item in itertools.chain.from_iterable(datasets) for key in item
+                ))
+                missing = dict.fromkeys(columns, float('nan'))
+                seen = set()
+                merged = []
+                for item in itertools.chain.from_iterable(datasets):
+                    key = tuple(map(item.get, columns))
+                    try:
+                        # Floats may be NaN, which must match other NaNs
+                        if float in map(type, key):
+                            key = tuple(map(_hashable_value, key))
+                        hash(key)
+                    except TypeError:
+                        key = tuple(map(_hashable_value, key))
+                    if key not in seen:
+                        seen.add(key)
+                        merged.append({**missing, **item})
+                return merged
                 
-            # Remove duplicates if requested
-            if remove_duplicates:
-                df = pd.DataFrame(merged)
-                if not df.empty:
-                    df = df.drop_duplicates()
-                    merged = df.to_dict('records')
-                    
-            return merged
+            return list(itertools.chain.from_iterable(datasets))
             
         # Merge on a specific field
         else:
+            pd = _get_pd()
+            
             # Convert all datasets to DataFrames
             dfs = []
             for i, dataset in enumerate(datasets):
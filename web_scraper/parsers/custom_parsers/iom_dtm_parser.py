@@ -1,7 +1,10 @@
 import logging
-from typing import Dict, Any, List, Optional
-from bs4 import BeautifulSoup
+import concurrent.futures
+import itertools
+from collections import defaultdict
+from typing import Dict, Any, List, Optional, Iterable, Iterator, Tuple, Union
 import re
+import threading
 import json
 import requests
 import os
@@ -9,14 +12,238 @@ from urllib.parse import urljoin, urlparse
 import pandas as pd
 import datetime
 
+import lxml.html
+from lxml import etree
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+# Month numbers by name, for turning report dates into YYYYMM file name stamps
+_MONTHS = {
+    'January': '01', 'February': '02', 'March': '03', 'April': '04',
+    'May': '05', 'June': '06', 'July': '07', 'August': '08',
+    'September': '09', 'October': '10', 'November': '11', 'December': '12',
+}
+
+# Patterns are compiled once at import time instead of on every page
+# Month and year, e.g. "March 2023"
+_DATE_RE = re.compile(r'\b(?P<month>' + '|'.join(_MONTHS) + r')\s+(?P<year>\d{4})\b')
+_COUNTRY_RE = re.compile(r'in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)')
+_CHART_CLASS_RE = re.compile('chart|graph|data-viz|visualization')
+_CHART_TITLE_CLASS_RE = re.compile('title|caption')
+_MAP_CLASS_RE = re.compile('map')
+_MAP_SRC_RE = re.compile('map', re.I)
+_SUMMARY_CLASS_RE = re.compile('summary|abstract|excerpt')
+_CONTENT_ID_RE = re.compile('content|main', re.I)
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w_]')
+
+
+def _compile_statistics(patterns: List[tuple]) -> re.Pattern:
+    """
+    Fuse statistic patterns into one case-insensitive regex.
+    
+    The number (group 1) is matched once, followed by one named group per
+    statistic, so a single finditer() pass over a text finds them all and
+    match.lastgroup tells which statistic matched.
+    
+    Args:
+        patterns: (pattern of the words after the number, statistic name) pairs
+        
+    Returns:
+        The compiled regex
+    """
+    alternatives = '|'.join(f'(?P<{key}>{pattern})' for pattern, key in patterns)
+    return re.compile(fr'(\d+,\d+|\d+)\s+(?:{alternatives})', re.I)
+
+
+# Common patterns in displacement reports
+_DISPLACEMENT_PATTERNS = [
+    (r'(?:displaced|IDPs|refugees)', 'total_displaced'),
+    (r'(?:households|families) displaced', 'households_displaced'),
+    (r'(?:returnees)', 'returnees'),
+    (r'(?:locations)', 'locations')
+]
+_DISPLACEMENT_STATS_RE = _compile_statistics(_DISPLACEMENT_PATTERNS)
+
+# Common patterns in flow monitoring reports
+_MOBILITY_PATTERNS = [
+    (r'(?:migrants|individuals)', 'total_migrants'),
+    (r'(?:movements|flows)', 'total_movements'),
+    (r'(?:flow monitoring points|FMPs)', 'monitoring_points')
+]
+_MOBILITY_STATS_RE = _compile_statistics(_MOBILITY_PATTERNS)
+
+# Tags gathered by name in the single document walk done by IOMDTMParser._collect()
+_COLLECTED_TAGS = frozenset(('title', 'meta', 'h1', 'h2', 'p', 'table', 'main'))
+
+# Every tag _collect() looks at; lxml filters the walk down to these in C
+_WALKED_TAGS = tuple(_COLLECTED_TAGS | {'a', 'div', 'iframe', 'img'})
+
+# Threads writing result files in the background for IOMDTMParser
+WRITE_WORKERS = 2
+
+# Pages sent to a worker process at a time by IOMDTMParser.parse_many()
+PARSE_CHUNKSIZE = 8
+
+# File extensions of downloadable datasets and report files
+_DATASET_EXTENSIONS = frozenset(('.csv', '.xlsx', '.xls', '.json', '.geojson'))
+_DOWNLOAD_EXTENSIONS = frozenset(('.pdf', '.doc', '.docx', '.ppt', '.pptx', '.csv', '.xlsx', '.xls'))
+
+# Elements whose content is never read (BeautifulSoup's get_text() skips them too);
+# parse() drops them from the tree and parse_stream() empties them as they are parsed
+_PRUNED_TAGS = ('script', 'style')
+
+# Text nodes of a page whose pruned elements have been removed or emptied
+_TEXT_XPATH = etree.XPath('//text()')
+
+# Nearest heading before an element, used as the title of captionless tables
+_PRECEDING_HEADING_XPATH = etree.XPath(
+    'preceding::*[self::h1 or self::h2 or self::h3 or self::h4 or self::h5 or self::h6][1]'
+)
+
+
+def _get_text(element: lxml.html.HtmlElement) -> str:
+    """
+    Get the text of an element the way BeautifulSoup's get_text(strip=True) does.
+    
+    Args:
+        element: lxml element
+        
+    Returns:
+        The stripped text fragments of the element, joined together
+    """
+    if not len(element):
+        # Most table cells, links and headings hold a single text node
+        text = element.text
+        return text.strip() if text else ''
+    return ''.join(part.strip() for part in element.itertext())
+
+
+def _split_file_name(href: str) -> Tuple[str, str]:
+    """
+    Get the file name and lowercase extension a link points to.
+    
+    The result matches os.path.basename() and os.path.splitext() applied to
+    urlparse(href).path, but relative and http(s) links are split with
+    str.partition instead, since this runs for every link on a page.
+    
+    Args:
+        href: The href attribute of a link
+        
+    Returns:
+        A tuple of (file name, extension including the dot); either may be empty
+    """
+    # The query string and fragment are not part of the path
+    path = href.partition('#')[0].partition('?')[0]
+    
+    # Neither is the authority of an absolute link
+    scheme, sep, rest = path.partition('://')
+    if sep and scheme.lower() in ('http', 'https'):
+        slash = rest.find('/')
+        path = rest[slash:] if slash != -1 else ''
+        name = path[path.rfind('/') + 1:].partition(';')[0]
+    elif ':' in path or path.startswith('//'):
+        # Other schemes (mailto:, javascript:, ...) and protocol-relative links
+        path = urlparse(href).path
+        name = path[path.rfind('/') + 1:]
+    else:
+        name = path[path.rfind('/') + 1:].partition(';')[0]
+        
+    # Leading dots (as in ".htaccess") do not start an extension
+    dot = name.rfind('.')
+    if dot > 0 and name[:dot].strip('.'):
+        return name, name[dot:].lower()
+    return name, ''
+
+
+def _get_page_text(doc: lxml.html.HtmlElement) -> str:
+    """
+    Get the visible text of a page the way BeautifulSoup's get_text(' ', strip=True) does.
+    
+    Args:
+        doc: lxml document of the page
+        
+    Returns:
+        The stripped text fragments of the page, joined with spaces
+    """
+    return ' '.join(filter(None, map(str.strip, _TEXT_XPATH(doc))))
+
+
+def _encode_json(data: Dict[str, Any]) -> bytes:
+    """
+    Encode data as indented UTF-8 JSON.
+    
+    Args:
+        data: The data to encode
+        
+    Returns:
+        The JSON document
+    """
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+
+
+def _write_file(file_path: str, content: bytes, description: str) -> None:
+    """
+    Write content to a file in a single write, logging the outcome.
+    
+    Runs in the IOMDTMParser write pool, where there is no caller to raise to.
+    
+    Args:
+        file_path: Path of the file to write
+        content: The bytes to write
+        description: What the file holds, for the log message
+    """
+    try:
+        try:
+            f = open(file_path, 'wb')
+        except FileNotFoundError:
+            # The output directory was removed after the parser created it
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            f = open(file_path, 'wb')
+            
+        with f:
+            f.write(content)
+    except OSError as e:
+        logger.error(f"Error writing {file_path}: {str(e)}")
+    else:
+        logger.info(f"Saved {description} to {file_path}")
+
+
+def _class_matches(element: lxml.html.HtmlElement, pattern: re.Pattern) -> bool:
+    """
+    Check an element's class attribute against a pattern.
+    
+    Args:
+        element: The element to check
+        pattern: Compiled pattern searched for in the element's classes
+        
+    Returns:
+        True if the pattern matches the element's class attribute
+    """
+    classes = element.get('class')
+    return classes is not None and pattern.search(classes) is not None
+
 
 class IOMDTMParser:
     """
     Custom parser for IOM's Displacement Tracking Matrix (DTM) to extract 
     displacement and mobility data.
     """
+    # Absolute paths of the output directories already created by an instance
+    _created_dirs = set()
+    
+    # Pool writing result files while the next page is parsed, created on first
+    # use in each process (a pool inherited by a forked process has no threads)
+    _write_pool = None
+    _write_pool_pid = None
+    _write_lock = threading.Lock()
+    
     def __init__(self):
         """
         Initialize the IOMDTMParser.
@@ -24,63 +251,377 @@ class IOMDTMParser:
         self.base_url = "https://dtm.iom.int"
         self.output_dir = "./data/iom_dtm"
         
-        # Create output directories if they don't exist
-        os.makedirs(os.path.join(self.output_dir, "displacement"), exist_ok=True)
-        os.makedirs(os.path.join(self.output_dir, "mobility"), exist_ok=True)
-        os.makedirs(os.path.join(self.output_dir, "reports"), exist_ok=True)
+        # Create output directories if they don't exist (once per process)
+        output_dir = os.path.abspath(self.output_dir)
+        if output_dir not in IOMDTMParser._created_dirs:
+            os.makedirs(os.path.join(self.output_dir, "displacement"), exist_ok=True)
+            os.makedirs(os.path.join(self.output_dir, "mobility"), exist_ok=True)
+            os.makedirs(os.path.join(self.output_dir, "reports"), exist_ok=True)
+            IOMDTMParser._created_dirs.add(output_dir)
         
-    def parse(self, html_content: str, url: str) -> Dict[str, Any]:
+        # lxml parser objects are reusable but not thread-safe, so keep one per thread
+        self._local = threading.local()
+        
+    @classmethod
+    def _save_json(cls, file_path: str, data: Dict[str, Any], description: str) -> None:
         """
-        Parse HTML content from IOM DTM website.
+        Encode data as JSON and write it to a file in the background.
+        
+        The data is encoded before this returns, so the caller may go on to
+        change it. Call flush() to wait for the file to be written.
+        
+        Args:
+            file_path: Path of the file to write
+            data: The data to write
+            description: What the file holds, for the log message
+        """
+        content = _encode_json(data)
+        
+        # The write runs later, so resolve a relative path against the working
+        # directory now rather than whatever it is when the pool gets to it
+        file_path = os.path.abspath(file_path)
+        with cls._write_lock:
+            if cls._write_pool is None or cls._write_pool_pid != os.getpid():
+                cls._write_pool = concurrent.futures.ThreadPoolExecutor(max_workers=WRITE_WORKERS)
+                cls._write_pool_pid = os.getpid()
+            cls._write_pool.submit(_write_file, file_path, content, description)
+            
+    @classmethod
+    def flush(cls) -> None:
+        """
+        Wait until every result file queued by the parsers has been written.
+        
+        Pending writes are also finished when the interpreter exits.
+        """
+        with cls._write_lock:
+            pool, cls._write_pool = cls._write_pool, None
+        if pool is not None:
+            pool.shutdown(wait=True)
+            
+    def _get_lxml_parser(self, encoding: Optional[str] = None) -> lxml.html.HTMLParser:
+        """
+        Get the lxml parser for an encoding in the current thread, creating it on first use.
+        
+        Args:
+            encoding: Encoding of bytes input; None lets lxml detect it (default: None)
+            
+        Returns:
+            A configured lxml.html.HTMLParser
+        """
+        parsers = getattr(self._local, 'parsers', None)
+        if parsers is None:
+            parsers = self._local.parsers = {}
+            
+        parser = parsers.get(encoding)
+        if parser is None:
+            try:
+                parser = lxml.html.HTMLParser(encoding=encoding, remove_comments=True, remove_pis=True)
+            except LookupError:
+                logger.warning(f"Unknown encoding '{encoding}', detecting the encoding instead")
+                parser = self._get_lxml_parser()
+            parsers[encoding] = parser
+        return parser
+        
+    def _parse_document(self, html_content: Union[str, bytes],
+                        encoding: Optional[str] = None) -> lxml.html.HtmlElement:
+        """
+        Parse HTML content into an lxml document, without its script and style elements.
         
         Args:
             html_content: The HTML content to parse
+            encoding: Encoding of bytes content; None lets lxml detect it (default: None)
+            
+        Returns:
+            The root element of the parsed document
+        """
+        parser = self._get_lxml_parser(encoding)
+        if not html_content or not html_content.strip():
+            return lxml.html.document_fromstring("<html></html>", parser=parser)
+            
+        try:
+            doc = lxml.html.document_fromstring(html_content, parser=parser)
+        except ValueError:
+            # lxml refuses str input that carries an XML encoding declaration
+            doc = lxml.html.document_fromstring(html_content.encode('utf-8'),
+                                                parser=self._get_lxml_parser('utf-8'))
+        except etree.ParserError:
+            # Nothing but comments or processing instructions
+            return lxml.html.document_fromstring("<html></html>", parser=parser)
+            
+        # Scripts and styles are often most of a page; dropping them up front
+        # leaves less to walk and lets the page text be read without filtering
+        etree.strip_elements(doc, *_PRUNED_TAGS, with_tail=False)
+        return doc
+        
+    def _collect(self, doc: lxml.html.HtmlElement) -> Dict[str, List[lxml.html.HtmlElement]]:
+        """
+        Group the elements the page parsers use in a single walk over the document.
+        
+        Besides the tags in _COLLECTED_TAGS (by name), this gathers links with an
+        href ('links'), chart containers ('charts'), map images ('maps'),
+        summary blocks ('summaries') and content divs ('content_divs'). Every
+        list is in document order.
+        
+        Args:
+            doc: lxml document of the page
+            
+        Returns:
+            A dictionary of element lists; missing keys give an empty list
+        """
+        elements = defaultdict(list)
+        
+        for el in doc.iter(*_WALKED_TAGS):
+            name = el.tag
+            if name in _COLLECTED_TAGS:
+                elements[name].append(el)
+            elif name == 'a':
+                if el.get('href') is not None:
+                    elements['links'].append(el)
+                continue
+            
+            if name == 'div' or name == 'iframe':
+                if _class_matches(el, _CHART_CLASS_RE):
+                    elements['charts'].append(el)
+            if name == 'img' or name == 'div':
+                src = el.get('src')
+                if src is not None and _MAP_SRC_RE.search(src) and _class_matches(el, _MAP_CLASS_RE):
+                    elements['maps'].append(el)
+            if name == 'div' or name == 'p':
+                if _class_matches(el, _SUMMARY_CLASS_RE):
+                    elements['summaries'].append(el)
+            if name == 'div':
+                el_id = el.get('id')
+                if el_id is not None and _CONTENT_ID_RE.search(el_id):
+                    elements['content_divs'].append(el)
+                    
+        return elements
+        
+    def _first_heading(self, elements: Dict[str, List[lxml.html.HtmlElement]]) -> Optional[lxml.html.HtmlElement]:
+        """
+        Get the first h1 of the page, or the first h2 if it has no h1.
+        
+        Args:
+            elements: Elements of the page grouped by _collect()
+            
+        Returns:
+            The heading element, or None if the page has neither
+        """
+        headings = elements['h1'] or elements['h2']
+        return headings[0] if headings else None
+        
+    def _extract_statistics(self, page_text: str, stats_re: re.Pattern,
+                            patterns: List[tuple]) -> Dict[str, int]:
+        """
+        Extract statistics such as "12,000 displaced" from the text of a page.
+        
+        The text is scanned once, and the first mention of each statistic is used.
+        
+        Args:
+            page_text: Visible text of the page, from _get_page_text()
+            stats_re: Fused regex built by _compile_statistics()
+            patterns: The patterns stats_re was built from, in output order
+            
+        Returns:
+            A dictionary mapping statistic names to numbers
+        """
+        found = {}
+        for match in stats_re.finditer(page_text):
+            key = match.lastgroup
+            if key not in found:
+                found[key] = match.group(1)
+                if len(found) == len(patterns):
+                    break
+                    
+        stats = {}
+        for _, key in patterns:
+            value = found.get(key)
+            if value is not None:
+                # Remove commas from the number; the regex only lets digits through
+                stats[key] = int(value.replace(',', ''))
+                
+        return stats
+        
+    def _collect_links(self, links: List[lxml.html.HtmlElement],
+                       extensions: frozenset) -> List[Dict[str, str]]:
+        """
+        Collect the links that point to files with one of the given extensions.
+        
+        The extension is taken from the path of the link, so query strings and
+        fragments are ignored, and compared case-insensitively.
+        
+        Args:
+            links: Link elements with an href attribute
+            extensions: Lowercase file extensions, including the dot
+            
+        Returns:
+            A list of dictionaries with the url, title and format of each file
+        """
+        files = []
+        for link in links:
+            href = link.get('href')
+            name, ext = _split_file_name(href)
+            if ext in extensions:
+                files.append({
+                    'url': href if href.startswith('http') else urljoin(self.base_url, href),
+                    'title': _get_text(link) or name,
+                    'format': ext[1:]  # File extension without dot
+                })
+                
+        return files
+        
+    def parse(self, html_content: Union[str, bytes], url: str,
+              content_encoding: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Parse HTML content from IOM DTM website.
+        
+        Callers passing the raw response body should pass the charset of its
+        Content-Type header as content_encoding (e.g. response.encoding), which
+        saves detecting the encoding and avoids misreading pages without a
+        charset declaration.
+        
+        Args:
+            html_content: The HTML content to parse (str, or bytes as received)
+            url: The URL the content was retrieved from
+            content_encoding: Encoding of bytes content; None lets lxml detect
+                              it from the document (default: None)
+            
+        Returns:
+            A dictionary containing the parsed data
+        """
+        return self._parse_tree(self._parse_document(html_content, content_encoding), url)
+        
+    def parse_stream(self, chunks: Iterable[Union[str, bytes]], url: str,
+                     content_encoding: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Parse HTML content from IOM DTM website as it arrives in chunks.
+        
+        The document is built incrementally while the chunks are read (e.g. from
+        response.iter_content()), so large pages are never held as one string
+        and parsing overlaps the download. Script and style elements are
+        emptied as soon as they have been parsed; otherwise the result is the
+        same as that of parse().
+        
+        Args:
+            chunks: The HTML content in pieces (either all str or all bytes)
+            url: The URL the content was retrieved from
+            content_encoding: Encoding of bytes chunks; None lets lxml detect
+                              it from the document (default: None)
+            
+        Returns:
+            A dictionary containing the parsed data
+        """
+        try:
+            parser = etree.HTMLPullParser(events=('end',), tag=_PRUNED_TAGS, encoding=content_encoding,
+                                          remove_comments=True, remove_pis=True)
+        except LookupError:
+            logger.warning(f"Unknown encoding '{content_encoding}', detecting the encoding instead")
+            parser = etree.HTMLPullParser(events=('end',), tag=_PRUNED_TAGS,
+                                          remove_comments=True, remove_pis=True)
+        parser.set_element_class_lookup(lxml.html.HtmlElementClassLookup())
+        
+        for chunk in chunks:
+            parser.feed(chunk)
+            for _, element in parser.read_events():
+                element.clear(keep_tail=True)
+                
+        try:
+            doc = parser.close()
+        except etree.XMLSyntaxError:
+            # No content at all
+            doc = None
+        if doc is None:
+            doc = self._parse_document('')
+            
+        return self._parse_tree(doc, url)
+        
+    @classmethod
+    def parse_many(cls, pages: Iterable[Tuple[str, str]],
+                   max_workers: Optional[int] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Parse many IOM DTM pages in parallel worker processes.
+        
+        Each worker process parses its pages with its own IOMDTMParser (and
+        writes the result files itself). Pages that fail to parse are logged
+        and skipped.
+        
+        Args:
+            pages: (html_content, url) pairs; may be a lazy iterable
+            max_workers: Number of worker processes (default: the number of CPUs)
+            
+        Yields:
+            The parsed data of each page, in the order of the pages
+        """
+        max_workers = max_workers or os.cpu_count() or 1
+        window_size = max_workers * PARSE_CHUNKSIZE * 4
+        page_iter = iter(pages)
+        
+        with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+            # Submit a bounded window of pages at a time, so the HTML of a long
+            # iterable of pages is not all read into memory at once
+            while True:
+                window = list(itertools.islice(page_iter, window_size))
+                if not window:
+                    break
+                    
+                for result in executor.map(_parse_page, window, chunksize=PARSE_CHUNKSIZE):
+                    if result is not None:
+                        yield result
+                        
+    def _parse_tree(self, doc: lxml.html.HtmlElement, url: str) -> Dict[str, Any]:
+        """
+        Extract the data of an IOM DTM page from its parsed document.
+        
+        Args:
+            doc: lxml document of the page
             url: The URL the content was retrieved from
             
         Returns:
             A dictionary containing the parsed data
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        elements = self._collect(doc)
         result = {
             'url': url,
             'source': 'IOM DTM',
         }
         
         # Extract page title
-        title_elem = soup.find('title')
-        if title_elem:
-            result['title'] = title_elem.get_text(strip=True)
-        
-        # Extract page metadata
-        meta_tags = soup.find_all('meta')
-        metadata = {}
-        for tag in meta_tags:
-            if tag.get('name') and tag.get('content'):
-                metadata[tag['name']] = tag['content']
-            elif tag.get('property') and tag.get('content'):
-                metadata[tag['property']] = tag['content']
+        if elements['title']:
+            result['title'] = _get_text(elements['title'][0])
+        
+        # Extract page metadata (keyed by the name or, failing that, the property)
+        metadata = {
+            tag.get('name') or tag.get('property'): tag.get('content')
+            for tag in elements['meta']
+            if tag.get('content') and (tag.get('name') or tag.get('property'))
+        }
         result['metadata'] = metadata
         
-        # Determine the type of page and parse accordingly
-        if 'displacement' in url.lower():
-            result.update(self._parse_displacement_page(soup, url))
-        elif 'mobility' in url.lower() or 'flow-monitoring' in url.lower():
-            result.update(self._parse_mobility_page(soup, url))
-        elif 'report' in url.lower() or 'document' in url.lower():
-            result.update(self._parse_report_page(soup, url))
+        # Determine the type of page and parse accordingly (the checks are in
+        # order of precedence, for URLs that contain more than one keyword)
+        lower_url = url.lower()
+        if 'displacement' in lower_url:
+            result.update(self._parse_displacement_page(doc, url, elements, metadata))
+        elif 'mobility' in lower_url or 'flow-monitoring' in lower_url:
+            result.update(self._parse_mobility_page(doc, url, elements, metadata))
+        elif 'report' in lower_url or 'document' in lower_url:
+            result.update(self._parse_report_page(doc, url, elements))
         else:
             # Generic content parsing
-            result.update(self._parse_generic_page(soup, url))
+            result.update(self._parse_generic_page(doc, url, elements))
             
         return result
     
-    def _parse_displacement_page(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _parse_displacement_page(self, doc: lxml.html.HtmlElement, url: str,
+                                 elements: Dict[str, List[lxml.html.HtmlElement]],
+                                 metadata: Dict[str, str]) -> Dict[str, Any]:
         """
         Parse displacement data from DTM.
         
         Args:
-            soup: BeautifulSoup object of the page
+            doc: lxml document of the page
             url: The URL the content was retrieved from
+            elements: Elements of the page grouped by _collect()
+            metadata: The page's meta tags, from parse()
             
         Returns:
             A dictionary containing displacement data
@@ -96,75 +637,48 @@ class IOMDTMParser:
         }
         
         # Extract country information
-        country_elem = soup.find('h1') or soup.find('h2')
-        if country_elem:
-            country_text = country_elem.get_text(strip=True)
+        country_elem = self._first_heading(elements)
+        if country_elem is not None:
+            country_text = _get_text(country_elem)
             result['displacement_data']['country'] = country_text
             
         # Extract date information
-        date_pattern = re.compile(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}')
-        date_match = soup.find(string=date_pattern)
+        page_text = _get_page_text(doc)
+        date_match = _DATE_RE.search(page_text)
         
         if date_match:
-            result['displacement_data']['date'] = date_match.strip()
+            result['displacement_data']['date'] = date_match.group(0)
         else:
             # Try to find in metadata
-            for meta in metadata.items():
-                if 'date' in meta[0].lower():
-                    result['displacement_data']['date'] = meta[1]
-                    break
+            result['displacement_data']['date'] = next(
+                (value for name, value in metadata.items() if 'date' in name.lower()), ''
+            )
         
         # Extract key displacement statistics
-        stats = {}
-        
-        # Common patterns in displacement reports
-        patterns = [
-            (r'(\d+,\d+|\d+)\s+(?:displaced|IDPs|refugees)', 'total_displaced'),
-            (r'(\d+,\d+|\d+)\s+(?:households|families) displaced', 'households_displaced'),
-            (r'(\d+,\d+|\d+)\s+(?:returnees)', 'returnees'),
-            (r'(\d+,\d+|\d+)\s+(?:locations)', 'locations')
-        ]
-        
-        # Look for stats in paragraphs
-        for p in soup.find_all('p'):
-            text = p.get_text(strip=True)
-            for pattern, key in patterns:
-                match = re.search(pattern, text, re.I)
-                if match:
-                    # Remove commas from number and convert to integer if possible
-                    value = match.group(1).replace(',', '')
-                    try:
-                        if '.' in value:
-                            stats[key] = float(value)
-                        else:
-                            stats[key] = int(value)
-                    except ValueError:
-                        stats[key] = value
+        # Look for stats in the text of the page
+        stats = self._extract_statistics(page_text, _DISPLACEMENT_STATS_RE, _DISPLACEMENT_PATTERNS)
         
         result['displacement_data']['statistics'] = stats
         
         # Look for data visualizations or charts
-        chart_elements = soup.find_all(['div', 'iframe'], 
-                                      attrs={'class': re.compile('chart|graph|data-viz|visualization')})
-        
         charts = []
-        for chart in chart_elements:
+        for chart in elements['charts']:
             chart_data = {
-                'type': chart.name,
+                'type': chart.tag,
                 'title': '',
                 'data_source': ''
             }
             
             # Try to extract chart title
-            title_elem = chart.find(['h3', 'h4', 'div'], 
-                                   attrs={'class': re.compile('title|caption')})
-            if title_elem:
-                chart_data['title'] = title_elem.get_text(strip=True)
+            title_elem = next((el for el in chart.iterdescendants('h3', 'h4', 'div')
+                               if _class_matches(el, _CHART_TITLE_CLASS_RE)), None)
+            if title_elem is not None:
+                chart_data['title'] = _get_text(title_elem)
                 
             # Look for embedded iframes (common for Tableau/PowerBI)
-            iframe = chart.find('iframe')
-            if iframe and iframe.get('src'):
-                chart_data['iframe_src'] = iframe['src']
+            iframe = chart.find('.//iframe')
+            if iframe is not None and iframe.get('src'):
+                chart_data['iframe_src'] = iframe.get('src')
                 
             charts.append(chart_data)
             
@@ -172,24 +686,14 @@ class IOMDTMParser:
             result['displacement_data']['visualizations'] = charts
         
         # Look for downloadable datasets
-        datasets = []
-        for link in soup.find_all('a', href=True):
-            href = link['href'].lower()
-            if href.endswith(('.csv', '.xlsx', '.xls', '.json', '.geojson')):
-                dataset = {
-                    'url': href if href.startswith('http') else urljoin(self.base_url, href),
-                    'title': link.get_text(strip=True) or os.path.basename(href),
-                    'format': os.path.splitext(href)[1][1:]  # Get file extension without dot
-                }
-                datasets.append(dataset)
-                
+        datasets = self._collect_links(elements['links'], _DATASET_EXTENSIONS)
+        
         result['displacement_data']['datasets'] = datasets
         
         # Extract tables with more detailed statistics
-        tables = soup.find_all('table')
         table_data = []
         
-        for i, table in enumerate(tables):
+        for table in elements['table']:
             parsed_table = self._parse_table_to_dict(table)
             if parsed_table:
                 table_data.append(parsed_table)
@@ -202,31 +706,32 @@ class IOMDTMParser:
         date_str = result['displacement_data']['date']
         
         if country and date_str:
-            try:
-                # Convert to YYYYMM format
-                date_obj = datetime.datetime.strptime(date_str, '%B %Y')
-                filename = f"{country}_displacement_{date_obj.strftime('%Y%m')}.json"
-            except ValueError:
+            # Convert to YYYYMM format
+            date_match = _DATE_RE.fullmatch(date_str)
+            if date_match:
+                filename = f"{country}_displacement_{date_match['year']}{_MONTHS[date_match['month']]}.json"
+            else:
                 filename = f"{country}_displacement_{datetime.datetime.now().strftime('%Y%m%d')}.json"
         else:
             filename = f"displacement_{datetime.datetime.now().strftime('%Y%m%d')}.json"
             
         file_path = os.path.join(self.output_dir, "displacement", filename)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
-            
-        logger.info(f"Saved displacement data to {file_path}")
+        self._save_json(file_path, result, "displacement data")
             
         return result
     
-    def _parse_mobility_page(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _parse_mobility_page(self, doc: lxml.html.HtmlElement, url: str,
+                             elements: Dict[str, List[lxml.html.HtmlElement]],
+                             metadata: Dict[str, str]) -> Dict[str, Any]:
         """
         Parse mobility (flow monitoring) data from DTM.
         
         Args:
-            soup: BeautifulSoup object of the page
+            doc: lxml document of the page
             url: The URL the content was retrieved from
+            elements: Elements of the page grouped by _collect()
+            metadata: The page's meta tags, from parse()
             
         Returns:
             A dictionary containing mobility data
@@ -242,65 +747,39 @@ class IOMDTMParser:
         }
         
         # Extract region information
-        region_elem = soup.find('h1') or soup.find('h2')
-        if region_elem:
-            region_text = region_elem.get_text(strip=True)
+        region_elem = self._first_heading(elements)
+        if region_elem is not None:
+            region_text = _get_text(region_elem)
             result['mobility_data']['region'] = region_text
             
         # Extract date information
-        date_pattern = re.compile(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}')
-        date_match = soup.find(string=date_pattern)
+        page_text = _get_page_text(doc)
+        date_match = _DATE_RE.search(page_text)
         
         if date_match:
-            result['mobility_data']['date'] = date_match.strip()
+            result['mobility_data']['date'] = date_match.group(0)
         else:
             # Try to find in metadata
-            for meta in metadata.items():
-                if 'date' in meta[0].lower():
-                    result['mobility_data']['date'] = meta[1]
-                    break
+            result['mobility_data']['date'] = next(
+                (value for name, value in metadata.items() if 'date' in name.lower()), ''
+            )
                     
         # Extract key mobility statistics
-        stats = {}
-        
-        # Common patterns in flow monitoring reports
-        patterns = [
-            (r'(\d+,\d+|\d+)\s+(?:migrants|individuals)', 'total_migrants'),
-            (r'(\d+,\d+|\d+)\s+(?:movements|flows)', 'total_movements'),
-            (r'(\d+,\d+|\d+)\s+(?:flow monitoring points|FMPs)', 'monitoring_points')
-        ]
-        
-        # Look for stats in paragraphs
-        for p in soup.find_all('p'):
-            text = p.get_text(strip=True)
-            for pattern, key in patterns:
-                match = re.search(pattern, text, re.I)
-                if match:
-                    # Remove commas from number and convert to integer if possible
-                    value = match.group(1).replace(',', '')
-                    try:
-                        if '.' in value:
-                            stats[key] = float(value)
-                        else:
-                            stats[key] = int(value)
-                    except ValueError:
-                        stats[key] = value
+        # Look for stats in the text of the page
+        stats = self._extract_statistics(page_text, _MOBILITY_STATS_RE, _MOBILITY_PATTERNS)
         
         result['mobility_data']['statistics'] = stats
         
         # Look for maps (common in mobility reports)
         maps = []
-        map_elements = soup.find_all(['img', 'div'], 
-                                    attrs={'class': re.compile('map'),
-                                           'src': re.compile('map', re.I)})
-        
-        for map_elem in map_elements:
+        for map_elem in elements['maps']:
             map_data = {
-                'type': map_elem.name
+                'type': map_elem.tag
             }
             
-            if map_elem.name == 'img' and map_elem.get('src'):
-                map_data['url'] = map_elem['src'] if map_elem['src'].startswith('http') else urljoin(self.base_url, map_elem['src'])
+            src = map_elem.get('src')
+            if map_elem.tag == 'img' and src:
+                map_data['url'] = src if src.startswith('http') else urljoin(self.base_url, src)
                 map_data['alt'] = map_elem.get('alt', '')
             
             maps.append(map_data)
@@ -309,24 +788,14 @@ class IOMDTMParser:
             result['mobility_data']['maps'] = maps
         
         # Look for downloadable datasets
-        datasets = []
-        for link in soup.find_all('a', href=True):
-            href = link['href'].lower()
-            if href.endswith(('.csv', '.xlsx', '.xls', '.json', '.geojson')):
-                dataset = {
-                    'url': href if href.startswith('http') else urljoin(self.base_url, href),
-                    'title': link.get_text(strip=True) or os.path.basename(href),
-                    'format': os.path.splitext(href)[1][1:]  # Get file extension without dot
-                }
-                datasets.append(dataset)
-                
+        datasets = self._collect_links(elements['links'], _DATASET_EXTENSIONS)
+        
         result['mobility_data']['datasets'] = datasets
         
         # Extract tables with more detailed statistics
-        tables = soup.find_all('table')
         table_data = []
         
-        for i, table in enumerate(tables):
+        for table in elements['table']:
             parsed_table = self._parse_table_to_dict(table)
             if parsed_table:
                 table_data.append(parsed_table)
@@ -339,31 +808,30 @@ class IOMDTMParser:
         date_str = result['mobility_data']['date']
         
         if region and date_str:
-            try:
-                # Convert to YYYYMM format
-                date_obj = datetime.datetime.strptime(date_str, '%B %Y')
-                filename = f"{region}_mobility_{date_obj.strftime('%Y%m')}.json"
-            except ValueError:
+            # Convert to YYYYMM format
+            date_match = _DATE_RE.fullmatch(date_str)
+            if date_match:
+                filename = f"{region}_mobility_{date_match['year']}{_MONTHS[date_match['month']]}.json"
+            else:
                 filename = f"{region}_mobility_{datetime.datetime.now().strftime('%Y%m%d')}.json"
         else:
             filename = f"mobility_{datetime.datetime.now().strftime('%Y%m%d')}.json"
             
         file_path = os.path.join(self.output_dir, "mobility", filename)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
-            
-        logger.info(f"Saved mobility data to {file_path}")
+        self._save_json(file_path, result, "mobility data")
             
         return result
     
-    def _parse_report_page(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _parse_report_page(self, doc: lxml.html.HtmlElement, url: str,
+                           elements: Dict[str, List[lxml.html.HtmlElement]]) -> Dict[str, Any]:
         """
         Parse a DTM report page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            doc: lxml document of the page
             url: The URL the content was retrieved from
+            elements: Elements of the page grouped by _collect()
             
         Returns:
             A dictionary containing report data
@@ -380,70 +848,56 @@ class IOMDTMParser:
         }
         
         # Extract report title
-        title_elem = soup.find('h1') or soup.find('h2')
-        if title_elem:
-            result['report_data']['title'] = title_elem.get_text(strip=True)
+        title_elem = self._first_heading(elements)
+        if title_elem is not None:
+            result['report_data']['title'] = _get_text(title_elem)
             
         # Extract date
-        date_pattern = re.compile(r'(January|February|March|April|May|June|July|August|September|October|November|December)\s+\d{4}')
-        date_match = soup.find(string=date_pattern)
+        page_text = _get_page_text(doc)
+        date_match = _DATE_RE.search(page_text)
         
         if date_match:
-            result['report_data']['date'] = date_match.strip()
+            result['report_data']['date'] = date_match.group(0)
         
         # Try to extract country from title or metadata
-        country_pattern = re.compile(r'in\s+([A-Z][a-z]+(?:\s+[A-Z][a-z]+)?)')
         if 'title' in result['report_data']:
-            country_match = re.search(country_pattern, result['report_data']['title'])
+            country_match = _COUNTRY_RE.search(result['report_data']['title'])
             if country_match:
                 result['report_data']['country'] = country_match.group(1)
                 
         # Extract summary
-        summary_elem = soup.find(['div', 'p'], attrs={'class': re.compile('summary|abstract|excerpt')})
-        if summary_elem:
-            result['report_data']['summary'] = summary_elem.get_text(strip=True)
-        else:
+        if elements['summaries']:
+            result['report_data']['summary'] = _get_text(elements['summaries'][0])
+        elif elements['p']:
             # Use first paragraph as summary
-            first_p = soup.find('p')
-            if first_p:
-                result['report_data']['summary'] = first_p.get_text(strip=True)
+            result['report_data']['summary'] = _get_text(elements['p'][0])
                 
         # Look for downloadable files
-        downloads = []
-        for link in soup.find_all('a', href=True):
-            href = link['href'].lower()
-            if href.endswith(('.pdf', '.doc', '.docx', '.ppt', '.pptx', '.csv', '.xlsx', '.xls')):
-                download = {
-                    'url': href if href.startswith('http') else urljoin(self.base_url, href),
-                    'title': link.get_text(strip=True) or os.path.basename(href),
-                    'format': os.path.splitext(href)[1][1:]  # Get file extension without dot
-                }
-                downloads.append(download)
-                
+        downloads = self._collect_links(elements['links'], _DOWNLOAD_EXTENSIONS)
+        
         result['report_data']['downloads'] = downloads
         
         # Save to file
         title = result['report_data']['title'].strip().replace(' ', '_').lower()
-        safe_title = re.sub(r'[^\w_]', '', title)
+        safe_title = _UNSAFE_FILENAME_RE.sub('', title)
         
         filename = f"{safe_title[:50]}_{datetime.datetime.now().strftime('%Y%m%d')}.json"
             
         file_path = os.path.join(self.output_dir, "reports", filename)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
-            
-        logger.info(f"Saved report data to {file_path}")
+        self._save_json(file_path, result, "report data")
             
         return result
     
-    def _parse_generic_page(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _parse_generic_page(self, doc: lxml.html.HtmlElement, url: str,
+                            elements: Dict[str, List[lxml.html.HtmlElement]]) -> Dict[str, Any]:
         """
         Parse any generic DTM page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            doc: lxml document of the page
             url: The URL the content was retrieved from
+            elements: Elements of the page grouped by _collect()
             
         Returns:
             A dictionary containing generic page data
@@ -454,33 +908,34 @@ class IOMDTMParser:
         }
         
         # Extract main content
-        main_content = soup.find('main') or soup.find('div', id=re.compile('content|main', re.I))
-        if main_content:
+        main_content = (elements['main'] or elements['content_divs'] or [None])[0]
+        if main_content is not None:
             # Extract headings
             headings = []
-            for h in main_content.find_all(['h1', 'h2', 'h3', 'h4']):
+            for h in main_content.iterdescendants('h1', 'h2', 'h3', 'h4'):
                 headings.append({
-                    'level': int(h.name[1]),
-                    'text': h.get_text(strip=True)
+                    'level': int(h.tag[1]),
+                    'text': _get_text(h)
                 })
             result['page_details']['headings'] = headings
             
             # Extract paragraphs
-            paragraphs = main_content.find_all('p')
-            result['page_details']['content'] = '\n'.join(p.get_text(strip=True) for p in paragraphs)
+            paragraphs = main_content.iterdescendants('p')
+            result['page_details']['content'] = '\n'.join(_get_text(p) for p in paragraphs)
             
         # Check for data download links
         data_links = []
-        for link in soup.find_all('a', href=True):
-            href = link['href'].lower()
-            link_text = link.get_text(strip=True).lower()
+        for link in elements['links']:
+            href = link.get('href').lower()
+            text = _get_text(link)
+            link_text = text.lower()
             
             # Look for data links
             if any(term in href or term in link_text for term in 
                   ['data', 'download', 'csv', 'excel', 'json', 'geojson']):
                 data_links.append({
                     'url': href if href.startswith('http') else urljoin(self.base_url, href),
-                    'text': link.get_text(strip=True)
+                    'text': text
                 })
                 
         if data_links:
@@ -488,12 +943,12 @@ class IOMDTMParser:
             
         return result
         
-    def _parse_table_to_dict(self, table_elem: BeautifulSoup) -> Optional[Dict[str, Any]]:
+    def _parse_table_to_dict(self, table_elem: lxml.html.HtmlElement) -> Optional[Dict[str, Any]]:
         """
         Parse an HTML table to a dictionary structure.
         
         Args:
-            table_elem: BeautifulSoup table element
+            table_elem: lxml table element
             
         Returns:
             Dictionary representation of the table or None if parsing fails
@@ -501,51 +956,44 @@ class IOMDTMParser:
         try:
             # Get table caption or nearby header as title
             title = ""
-            caption = table_elem.find('caption')
-            if caption:
-                title = caption.get_text(strip=True)
+            caption = table_elem.find('.//caption')
+            if caption is not None:
+                title = _get_text(caption)
             else:
                 # Look for a preceding header
-                prev_elem = table_elem.find_previous(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                if prev_elem:
-                    title = prev_elem.get_text(strip=True)
+                prev_elems = _PRECEDING_HEADING_XPATH(table_elem)
+                if prev_elems:
+                    title = _get_text(prev_elems[0])
+            
+            # Find the rows and their cells once; the header and body both use them
+            row_elems = table_elem.findall('.//tr')
+            row_cells = [list(tr.iterdescendants('td', 'th')) for tr in row_elems]
+            max_cols = max(map(len, row_cells), default=0)
             
             # Extract headers
             headers = []
-            header_row = table_elem.find('tr')
-            if header_row:
-                for th in header_row.find_all(['th']):
-                    headers.append(th.get_text(strip=True))
+            if row_elems:
+                header_row = row_elems[0]
+                for th in header_row.iterdescendants('th'):
+                    headers.append(_get_text(th))
                     
                 # If no th elements, use first row as header
                 if not headers:
-                    for td in header_row.find_all(['td']):
-                        headers.append(td.get_text(strip=True))
+                    for td in header_row.iterdescendants('td'):
+                        headers.append(_get_text(td))
             
             # If still no headers, use generic column names
             if not headers:
-                # Count max columns
-                max_cols = 0
-                for row in table_elem.find_all('tr'):
-                    cols = len(row.find_all(['td', 'th']))
-                    max_cols = max(max_cols, cols)
-                
                 headers = [f"Column {i+1}" for i in range(max_cols)]
+                
+            # Cells past the last header get generic column names
+            column_names = headers + [f"Column {i+1}" for i in range(len(headers), max_cols)]
             
             # Extract rows
             rows = []
-            for tr in table_elem.find_all('tr')[1:]:  # Skip header row
-                cells = tr.find_all(['td', 'th'])
+            for cells in row_cells[1:]:  # Skip header row
                 if cells:
-                    row_data = {}
-                    for i, cell in enumerate(cells):
-                        if i < len(headers):
-                            row_data[headers[i]] = cell.get_text(strip=True)
-                        else:
-                            row_data[f"Column {i+1}"] = cell.get_text(strip=True)
-                    
-                    if row_data:
-                        rows.append(row_data)
+                    rows.append(dict(zip(column_names, map(_get_text, cells))))
             
             return {
                 'title': title,
@@ -559,17 +1007,42 @@ class IOMDTMParser:
             return None
 
 
+# Parser shared by the module-level parse() function, created on first use
+_parser = None
+
+
+def _parse_page(page: Tuple[str, str]) -> Optional[Dict[str, Any]]:
+    """
+    Parse an (html_content, url) page in a worker process of IOMDTMParser.parse_many().
+    
+    Returns None (after logging the error) if the page fails to parse.
+    """
+    html_content, url = page
+    try:
+        return parse(html_content, url)
+    except Exception as e:
+        logger.error(f"Error parsing {url}: {str(e)}")
+        return None
+
+
 # Function version for compatibility with the CLI
-def parse(html_content: str, url: str) -> Dict[str, Any]:
+def parse(html_content: Union[str, bytes], url: str,
+          content_encoding: Optional[str] = None) -> Dict[str, Any]:
     """
     Parse function for CLI compatibility.
     
+    The same IOMDTMParser is reused for every page.
+    
     Args:
         html_content: The HTML content to parse
         url: The URL the content was retrieved from
+        content_encoding: Encoding of bytes content; None lets lxml detect
+                          it from the document (default: None)
         
     Returns:
         A dictionary containing the parsed data
     """
-    parser = IOMDTMParser()
-    return parser.parse(html_content, url) 
\ No newline at end of file
+    global _parser
+    if _parser is None:
+        _parser = IOMDTMParser()
+    return _parser.parse(html_content, url, content_encoding) 
\ No newline at end of file
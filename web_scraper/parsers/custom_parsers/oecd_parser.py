@@ -1,16 +1,164 @@
 import logging
-from typing import Dict, Any, List, Optional
-from bs4 import BeautifulSoup
+import concurrent.futures
+from typing import Dict, Any, List, Optional, Tuple
 import re
+import threading
 import json
 import requests
+from requests.adapters import HTTPAdapter
 import os
 from urllib.parse import urljoin, urlparse
 import pandas as pd
 import datetime
 
+import lxml.html
+from lxml import etree
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from web_scraper.core.scraper import build_retry
+
 logger = logging.getLogger(__name__)
 
+# Connect and read timeouts in seconds for dataset downloads
+DOWNLOAD_TIMEOUT = (5, 30)
+
+# Datasets of a page downloaded at the same time
+DOWNLOAD_WORKERS = 8
+
+# Size of the chunks dataset files are written to disk in
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+
+# File extensions of downloadable data files
+_DATA_EXTENSIONS = ('.csv', '.xlsx', '.xls', '.zip', '.txt')
+
+# Any of the data file extensions anywhere in a link (one scan instead of one per extension)
+_DATA_EXTENSION_RE = re.compile(r'\.(?:csv|xlsx?|zip|txt)')
+
+# Words in the link text that mark a dataset link, per kind of page
+_DATABASE_TERMS = ('dataset', 'database', 'data', 'statistics')
+_INTEGRATION_TERMS = _DATABASE_TERMS + ('indicators',)
+_STATS_TERMS = _DATABASE_TERMS + ('download',)
+
+# Keywords in a dataset link and the type they mark, in priority order; each
+# type is also the subdirectory the dataset's files are saved in
+_DATASET_TYPES = (
+    ('flow', 'migration_flows'),
+    ('stock', 'migration_stocks'),
+    ('integration', 'integration'),
+)
+_DATASET_SUBDIRECTORIES = frozenset(dataset_type for _, dataset_type in _DATASET_TYPES)
+
+# Patterns are compiled once at import time instead of on every page
+_DESCRIPTION_CLASS_RE = re.compile('lead|summary|description')
+_CHART_CLASS_RE = re.compile('chart|graph|visualization')
+_CONTENT_ID_RE = re.compile('content|main', re.I)
+_UNSAFE_FILENAME_RE = re.compile(r'[^\w\s.-]')
+
+# Phrases naming an integration indicator; group 1 is the indicator
+_INDICATOR_PATTERNS = [
+    re.compile(r"(\w+(?:\s+\w+)*)\s+indicator", re.I),
+    re.compile(r"Indicator(?:s)?\s+on\s+(\w+(?:\s+\w+)*)", re.I),
+    re.compile(r"(\w+(?:\s+\w+)*)\s+integration", re.I)
+]
+
+# Elements whose content is never read (BeautifulSoup's get_text() skips them too)
+_PRUNED_TAGS = ('script', 'style')
+
+# Nearest heading before an element, used as the title of captionless tables
+_PRECEDING_HEADING_XPATH = etree.XPath(
+    'preceding::*[self::h1 or self::h2 or self::h3 or self::h4 or self::h5 or self::h6][1]'
+)
+
+
+def _get_text(element: lxml.html.HtmlElement) -> str:
+    """
+    Get the text of an element the way BeautifulSoup's get_text(strip=True) does.
+    
+    Args:
+        element: lxml element
+        
+    Returns:
+        The stripped text fragments of the element, joined together
+    """
+    if not len(element):
+        # Most table cells, links and headings hold a single text node
+        text = element.text
+        return text.strip() if text else ''
+    return ''.join(part.strip() for part in element.itertext())
+
+
+def _class_matches(element: lxml.html.HtmlElement, pattern: re.Pattern) -> bool:
+    """
+    Check an element's class attribute against a pattern.
+    
+    Args:
+        element: The element to check
+        pattern: Compiled pattern searched for in the element's classes
+        
+    Returns:
+        True if the pattern matches the element's class attribute
+    """
+    classes = element.get('class')
+    return classes is not None and pattern.search(classes) is not None
+
+
+def _find_title_and_description(doc: lxml.html.HtmlElement) -> Tuple[str, str]:
+    """
+    Find the title and description of a page in one walk over the document.
+    
+    The title is the first h1. The description is the first p or div whose
+    class marks it as a lead, summary or description, or else the first p.
+    
+    Args:
+        doc: lxml document of the page
+        
+    Returns:
+        The title and description, empty if the page has none
+    """
+    title_elem = None
+    description_elem = None
+    first_p = None
+    for element in doc.iter('h1', 'p', 'div'):
+        if element.tag == 'h1':
+            if title_elem is None:
+                title_elem = element
+        elif description_elem is None and _class_matches(element, _DESCRIPTION_CLASS_RE):
+            description_elem = element
+        elif first_p is None and element.tag == 'p':
+            first_p = element
+            
+        # Nothing later in the page can change the result
+        if title_elem is not None and description_elem is not None:
+            break
+            
+    if description_elem is None:
+        description_elem = first_p
+        
+    title = _get_text(title_elem) if title_elem is not None else ''
+    description = _get_text(description_elem) if description_elem is not None else ''
+    return title, description
+
+
+def _write_json(file_path: str, data: Dict[str, Any]) -> None:
+    """
+    Write data to a file as indented UTF-8 JSON in a single write.
+    
+    Args:
+        file_path: Path of the file to write
+        data: The data to write
+    """
+    if orjson is not None:
+        content = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        content = json.dumps(data, indent=2, ensure_ascii=False).encode('utf-8')
+        
+    with open(file_path, 'wb') as f:
+        f.write(content)
+
 
 class OECDParser:
     """
@@ -32,6 +180,64 @@ class OECDParser:
         os.makedirs(os.path.join(self.output_dir, "integration"), exist_ok=True)
         os.makedirs(os.path.join(self.output_dir, "reports"), exist_ok=True)
         
+        # Session for dataset downloads, so files from the same host reuse
+        # keep-alive connections instead of a new TCP/TLS handshake each, and
+        # transient failures are retried inside the connection pool
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=build_retry(max_retries=3, backoff_factor=0.3, jitter=0)
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # lxml parser objects are reusable but not thread-safe, so keep one per thread
+        self._local = threading.local()
+        
+    def _get_lxml_parser(self) -> lxml.html.HTMLParser:
+        """
+        Get the lxml parser for the current thread, creating it on first use.
+        
+        Returns:
+            A configured lxml.html.HTMLParser
+        """
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            # Comments are kept: removing them would merge the text around them,
+            # and itertext() skips them anyway
+            parser = lxml.html.HTMLParser()
+            self._local.parser = parser
+        return parser
+        
+    def _parse_document(self, html_content: str) -> lxml.html.HtmlElement:
+        """
+        Parse HTML content into an lxml document, with its script and style elements emptied.
+        
+        Args:
+            html_content: The HTML content to parse
+            
+        Returns:
+            The root element of the parsed document
+        """
+        parser = self._get_lxml_parser()
+        if not html_content or not html_content.strip():
+            return lxml.html.document_fromstring("<html></html>", parser=parser)
+            
+        try:
+            doc = lxml.html.document_fromstring(html_content, parser=parser)
+        except ValueError:
+            # lxml refuses str input that carries an XML encoding declaration
+            doc = lxml.html.document_fromstring(html_content.encode('utf-8'), parser=parser)
+        except etree.ParserError:
+            # Nothing but comments or processing instructions
+            return lxml.html.document_fromstring("<html></html>", parser=parser)
+            
+        # Emptied rather than removed, so the text around them stays separate
+        for element in doc.iter(*_PRUNED_TAGS):
+            element.clear(keep_tail=True)
+        return doc
+        
     def parse(self, html_content: str, url: str) -> Dict[str, Any]:
         """
         Parse HTML content from OECD website.
@@ -43,118 +249,71 @@ class OECDParser:
         Returns:
             A dictionary containing the parsed data
         """
-        soup = BeautifulSoup(html_content, 'html.parser')
+        doc = self._parse_document(html_content)
         result = {
             'url': url,
             'source': 'OECD',
         }
         
         # Extract page title
-        title_elem = soup.find('title')
-        if title_elem:
-            result['title'] = title_elem.get_text(strip=True)
+        title_elem = doc.find('.//title')
+        if title_elem is not None:
+            result['title'] = _get_text(title_elem)
         
         # Extract page metadata
-        meta_tags = soup.find_all('meta')
         metadata = {}
-        for tag in meta_tags:
+        for tag in doc.iter('meta'):
             if tag.get('name') and tag.get('content'):
-                metadata[tag['name']] = tag['content']
+                metadata[tag.get('name')] = tag.get('content')
             elif tag.get('property') and tag.get('content'):
-                metadata[tag['property']] = tag['content']
+                metadata[tag.get('property')] = tag.get('content')
         result['metadata'] = metadata
         
         # Determine the type of page and parse accordingly
         if 'migration' in url.lower() and 'database' in url.lower():
-            result.update(self._parse_migration_database_page(soup, url))
+            result.update(self._parse_migration_database_page(doc, url))
         elif 'migration' in url.lower() and 'integration' in url.lower():
-            result.update(self._parse_integration_page(soup, url))
+            result.update(self._parse_integration_page(doc, url))
         elif 'stat' in url.lower() or 'data' in url.lower():
-            result.update(self._parse_stats_page(soup, url))
+            result.update(self._parse_stats_page(doc, url))
         else:
             # Generic page parsing
-            result.update(self._parse_generic_page(soup, url))
+            result.update(self._parse_generic_page(doc, url))
             
         return result
     
-    def _parse_migration_database_page(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _parse_migration_database_page(self, doc: lxml.html.HtmlElement, url: str) -> Dict[str, Any]:
         """
         Parse a migration database page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            doc: lxml document of the page
             url: The URL the content was retrieved from
             
         Returns:
             A dictionary containing migration database information
         """
+        # Extract page title and description
+        title, description = _find_title_and_description(doc)
+        
         result = {
             'content_type': 'migration_database',
             'database_info': {
-                'title': '',
-                'description': '',
+                'title': title,
+                'description': description,
                 'datasets': []
             }
         }
         
-        # Extract page title
-        title_elem = soup.find('h1')
-        if title_elem:
-            result['database_info']['title'] = title_elem.get_text(strip=True)
-            
-        # Extract description
-        description_elem = soup.find(['p', 'div'], class_=re.compile('lead|summary|description'))
-        if description_elem:
-            result['database_info']['description'] = description_elem.get_text(strip=True)
-        else:
-            # Use first paragraph as description
-            first_p = soup.find('p')
-            if first_p:
-                result['database_info']['description'] = first_p.get_text(strip=True)
-        
         # Look for dataset links
-        datasets = []
-        for link in soup.find_all('a', href=True):
-            href = link['href'].lower()
-            link_text = link.get_text(strip=True)
-            
-            # Check for data files or database links
-            if (any(ext in href for ext in ['.csv', '.xlsx', '.xls', '.zip', '.txt']) or 
-                any(term in link_text.lower() for term in ['dataset', 'database', 'data', 'statistics'])):
-                
-                dataset = {
-                    'url': href if href.startswith('http') else urljoin(self.base_url, href),
-                    'title': link_text,
-                }
-                
-                # Try to determine the type of dataset
-                if 'flow' in href.lower() or 'flow' in link_text.lower():
-                    dataset['type'] = 'migration_flows'
-                elif 'stock' in href.lower() or 'stock' in link_text.lower():
-                    dataset['type'] = 'migration_stocks'
-                elif 'integration' in href.lower() or 'integration' in link_text.lower():
-                    dataset['type'] = 'integration'
-                else:
-                    dataset['type'] = 'other'
-                    
-                # Check if it's a direct download
-                if any(href.endswith(ext) for ext in ['.csv', '.xlsx', '.xls', '.zip', '.txt']):
-                    dataset['is_direct_download'] = True
-                    dataset['format'] = os.path.splitext(href)[1][1:]  # Get file extension without dot
-                    
-                    # Try to download the file
-                    if dataset.get('is_direct_download', False):
-                        try:
-                            self._download_dataset(dataset)
-                        except Exception as e:
-                            logger.error(f"Error downloading dataset: {e}")
-                
-                datasets.append(dataset)
-                
+        datasets = self._find_datasets(doc, _DATABASE_TERMS)
+        
         result['database_info']['datasets'] = datasets
+        self._download_datasets([(dataset, None) for dataset in datasets
+                                 if dataset.get('is_direct_download')])
         
         # Extract tables that might contain metadata about the database
-        tables = soup.find_all('table')
+        tables = doc.iter('table')
         table_data = []
         
         for i, table in enumerate(tables):
@@ -171,72 +330,53 @@ class OECDParser:
             
         file_path = os.path.join(self.output_dir, "reports", filename)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        _write_json(file_path, result)
             
         logger.info(f"Saved migration database info to {file_path}")
             
         return result
     
-    def _parse_integration_page(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _parse_integration_page(self, doc: lxml.html.HtmlElement, url: str) -> Dict[str, Any]:
         """
         Parse a migration integration indicators page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            doc: lxml document of the page
             url: The URL the content was retrieved from
             
         Returns:
             A dictionary containing integration indicators information
         """
+        # Extract page title and description
+        title, description = _find_title_and_description(doc)
+        
         result = {
             'content_type': 'integration_indicators',
             'integration_info': {
-                'title': '',
-                'description': '',
+                'title': title,
+                'description': description,
                 'indicators': [],
                 'datasets': []
             }
         }
         
-        # Extract page title
-        title_elem = soup.find('h1')
-        if title_elem:
-            result['integration_info']['title'] = title_elem.get_text(strip=True)
-            
-        # Extract description
-        description_elem = soup.find(['p', 'div'], class_=re.compile('lead|summary|description'))
-        if description_elem:
-            result['integration_info']['description'] = description_elem.get_text(strip=True)
-        else:
-            # Use first paragraph as description
-            first_p = soup.find('p')
-            if first_p:
-                result['integration_info']['description'] = first_p.get_text(strip=True)
-        
         # Look for integration indicators
-        indicator_patterns = [
-            r"(\w+(?:\s+\w+)*)\s+indicator",
-            r"Indicator(?:s)?\s+on\s+(\w+(?:\s+\w+)*)",
-            r"(\w+(?:\s+\w+)*)\s+integration"
-        ]
-        
         indicators = []
-        for p in soup.find_all('p'):
-            text = p.get_text(strip=True)
-            for pattern in indicator_patterns:
-                matches = re.finditer(pattern, text, re.I)
+        for p in doc.iter('p'):
+            text = _get_text(p)
+            for pattern in _INDICATOR_PATTERNS:
+                matches = pattern.finditer(text)
                 for match in matches:
                     indicator = match.group(1).strip()
                     if indicator and indicator not in indicators:
                         indicators.append(indicator)
                         
         # Also check list items for indicators
-        for li in soup.find_all('li'):
-            text = li.get_text(strip=True)
+        for li in doc.iter('li'):
+            text = _get_text(li)
             if any(term in text.lower() for term in ['indicator', 'measure', 'integration', 'index']):
-                for pattern in indicator_patterns:
-                    matches = re.finditer(pattern, text, re.I)
+                for pattern in _INDICATOR_PATTERNS:
+                    matches = pattern.finditer(text)
                     for match in matches:
                         indicator = match.group(1).strip()
                         if indicator and indicator not in indicators:
@@ -245,48 +385,25 @@ class OECDParser:
         result['integration_info']['indicators'] = indicators
         
         # Look for dataset links
-        datasets = []
-        for link in soup.find_all('a', href=True):
-            href = link['href'].lower()
-            link_text = link.get_text(strip=True)
-            
-            # Check for data files or database links
-            if (any(ext in href for ext in ['.csv', '.xlsx', '.xls', '.zip', '.txt']) or 
-                any(term in link_text.lower() for term in ['dataset', 'database', 'data', 'statistics', 'indicators'])):
-                
-                dataset = {
-                    'url': href if href.startswith('http') else urljoin(self.base_url, href),
-                    'title': link_text,
-                }
-                
-                # Check if it's a direct download
-                if any(href.endswith(ext) for ext in ['.csv', '.xlsx', '.xls', '.zip', '.txt']):
-                    dataset['is_direct_download'] = True
-                    dataset['format'] = os.path.splitext(href)[1][1:]  # Get file extension without dot
-                    
-                    # Try to download the file
-                    if dataset.get('is_direct_download', False):
-                        try:
-                            self._download_dataset(dataset, subdirectory="integration")
-                        except Exception as e:
-                            logger.error(f"Error downloading dataset: {e}")
-                
-                datasets.append(dataset)
-                
+        datasets = self._find_datasets(doc, _INTEGRATION_TERMS, classify=False)
+        
         result['integration_info']['datasets'] = datasets
+        self._download_datasets([(dataset, "integration") for dataset in datasets
+                                 if dataset.get('is_direct_download')])
         
         # Extract visualizations and charts
         charts = []
-        chart_elements = soup.find_all(['div', 'img'], 
-                                      attrs={'class': re.compile('chart|graph|visualization')})
+        chart_elements = (el for el in doc.iter('div', 'img')
+                          if _class_matches(el, _CHART_CLASS_RE))
         
         for chart_elem in chart_elements:
             chart = {
-                'type': chart_elem.name
+                'type': chart_elem.tag
             }
             
-            if chart_elem.name == 'img' and chart_elem.get('src'):
-                chart['url'] = chart_elem['src'] if chart_elem['src'].startswith('http') else urljoin(self.base_url, chart_elem['src'])
+            src = chart_elem.get('src')
+            if chart_elem.tag == 'img' and src:
+                chart['url'] = src if src.startswith('http') else urljoin(self.base_url, src)
                 chart['alt'] = chart_elem.get('alt', '')
                 
             charts.append(chart)
@@ -300,51 +417,38 @@ class OECDParser:
             
         file_path = os.path.join(self.output_dir, "integration", filename)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        _write_json(file_path, result)
             
         logger.info(f"Saved integration indicators info to {file_path}")
             
         return result
     
-    def _parse_stats_page(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _parse_stats_page(self, doc: lxml.html.HtmlElement, url: str) -> Dict[str, Any]:
         """
         Parse a statistics or data page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            doc: lxml document of the page
             url: The URL the content was retrieved from
             
         Returns:
             A dictionary containing statistics data
         """
+        # Extract page title and description
+        title, description = _find_title_and_description(doc)
+        
         result = {
             'content_type': 'statistics',
             'stats_info': {
-                'title': '',
-                'description': '',
+                'title': title,
+                'description': description,
                 'tables': [],
                 'datasets': []
             }
         }
         
-        # Extract page title
-        title_elem = soup.find('h1')
-        if title_elem:
-            result['stats_info']['title'] = title_elem.get_text(strip=True)
-            
-        # Extract description
-        description_elem = soup.find(['p', 'div'], class_=re.compile('lead|summary|description'))
-        if description_elem:
-            result['stats_info']['description'] = description_elem.get_text(strip=True)
-        else:
-            # Use first paragraph as description
-            first_p = soup.find('p')
-            if first_p:
-                result['stats_info']['description'] = first_p.get_text(strip=True)
-        
         # Extract tables
-        tables = soup.find_all('table')
+        tables = doc.iter('table')
         table_data = []
         
         for i, table in enumerate(tables):
@@ -366,69 +470,32 @@ class OECDParser:
         result['stats_info']['tables'] = table_data
         
         # Look for dataset links
-        datasets = []
-        for link in soup.find_all('a', href=True):
-            href = link['href'].lower()
-            link_text = link.get_text(strip=True)
-            
-            # Check for data files or database links
-            if (any(ext in href for ext in ['.csv', '.xlsx', '.xls', '.zip', '.txt']) or 
-                any(term in link_text.lower() for term in ['dataset', 'database', 'data', 'statistics', 'download'])):
-                
-                dataset = {
-                    'url': href if href.startswith('http') else urljoin(self.base_url, href),
-                    'title': link_text,
-                }
-                
-                # Try to determine the type of dataset
-                if 'flow' in href.lower() or 'flow' in link_text.lower():
-                    dataset['type'] = 'migration_flows'
-                    subdir = "migration_flows"
-                elif 'stock' in href.lower() or 'stock' in link_text.lower():
-                    dataset['type'] = 'migration_stocks'
-                    subdir = "migration_stocks"
-                elif 'integration' in href.lower() or 'integration' in link_text.lower():
-                    dataset['type'] = 'integration'
-                    subdir = "integration"
-                else:
-                    dataset['type'] = 'other'
-                    subdir = "reports"
-                    
-                # Check if it's a direct download
-                if any(href.endswith(ext) for ext in ['.csv', '.xlsx', '.xls', '.zip', '.txt']):
-                    dataset['is_direct_download'] = True
-                    dataset['format'] = os.path.splitext(href)[1][1:]  # Get file extension without dot
-                    
-                    # Try to download the file
-                    if dataset.get('is_direct_download', False):
-                        try:
-                            self._download_dataset(dataset, subdirectory=subdir)
-                        except Exception as e:
-                            logger.error(f"Error downloading dataset: {e}")
-                
-                datasets.append(dataset)
-                
+        datasets = self._find_datasets(doc, _STATS_TERMS)
+        
         result['stats_info']['datasets'] = datasets
         
+        # Downloads are saved in the subdirectory of their dataset type
+        self._download_datasets([(dataset, None) for dataset in datasets
+                                 if dataset.get('is_direct_download')])
+        
         # Save to file
         title = result['stats_info']['title'].strip().replace(' ', '_').lower()
         filename = f"{title[:50]}.json" if title else f"stats_{datetime.datetime.now().strftime('%Y%m%d')}.json"
             
         file_path = os.path.join(self.output_dir, "reports", filename)
         
-        with open(file_path, 'w', encoding='utf-8') as f:
-            json.dump(result, f, indent=2, ensure_ascii=False)
+        _write_json(file_path, result)
             
         logger.info(f"Saved statistics info to {file_path}")
             
         return result
     
-    def _parse_generic_page(self, soup: BeautifulSoup, url: str) -> Dict[str, Any]:
+    def _parse_generic_page(self, doc: lxml.html.HtmlElement, url: str) -> Dict[str, Any]:
         """
         Parse any generic OECD page.
         
         Args:
-            soup: BeautifulSoup object of the page
+            doc: lxml document of the page
             url: The URL the content was retrieved from
             
         Returns:
@@ -440,31 +507,37 @@ class OECDParser:
         }
         
         # Extract main content
-        main_content = soup.find('main') or soup.find('div', id=re.compile('content|main', re.I))
-        if main_content:
+        main_content = doc.find('.//main')
+        if main_content is None:
+            main_content = next((el for el in doc.iter('div')
+                                 if el.get('id') is not None and _CONTENT_ID_RE.search(el.get('id'))), None)
+        if main_content is not None:
             # Extract headings
             headings = []
-            for h in main_content.find_all(['h1', 'h2', 'h3', 'h4']):
+            for h in main_content.iterdescendants('h1', 'h2', 'h3', 'h4'):
                 headings.append({
-                    'level': int(h.name[1]),
-                    'text': h.get_text(strip=True)
+                    'level': int(h.tag[1]),
+                    'text': _get_text(h)
                 })
             result['page_details']['headings'] = headings
             
             # Extract paragraphs
-            paragraphs = main_content.find_all('p')
-            result['page_details']['content'] = '\n'.join(p.get_text(strip=True) for p in paragraphs)
+            paragraphs = main_content.iterdescendants('p')
+            result['page_details']['content'] = '\n'.join(_get_text(p) for p in paragraphs)
             
         # Look for migration-related links
         migration_links = []
-        for link in soup.find_all('a', href=True):
-            href = link['href']
-            link_text = link.get_text(strip=True).lower()
+        for link in doc.iter('a'):
+            href = link.get('href')
+            if href is None:
+                continue
+            text = _get_text(link)
+            link_text = text.lower()
             
             if any(term in link_text for term in ['migration', 'immigrant', 'refugee', 'asylum', 'integration']):
                 migration_links.append({
                     'url': href if href.startswith('http') else urljoin(self.base_url, href),
-                    'text': link.get_text(strip=True)
+                    'text': text
                 })
                 
         if migration_links:
@@ -472,6 +545,130 @@ class OECDParser:
             
         return result
     
+    def _find_datasets(self, doc: lxml.html.HtmlElement, terms: Tuple[str, ...],
+                       classify: bool = True) -> List[Dict[str, Any]]:
+        """
+        Find the links to datasets and data files on a page.
+        
+        Args:
+            doc: lxml document of the page
+            terms: Words in the link text that mark a dataset link
+            classify: Whether to set the dataset type from the link (default: True)
+            
+        Returns:
+            A list of dataset dictionaries in page order; direct downloads also
+            have 'is_direct_download' and 'format' set
+        """
+        datasets = []
+        for link in doc.iter('a'):
+            href = link.get('href')
+            if href is None:
+                continue
+                
+            # Lowercase the link once for all of the checks below
+            href = href.lower()
+            link_text = _get_text(link)
+            text_lower = link_text.lower()
+            
+            # Check for data files or database links
+            if not (_DATA_EXTENSION_RE.search(href) or
+                    any(term in text_lower for term in terms)):
+                continue
+                
+            dataset = {
+                'url': href if href.startswith('http') else urljoin(self.base_url, href),
+                'title': link_text,
+            }
+            
+            # Try to determine the type of dataset
+            if classify:
+                # One string holds both, so each keyword is searched once; the
+                # separator stops a keyword from matching across the two
+                combined = f"{href}\x00{text_lower}"
+                dataset['type'] = next(
+                    (dataset_type for keyword, dataset_type in _DATASET_TYPES if keyword in combined),
+                    'other'
+                )
+                    
+            # Check if it's a direct download
+            if href.endswith(_DATA_EXTENSIONS):
+                dataset['is_direct_download'] = True
+                dataset['format'] = os.path.splitext(href)[1][1:]  # Get file extension without dot
+                
+            datasets.append(dataset)
+            
+        return datasets
+        
+    def _download_datasets(self, downloads: List[Tuple[Dict[str, Any], Optional[str]]]) -> None:
+        """
+        Download the datasets of a page in parallel, DOWNLOAD_WORKERS at a time.
+        
+        Downloads saved under the same file name (ignoring the extension, since
+        Excel files are also converted to CSV) run one after another in page
+        order, so the last one wins as when the downloads ran serially.
+        
+        Args:
+            downloads: (dataset, subdirectory) pairs for _download_dataset()
+        """
+        groups = {}
+        for dataset, subdirectory in downloads:
+            stem = os.path.splitext(self._dataset_path(dataset, subdirectory))[0]
+            groups.setdefault(stem, []).append((dataset, subdirectory))
+            
+        if not groups:
+            return
+            
+        with concurrent.futures.ThreadPoolExecutor(max_workers=min(DOWNLOAD_WORKERS, len(groups))) as executor:
+            # The session's connection pool is shared by the threads
+            list(executor.map(self._download_in_order, groups.values()))
+            
+    def _download_in_order(self, downloads: List[Tuple[Dict[str, Any], Optional[str]]]) -> None:
+        """
+        Download datasets one after another, logging any error.
+        
+        Args:
+            downloads: (dataset, subdirectory) pairs for _download_dataset()
+        """
+        for dataset, subdirectory in downloads:
+            try:
+                self._download_dataset(dataset, subdirectory)
+            except Exception as e:
+                logger.error(f"Error downloading dataset: {e}")
+                
+    def _dataset_path(self, dataset: Dict[str, Any], subdirectory: str = None) -> str:
+        """
+        Get the path a dataset is saved to.
+        
+        Args:
+            dataset: Dictionary containing dataset info with at least a 'url' key
+            subdirectory: Subdirectory to save the file in (default: determined from dataset type)
+            
+        Returns:
+            The path of the file under the output directory
+        """
+        # Determine directory
+        if subdirectory is None:
+            dataset_type = dataset.get('type')
+            subdirectory = dataset_type if dataset_type in _DATASET_SUBDIRECTORIES else "reports"
+        
+        # Get filename from URL or dataset title
+        if 'title' in dataset and dataset['title']:
+            # Make a safe filename from title
+            filename = _UNSAFE_FILENAME_RE.sub('', dataset['title']).strip().replace(' ', '_')
+            
+            # Add extension if not present
+            if 'format' in dataset and not filename.endswith('.' + dataset['format']):
+                filename += '.' + dataset['format']
+        else:
+            filename = os.path.basename(urlparse(dataset['url']).path)
+            
+        if not filename:
+            filename = f"dataset_{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
+            if 'format' in dataset:
+                filename += '.' + dataset['format']
+                
+        return os.path.join(self.output_dir, subdirectory, filename)
+        
     def _download_dataset(self, dataset: Dict[str, Any], subdirectory: str = None) -> bool:
         """
         Download a dataset from a URL.
@@ -485,46 +682,17 @@ class OECDParser:
         """
         try:
             url = dataset['url']
-            response = requests.get(url, stream=True)
-            response.raise_for_status()
-            
-            # Determine directory
-            if subdirectory is None:
-                if 'type' in dataset:
-                    if dataset['type'] == 'migration_flows':
-                        subdirectory = "migration_flows"
-                    elif dataset['type'] == 'migration_stocks':
-                        subdirectory = "migration_stocks"
-                    elif dataset['type'] == 'integration':
-                        subdirectory = "integration"
-                    else:
-                        subdirectory = "reports"
-                else:
-                    subdirectory = "reports"
-            
-            # Get filename from URL or dataset title
-            if 'title' in dataset and dataset['title']:
-                # Make a safe filename from title
-                filename = re.sub(r'[^\w\s.-]', '', dataset['title']).strip().replace(' ', '_')
+            # The with block returns the connection to the pool even if the download fails
+            with self.session.get(url, stream=True, timeout=DOWNLOAD_TIMEOUT) as response:
+                response.raise_for_status()
                 
-                # Add extension if not present
-                if 'format' in dataset and not filename.endswith('.' + dataset['format']):
-                    filename += '.' + dataset['format']
-            else:
-                filename = os.path.basename(urlparse(url).path)
+                # Save the file
+                output_path = self._dataset_path(dataset, subdirectory)
                 
-            if not filename:
-                filename = f"dataset_{datetime.datetime.now().strftime('%Y%m%d%H%M%S')}"
-                if 'format' in dataset:
-                    filename += '.' + dataset['format']
-                    
-            # Save the file
-            output_path = os.path.join(self.output_dir, subdirectory, filename)
-            
-            with open(output_path, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
-                    
+                with open(output_path, 'wb') as f:
+                    for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                        f.write(chunk)
+                        
             logger.info(f"Downloaded dataset to {output_path}")
             
             # If it's an Excel file, also save as CSV for easier processing
@@ -543,12 +711,12 @@ class OECDParser:
             logger.error(f"Error downloading dataset: {e}")
             return False
     
-    def _parse_table_to_dict(self, table_elem: BeautifulSoup) -> Optional[Dict[str, Any]]:
+    def _parse_table_to_dict(self, table_elem: lxml.html.HtmlElement) -> Optional[Dict[str, Any]]:
         """
         Parse an HTML table to a dictionary structure.
         
         Args:
-            table_elem: BeautifulSoup table element
+            table_elem: lxml table element
             
         Returns:
             Dictionary representation of the table or None if parsing fails
@@ -556,51 +724,43 @@ class OECDParser:
         try:
             # Get table caption or nearby header as title
             title = ""
-            caption = table_elem.find('caption')
-            if caption:
-                title = caption.get_text(strip=True)
+            caption = table_elem.find('.//caption')
+            if caption is not None:
+                title = _get_text(caption)
             else:
                 # Look for a preceding header
-                prev_elem = table_elem.find_previous(['h1', 'h2', 'h3', 'h4', 'h5', 'h6'])
-                if prev_elem:
-                    title = prev_elem.get_text(strip=True)
+                prev_elems = _PRECEDING_HEADING_XPATH(table_elem)
+                if prev_elems:
+                    title = _get_text(prev_elems[0])
+            
+            # Walk the rows once: the first one holds the headers, the rest the data
+            row_iter = table_elem.iterfind('.//tr')
+            header_row = next(row_iter, None)
             
             # Extract headers
             headers = []
-            header_row = table_elem.find('tr')
-            if header_row:
-                for th in header_row.find_all(['th']):
-                    headers.append(th.get_text(strip=True))
+            if header_row is not None:
+                for th in header_row.iterdescendants('th'):
+                    headers.append(_get_text(th))
                     
                 # If no th elements, use first row as header
                 if not headers:
-                    for td in header_row.find_all(['td']):
-                        headers.append(td.get_text(strip=True))
+                    for td in header_row.iterdescendants('td'):
+                        headers.append(_get_text(td))
             
-            # If still no headers, use generic column names
-            if not headers:
-                # Count max columns
-                max_cols = 0
-                for row in table_elem.find_all('tr'):
-                    cols = len(row.find_all(['td', 'th']))
-                    max_cols = max(max_cols, cols)
-                
-                headers = [f"Column {i+1}" for i in range(max_cols)]
-            
-            # Extract rows
+            # Extract rows; cells past the last header get generic column names
+            column_names = list(headers)
             rows = []
-            for tr in table_elem.find_all('tr')[1:]:  # Skip header row
-                cells = tr.find_all(['td', 'th'])
+            for tr in row_iter:
+                cells = list(tr.iterdescendants('td', 'th'))
                 if cells:
-                    row_data = {}
-                    for i, cell in enumerate(cells):
-                        if i < len(headers):
-                            row_data[headers[i]] = cell.get_text(strip=True)
-                        else:
-                            row_data[f"Column {i+1}"] = cell.get_text(strip=True)
-                    
-                    if row_data:
-                        rows.append(row_data)
+                    if len(cells) > len(column_names):
+                        column_names.extend(f"Column {i+1}" for i in range(len(column_names), len(cells)))
+                    rows.append(dict(zip(column_names, map(_get_text, cells))))
+            
+            # If still no headers, use generic column names for the widest row
+            if not headers:
+                headers = column_names
             
             return {
                 'title': title,
@@ -614,11 +774,17 @@ class OECDParser:
             return None
 
 
+# Parser shared by the module-level parse() function, created on first use
+_parser = None
+
+
 # Function version for compatibility with the CLI
 def parse(html_content: str, url: str) -> Dict[str, Any]:
     """
     Parse function for CLI compatibility.
     
+    The same OECDParser, and so the same download session, is reused for every page.
+    
     Args:
         html_content: The HTML content to parse
         url: The URL the content was retrieved from
@@ -626,5 +792,7 @@ def parse(html_content: str, url: str) -> Dict[str, Any]:
     Returns:
         A dictionary containing the parsed data
     """
-    parser = OECDParser()
-    return parser.parse(html_content, url) 
\ No newline at end of file
+    global _parser
+    if _parser is None:
+        _parser = OECDParser()
+    return _parser.parse(html_content, url) 
\ No newline at end of file
@@ -0,0 +1,372 @@
+import logging
+from typing import Optional, Dict, Any, List, Union, Iterator
+import re
+import threading
+
+import lxml.html
+from lxml import etree
+
+from web_scraper.parsers.html_parser import HTMLParser
+
+logger = logging.getLogger(__name__)
+
+# Text nodes that are part of the rendered page (BeautifulSoup's get_text() skips these too)
+_VISIBLE_TEXT_XPATH = ".//text()[not(ancestor::script) and not(ancestor::style)]"
+
+
+class FastHTMLParser:
+    """
+    Parser for extracting content from HTML pages using lxml and XPath directly.
+
+    Mirrors the extraction API of HTMLParser, but evaluates the queries inside
+    libxml2 instead of walking a BeautifulSoup tree in Python. The "soup"
+    arguments of the *_from_soup methods are lxml documents returned by parse().
+    """
+    def __init__(self):
+        """
+        Initialize the FastHTMLParser.
+        """
+        # Used for the comprehensive extraction, which relies on BeautifulSoup features
+        self._fallback_parser = HTMLParser()
+
+        # lxml parser objects are reusable but not thread-safe, so keep one per thread
+        self._local = threading.local()
+
+    def _get_lxml_parser(self) -> lxml.html.HTMLParser:
+        """
+        Get the lxml parser for the current thread, creating it on first use.
+
+        Returns:
+            A configured lxml.html.HTMLParser
+        """
+        parser = getattr(self._local, 'parser', None)
+        if parser is None:
+            parser = lxml.html.HTMLParser(remove_comments=True, remove_pis=True)
+            self._local.parser = parser
+        return parser
+
+    def parse(self, html_content: str) -> lxml.html.HtmlElement:
+        """
+        Parse HTML content into an lxml document.
+
+        Args:
+            html_content: The HTML content to parse
+
+        Returns:
+            The root element of the parsed document
+        """
+        parser = self._get_lxml_parser()
+        if not html_content or not html_content.strip():
+            return lxml.html.document_fromstring("<html></html>", parser=parser)
+
+        try:
+            try:
+                return lxml.html.document_fromstring(html_content, parser=parser)
+            except ValueError:
+                # lxml refuses str input that carries an XML encoding declaration
+                return lxml.html.document_fromstring(html_content.encode('utf-8'), parser=parser)
+        except etree.ParserError:
+            # Nothing but comments or processing instructions
+            return lxml.html.document_fromstring("<html></html>", parser=parser)
+
+    def _get_text(self, element, strip: bool = True) -> str:
+        """
+        Get the text of an element the way BeautifulSoup's get_text(strip=True) does.
+
+        Args:
+            element: lxml element
+            strip: Whether to strip each text fragment (default: True)
+
+        Returns:
+            The text content of the element
+        """
+        if strip:
+            return "".join(part.strip() for part in element.itertext())
+        return "".join(element.itertext())
+
+    def _select(self, doc, selector: str) -> List[Any]:
+        """
+        Select elements with a CSS selector (requires the cssselect package).
+
+        Args:
+            doc: lxml document
+            selector: CSS selector
+
+        Returns:
+            The matching elements
+        """
+        return doc.cssselect(selector)
+
+    def extract_title_from_soup(self, doc) -> str:
+        """
+        Extract the document title from an already parsed document.
+
+        Args:
+            doc: The parsed lxml document
+
+        Returns:
+            The title text, or an empty string if there is none
+        """
+        titles = doc.xpath("//title")
+        return "".join(titles[0].itertext()) if titles else ''
+
+    def extract_text(self, html_content: str, selector: Optional[str] = None,
+                     strip: bool = True) -> str:
+        """
+        Extract text from HTML content, optionally using a CSS selector.
+
+        Args:
+            html_content: The HTML content to parse
+            selector: Optional CSS selector to target specific elements (default: None)
+            strip: Whether to strip whitespace from the text (default: True)
+
+        Returns:
+            The extracted text
+        """
+        return self.extract_text_from_soup(self.parse(html_content), selector, strip)
+
+    def extract_text_from_soup(self, doc, selector: Optional[str] = None,
+                               strip: bool = True) -> str:
+        """
+        Extract text from an already parsed document, optionally using a CSS selector.
+
+        Args:
+            doc: The parsed lxml document
+            selector: Optional CSS selector to target specific elements (default: None)
+            strip: Whether to strip whitespace from the text (default: True)
+
+        Returns:
+            The extracted text
+        """
+        if selector:
+            elements = self._select(doc, selector)
+            if not elements:
+                logger.warning(f"No elements found matching selector: {selector}")
+                return ""
+
+            text = " ".join("".join(element.xpath(_VISIBLE_TEXT_XPATH)) for element in elements)
+        else:
+            text = "".join(doc.xpath(_VISIBLE_TEXT_XPATH))
+
+        if strip:
+            # Replace multiple whitespaces with a single space
+            text = re.sub(r'\s+', ' ', text)
+            text = text.strip()
+
+        return text
+
+    def extract_links(self, html_content: str, base_url: Optional[str] = None,
+                      selector: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Extract links from HTML content, optionally using a CSS selector.
+
+        Args:
+            html_content: The HTML content to parse
+            base_url: Optional base URL to resolve relative links (default: None)
+            selector: Optional CSS selector to target specific elements (default: None)
+
+        Returns:
+            A list of dictionaries containing link information (href, text, title)
+        """
+        return self.extract_links_from_soup(self.parse(html_content), base_url, selector)
+
+    def extract_links_from_soup(self, doc, base_url: Optional[str] = None,
+                                selector: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Extract links from an already parsed document, optionally using a CSS selector.
+
+        Args:
+            doc: The parsed lxml document
+            base_url: Optional base URL to resolve relative links (default: None)
+            selector: Optional CSS selector to target specific elements (default: None)
+
+        Returns:
+            A list of dictionaries containing link information (href, text, title)
+        """
+        if selector:
+            links = []
+            for element in self._select(doc, selector):
+                links.extend(element.xpath(".//a[@href]"))
+        else:
+            links = doc.xpath("//a[@href]")
+
+        result = []
+        for link in links:
+            href = link.get('href', '').strip()
+
+            # Skip empty links or JavaScript links
+            if not href or href.startswith('javascript:'):
+                continue
+
+            # Resolve relative URLs if a base URL is provided
+            if base_url and not (href.startswith('http://') or href.startswith('https://')):
+                if href.startswith('/'):
+                    href = f"{base_url.rstrip('/')}{href}"
+                else:
+                    href = f"{base_url.rstrip('/')}/{href}"
+
+            result.append({
+                'href': href,
+                'text': self._get_text(link),
+                'title': link.get('title', '')
+            })
+
+        return result
+
+    def extract_links_streaming(self, html_content: Union[str, bytes],
+                                base_url: Optional[str] = None) -> Iterator[Dict[str, str]]:
+        """
+        Incrementally extract links from HTML content without building the full tree.
+
+        Args:
+            html_content: The HTML content to parse (str or UTF-8 bytes)
+            base_url: Optional base URL to resolve relative links (default: None)
+
+        Yields:
+            Dictionaries containing link information (href, text, title)
+        """
+        return self._fallback_parser.extract_links_streaming(html_content, base_url)
+
+    def extract_table(self, html_content: str, selector: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Extract tabular data from HTML tables.
+
+        Args:
+            html_content: The HTML content to parse
+            selector: Optional CSS selector to target specific table elements (default: None)
+
+        Returns:
+            A list of dictionaries where each dictionary represents a row with column names as keys
+        """
+        return self.extract_table_from_soup(self.parse(html_content), selector)
+
+    def extract_table_from_soup(self, doc, selector: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Extract tabular data from the tables of an already parsed document.
+
+        Args:
+            doc: The parsed lxml document
+            selector: Optional CSS selector to target specific table elements (default: None)
+
+        Returns:
+            A list of dictionaries where each dictionary represents a row with column names as keys
+        """
+        tables = self._select(doc, selector) if selector else doc.xpath("//table")
+
+        if not tables:
+            logger.warning("No tables found in the HTML content")
+            return []
+
+        # Use the first matching table
+        table = tables[0]
+
+        # Extract headers
+        headers = []
+        header_row = table.xpath(".//thead")
+        if header_row:
+            headers = [self._get_text(th) for th in header_row[0].xpath(".//th")]
+
+        # If no headers were found in thead, try the first row
+        if not headers:
+            first_row = table.xpath(".//tr")
+            if first_row:
+                th_elements = first_row[0].xpath(".//th")
+                if th_elements:
+                    headers = [self._get_text(th) for th in th_elements]
+                else:
+                    headers = [self._get_text(td) for td in first_row[0].xpath(".//td")]
+
+        # If still no headers, generate column numbers
+        if not headers:
+            max_columns = max((len(row.xpath(".//td|.//th")) for row in table.xpath(".//tr")), default=0)
+            headers = [f"Column_{i+1}" for i in range(max_columns)]
+
+        # Extract rows, skipping header rows
+        result = []
+        for row in table.xpath(".//tr[not(ancestor::thead)]"):
+            cells = row.xpath(".//td|.//th")
+            if cells:  # Ensure the row has cells
+                row_data = {}
+                for i, cell in enumerate(cells):
+                    if i < len(headers):
+                        row_data[headers[i]] = self._get_text(cell)
+                    else:
+                        # If more cells than headers, add with generated column names
+                        row_data[f"Column_{i+1}"] = self._get_text(cell)
+
+                result.append(row_data)
+
+        return result
+
+    def extract_metadata(self, html_content: str) -> Dict[str, str]:
+        """
+        Extract metadata from HTML content (meta tags, title, etc.).
+
+        Args:
+            html_content: The HTML content to parse
+
+        Returns:
+            A dictionary of metadata key-value pairs
+        """
+        return self.extract_metadata_from_soup(self.parse(html_content))
+
+    def extract_metadata_from_soup(self, doc) -> Dict[str, str]:
+        """
+        Extract metadata (meta tags, title, etc.) from an already parsed document.
+
+        Args:
+            doc: The parsed lxml document
+
+        Returns:
+            A dictionary of metadata key-value pairs
+        """
+        metadata = {}
+
+        # Extract title
+        titles = doc.xpath("//title")
+        if titles:
+            metadata['title'] = self._get_text(titles[0])
+
+        # Extract meta tags
+        for meta in doc.xpath("//meta[@content]"):
+            content = meta.get('content')
+            if not content:
+                continue
+
+            # Handle different meta tag formats
+            if meta.get('name'):
+                metadata[meta.get('name')] = content
+            elif meta.get('property'):
+                metadata[meta.get('property')] = content
+            elif meta.get('http-equiv'):
+                metadata[f"http-equiv:{meta.get('http-equiv')}"] = content
+
+        return metadata
+
+    def extract_all_data(self, html_content: str) -> Dict[str, Any]:
+        """
+        Extract comprehensive data from all potentially valuable tags in the HTML.
+
+        Args:
+            html_content: The HTML content to parse
+
+        Returns:
+            A dictionary containing all extracted data categorized by tag types
+        """
+        return self._fallback_parser.extract_all_data(html_content)
+
+    def extract_all_data_from_soup(self, doc) -> Dict[str, Any]:
+        """
+        Extract comprehensive data from an already parsed document.
+
+        The comprehensive extraction depends on BeautifulSoup features (element
+        paths, attribute dictionaries), so it is delegated to HTMLParser.
+
+        Args:
+            doc: The parsed lxml document
+
+        Returns:
+            A dictionary containing all extracted data categorized by tag types
+        """
+        html_content = lxml.html.tostring(doc, encoding='unicode')
+        return self._fallback_parser.extract_all_data(html_content)
@@ -1,6 +1,8 @@
 import logging
-from typing import Optional, Dict, Any, List, Union, Callable
-from bs4 import BeautifulSoup
+from io import BytesIO
+from typing import Optional, Dict, Any, List, Union, Callable, Iterator
+from bs4 import BeautifulSoup, FeatureNotFound
+from lxml import etree
 import re
 import json
 
@@ -11,12 +13,12 @@ class HTMLParser:
     """
     Parser for extracting content from HTML pages using BeautifulSoup.
     """
-    def __init__(self, parser: str = "html.parser"):
+    def __init__(self, parser: str = "lxml"):
         """
         Initialize the HTMLParser.
         
         Args:
-            parser: The parser to use with BeautifulSoup (default: "html.parser")
+            parser: The parser to use with BeautifulSoup (default: "lxml")
                    Options include "html.parser", "lxml", "html5lib"
         """
         self.parser = parser
@@ -25,13 +27,37 @@ class HTMLParser:
         """
         Parse HTML content into a BeautifulSoup object.
         
+        Falls back to the built-in "html.parser" if the configured parser is
+        not installed or cannot handle the content.
+        
         Args:
             html_content: The HTML content to parse
             
         Returns:
             A BeautifulSoup object
         """
-        return BeautifulSoup(html_content, self.parser)
+        if self.parser != "html.parser":
+            try:
+                return BeautifulSoup(html_content, self.parser)
+            except FeatureNotFound:
+                logger.warning(f"Parser '{self.parser}' is not available, falling back to html.parser")
+                self.parser = "html.parser"
+            except Exception as e:
+                logger.debug(f"Parser '{self.parser}' failed ({str(e)}), falling back to html.parser")
+                
+        return BeautifulSoup(html_content, "html.parser")
+        
+    def extract_title_from_soup(self, soup: BeautifulSoup) -> str:
+        """
+        Extract the document title from an already parsed document.
+        
+        Args:
+            soup: The parsed BeautifulSoup document
+            
+        Returns:
+            The title text, or an empty string if there is none
+        """
+        return soup.title.get_text() if soup.title else ''
         
     def extract_text(self, html_content: str, selector: Optional[str] = None, 
                       strip: bool = True) -> str:
@@ -46,8 +72,21 @@ class HTMLParser:
         Returns:
             The extracted text
         """
-        soup = self.parse(html_content)
+        return self.extract_text_from_soup(self.parse(html_content), selector, strip)
         
+    def extract_text_from_soup(self, soup: BeautifulSoup, selector: Optional[str] = None,
+                               strip: bool = True) -> str:
+        """
+        Extract text from an already parsed document, optionally using a CSS selector.
+        
+        Args:
+            soup: The parsed BeautifulSoup document
+            selector: Optional CSS selector to target specific elements (default: None)
+            strip: Whether to strip whitespace from the text (default: True)
+            
+        Returns:
+            The extracted text
+        """
         if selector:
             elements = soup.select(selector)
             if not elements:
@@ -78,8 +117,21 @@ class HTMLParser:
         Returns:
             A list of dictionaries containing link information (href, text, title)
         """
-        soup = self.parse(html_content)
+        return self.extract_links_from_soup(self.parse(html_content), base_url, selector)
         
+    def extract_links_from_soup(self, soup: BeautifulSoup, base_url: Optional[str] = None,
+                                selector: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Extract links from an already parsed document, optionally using a CSS selector.
+        
+        Args:
+            soup: The parsed BeautifulSoup document
+            base_url: Optional base URL to resolve relative links (default: None)
+            selector: Optional CSS selector to target specific elements (default: None)
+            
+        Returns:
+            A list of dictionaries containing link information (href, text, title)
+        """
         if selector:
             elements = soup.select(selector)
             # Extract all <a> elements within the selected elements
@@ -97,21 +149,68 @@ class HTMLParser:
             if not href or href.startswith('javascript:'):
                 continue
                 
-            # Resolve relative URLs if a base URL is provided
-            if base_url and href and not (href.startswith('http://') or href.startswith('https://')):
-                if href.startswith('/'):
-                    href = f"{base_url.rstrip('/')}{href}"
-                else:
-                    href = f"{base_url.rstrip('/')}/{href}"
-                    
             result.append({
-                'href': href,
+                'href': self._resolve_href(href, base_url),
                 'text': link.get_text(strip=True),
                 'title': link.get('title', '')
             })
             
         return result
         
+    def extract_links_streaming(self, html_content: Union[str, bytes],
+                                base_url: Optional[str] = None) -> Iterator[Dict[str, str]]:
+        """
+        Incrementally extract links from HTML content without building the full tree.
+        
+        Uses lxml's iterparse and discards each link (and the siblings before it)
+        once it has been read, so memory stays flat on very large pages.
+        
+        Args:
+            html_content: The HTML content to parse (str or UTF-8 bytes)
+            base_url: Optional base URL to resolve relative links (default: None)
+            
+        Yields:
+            Dictionaries containing link information (href, text, title)
+        """
+        if isinstance(html_content, str):
+            html_content = html_content.encode('utf-8')
+        if not html_content.strip():
+            return
+            
+        for _, link in etree.iterparse(BytesIO(html_content), events=('end',), tag='a',
+                                       html=True, encoding='utf-8'):
+            href = (link.get('href') or '').strip()
+            
+            # Skip empty links or JavaScript links
+            if href and not href.startswith('javascript:'):
+                yield {
+                    'href': self._resolve_href(href, base_url),
+                    'text': "".join(part.strip() for part in link.itertext()),
+                    'title': link.get('title', '')
+                }
+                
+            # Free the element and everything parsed before it
+            link.clear(keep_tail=True)
+            while link.getprevious() is not None:
+                del link.getparent()[0]
+                
+    def _resolve_href(self, href: str, base_url: Optional[str] = None) -> str:
+        """
+        Resolve a relative link against the base URL.
+        
+        Args:
+            href: The link target
+            base_url: Optional base URL to resolve relative links (default: None)
+            
+        Returns:
+            The resolved link, or the original one if no base URL is given
+        """
+        if base_url and not (href.startswith('http://') or href.startswith('https://')):
+            if href.startswith('/'):
+                return f"{base_url.rstrip('/')}{href}"
+            return f"{base_url.rstrip('/')}/{href}"
+        return href
+        
     def extract_table(self, html_content: str, selector: Optional[str] = None) -> List[Dict[str, str]]:
         """
         Extract tabular data from HTML tables.
@@ -123,8 +222,20 @@ class HTMLParser:
         Returns:
             A list of dictionaries where each dictionary represents a row with column names as keys
         """
-        soup = self.parse(html_content)
+        return self.extract_table_from_soup(self.parse(html_content), selector)
+        
+    def extract_table_from_soup(self, soup: BeautifulSoup,
+                                selector: Optional[str] = None) -> List[Dict[str, str]]:
+        """
+        Extract tabular data from the tables of an already parsed document.
         
+        Args:
+            soup: The parsed BeautifulSoup document
+            selector: Optional CSS selector to target specific table elements (default: None)
+            
+        Returns:
+            A list of dictionaries where each dictionary represents a row with column names as keys
+        """
         if selector:
             tables = soup.select(selector)
         else:
@@ -197,7 +308,18 @@ class HTMLParser:
         Returns:
             A dictionary of metadata key-value pairs
         """
-        soup = self.parse(html_content)
+        return self.extract_metadata_from_soup(self.parse(html_content))
+        
+    def extract_metadata_from_soup(self, soup: BeautifulSoup) -> Dict[str, str]:
+        """
+        Extract metadata (meta tags, title, etc.) from an already parsed document.
+        
+        Args:
+            soup: The parsed BeautifulSoup document
+            
+        Returns:
+            A dictionary of metadata key-value pairs
+        """
         metadata = {}
         
         # Extract title
@@ -286,9 +408,20 @@ class HTMLParser:
         Returns:
             A dictionary containing all extracted data categorized by tag types
         """
-        soup = self.parse(html_content)
+        return self.extract_all_data_from_soup(self.parse(html_content))
+        
+    def extract_all_data_from_soup(self, soup: BeautifulSoup) -> Dict[str, Any]:
+        """
+        Extract comprehensive data from an already parsed document.
+        
+        Args:
+            soup: The parsed BeautifulSoup document
+            
+        Returns:
+            A dictionary containing all extracted data categorized by tag types
+        """
         result = {
-            'metadata': self.extract_metadata(html_content),
+            'metadata': self.extract_metadata_from_soup(soup),
             'headings': [],
             'paragraphs': [],
             'lists': [],
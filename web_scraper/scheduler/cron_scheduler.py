@@ -1,8 +1,9 @@
 import logging
 import os
 import sys
+import shlex
 import subprocess
-from typing import Optional, List, Dict, Any
+from typing import Optional, List, Dict, Any, Union
 import platform
 
 logger = logging.getLogger(__name__)
@@ -227,7 +228,7 @@ class CronScheduler:
             logger.error(f"Error listing cron jobs: {str(e)}")
             return []
             
-    def create_scraper_job(self, cron_expression: str, script_path: str, 
+    def create_scraper_job(self, cron_expression: str, script_path: Union[str, List[str]], 
                           python_executable: Optional[str] = None,
                           job_name: Optional[str] = None) -> bool:
         """
@@ -235,7 +236,8 @@ class CronScheduler:
         
         Args:
             cron_expression: The cron expression for scheduling
-            script_path: Path to the Python scraper script
+            script_path: Path to the Python scraper script, or the complete command
+                         as an argument list (executable first), which is used as is
             python_executable: Optional path to the Python executable (default: sys.executable)
             job_name: Optional name for the job (default: None)
             
@@ -246,14 +248,21 @@ class CronScheduler:
             logger.warning("Cron jobs are not supported on Windows. Consider using Windows Task Scheduler.")
             return False
             
-        # Use the current Python executable if not specified
-        python_executable = python_executable or sys.executable
-        
-        # Construct the command
-        command = f"{python_executable} {script_path}"
+        if isinstance(script_path, (list, tuple)):
+            # Quote each argument for the shell cron runs the line with;
+            # '%' has a special meaning in crontab entries and must be escaped
+            command = shlex.join(script_path).replace('%', '\\%')
+            script_name = os.path.basename(script_path[1] if len(script_path) > 1 else script_path[0])
+        else:
+            # Use the current Python executable if not specified
+            python_executable = python_executable or sys.executable
+            
+            # Construct the command
+            command = f"{python_executable} {script_path}"
+            script_name = os.path.basename(script_path)
         
         # Add comment for the job
-        comment = job_name or f"Scraper job for {os.path.basename(script_path)}"
+        comment = job_name or f"Scraper job for {script_name}"
         
         # Add the cron job
         return self.add_cron_job(cron_expression, command, comment)
@@ -1,6 +1,7 @@
 import logging
 import concurrent.futures
-from typing import List, Dict, Any, Callable, Optional
+import itertools
+from typing import List, Dict, Any, Callable, Optional, Iterable, Iterator
 import time
 
 logger = logging.getLogger(__name__)
@@ -21,63 +22,114 @@ class ParallelProcessor:
         self.max_workers = max_workers
         self.timeout = timeout
         
-    def read_urls_from_file(self, file_path: str) -> List[str]:
+    def iter_urls_from_file(self, file_path: str) -> Iterator[str]:
         """
-        Read URLs from a file, one URL per line.
+        Lazily read URLs from a file, one URL per line.
+        
+        URLs are yielded as the file is read, so processing can start before
+        the whole file has been loaded and memory use does not grow with it.
         
         Args:
             file_path: Path to the file containing URLs
             
-        Returns:
-            List of URLs
+        Yields:
+            URLs with surrounding whitespace stripped
         """
+        count = 0
         try:
             with open(file_path, 'r', encoding='utf-8') as f:
-                # Read lines and strip whitespace
-                urls = [line.strip() for line in f if line.strip()]
-                
-            logger.info(f"Read {len(urls)} URLs from {file_path}")
-            return urls
+                for line in f:
+                    url = line.strip()
+                    if url:
+                        count += 1
+                        yield url
+                        
+            logger.info(f"Read {count} URLs from {file_path}")
         except Exception as e:
             logger.error(f"Error reading URLs from file {file_path}: {str(e)}")
-            return []
+            
+    def read_urls_from_file(self, file_path: str) -> List[str]:
+        """
+        Read URLs from a file, one URL per line.
+        
+        Args:
+            file_path: Path to the file containing URLs
+            
+        Returns:
+            List of URLs
+        """
+        return list(self.iter_urls_from_file(file_path))
     
-    def process_urls(self, urls: List[str], scrape_func: Callable[[str], Dict[str, Any]],
-                     delay_between_batches: float = 1.0) -> List[Dict[str, Any]]:
+    def process_urls(self, urls: Iterable[str], scrape_func: Callable[[str], Dict[str, Any]],
+                     delay_between_batches: float = 1.0,
+                     on_result: Optional[Callable[[Dict[str, Any]], None]] = None) -> List[Dict[str, Any]]:
         """
         Process URLs in parallel using ThreadPoolExecutor.
         
+        URLs are submitted as they are consumed from the iterable, keeping at
+        most twice max_workers tasks in flight.
+        
         Args:
-            urls: List of URLs to process
+            urls: List or other iterable (e.g. a generator) of URLs to process
             scrape_func: Function that takes a URL and returns scraped data
             delay_between_batches: Time to wait between batches (default: 1.0)
+            on_result: Optional callback that receives each result as it completes;
+                       when given, results are not collected (default: None)
             
         Returns:
-            List of results from processing the URLs
+            List of results from processing the URLs (empty if on_result is given)
         """
         results = []
-        total_urls = len(urls)
+        succeeded = 0
+        url_iter = iter(urls)
+        completed = 0
         
-        logger.info(f"Starting parallel processing of {total_urls} URLs with {self.max_workers} workers")
+        logger.info(f"Starting parallel processing with {self.max_workers} workers")
         
         with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_workers) as executor:
-            # Submit all tasks
-            future_to_url = {executor.submit(scrape_func, url): url for url in urls}
+            # Submit the first window of tasks
+            future_to_url = {
+                executor.submit(scrape_func, url): url
+                for url in itertools.islice(url_iter, self.max_workers * 2)
+            }
             
-            # Process completed tasks as they complete
-            for i, future in enumerate(concurrent.futures.as_completed(future_to_url), 1):
-                url = future_to_url[future]
-                try:
-                    result = future.result(timeout=self.timeout)
-                    results.append(result)
-                    logger.info(f"Completed {i}/{total_urls}: {url}")
-                except Exception as e:
-                    logger.error(f"Error processing URL {url}: {str(e)}")
+            # Process tasks as they complete and top up the window from the iterable
+            while future_to_url:
+                done, _ = concurrent.futures.wait(
+                    future_to_url, return_when=concurrent.futures.FIRST_COMPLETED
+                )
                 
-                # Add delay between batches to avoid overwhelming servers
-                if i % self.max_workers == 0 and i < total_urls:
-                    logger.debug(f"Completed batch of {self.max_workers}, sleeping for {delay_between_batches}s")
-                    time.sleep(delay_between_batches)
+                for future in done:
+                    url = future_to_url.pop(future)
+                    completed += 1
+                    try:
+                        # The future is done, so this does not block
+                        result = future.result()
+                    except Exception as e:
+                        logger.error("Error processing URL %s: %s", url, e)
+                    else:
+                        try:
+                            if on_result is not None:
+                                on_result(result)
+                            else:
+                                results.append(result)
+                        except BaseException:
+                            # A failing callback (e.g. the result writer) is not a bad
+                            # URL: cancel the queued tasks and fail the run instead of
+                            # finishing with partial output
+                            for pending in future_to_url:
+                                pending.cancel()
+                            raise
+                        succeeded += 1
+                        logger.debug("Completed %d: %s", completed, url)
+                        
+                    for next_url in itertools.islice(url_iter, 1):
+                        future_to_url[executor.submit(scrape_func, next_url)] = next_url
+                    
+                    # Add delay between batches to avoid overwhelming servers
+                    if completed % self.max_workers == 0 and future_to_url:
+                        logger.debug(f"Completed batch of {self.max_workers}, sleeping for {delay_between_batches}s")
+                        time.sleep(delay_between_batches)
         
-        logger.info(f"Parallel processing completed. Processed {len(results)} URLs successfully")
+        logger.info(f"Parallel processing completed. Processed {succeeded} URLs successfully")
         return results 
\ No newline at end of file
@@ -0,0 +1,45 @@
+from urllib.parse import urlparse
+from typing import Tuple
+
+
+def split_origin(url: str) -> Tuple[str, str]:
+    """
+    Split the scheme and domain (host and port, lower-cased) off a URL.
+    
+    Absolute URLs are split with str.partition instead of a full urlparse(),
+    since this runs on every request.
+    
+    Args:
+        url: The URL to split
+        
+    Returns:
+        A tuple of (scheme, domain)
+    """
+    scheme, sep, rest = url.partition('://')
+    if not sep:
+        parsed_url = urlparse(url)
+        return parsed_url.scheme.lower(), parsed_url.netloc.lower()
+        
+    # The authority ends at the first '/', '?' or '#'
+    end = len(rest)
+    for delimiter in '/?#':
+        index = rest.find(delimiter, 0, end)
+        if index != -1:
+            end = index
+    netloc = rest[:end]
+    
+    # Drop any user:password@ prefix
+    return scheme.lower(), netloc[netloc.rfind('@') + 1:].lower()
+
+
+def get_domain(url: str) -> str:
+    """
+    Extract the domain (host and port, lower-cased) from a URL.
+    
+    Args:
+        url: The URL to extract the domain from
+        
+    Returns:
+        The domain part of the URL
+    """
+    return split_origin(url)[1]
@@ -71,18 +71,20 @@ class UserAgentRotator:
         
         return random.choice(self.user_agents)
     
-    def get_headers(self, additional_headers: Optional[dict] = None) -> dict:
+    def get_headers(self, additional_headers: Optional[dict] = None,
+                    user_agent: Optional[str] = None) -> dict:
         """
         Get a headers dictionary with a random user agent and any additional headers.
         
         Args:
             additional_headers: Additional headers to include (default: None)
+            user_agent: User agent to use instead of picking a random one (default: None)
             
         Returns:
             A dictionary of HTTP headers
         """
         headers = {
-            'User-Agent': self.get_random_user_agent(),
+            'User-Agent': user_agent or self.get_random_user_agent(),
             'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,image/webp,*/*;q=0.8',
             'Accept-Language': 'en-US,en;q=0.5',
             'Connection': 'keep-alive',